@@ -169,23 +169,19 @@ class Level:
             trunkWidth = int(tree.rect.width * 0.2)
             trunkHeight = int(tree.rect.height * 0.25)
             
-            hitboxSurf = pygame.Surface((trunkWidth, trunkHeight))
-            hitboxSurf.set_alpha(0)
-            
-            hitboxSprite = Generic(
-                (tree.rect.centerx - trunkWidth // 2, tree.rect.bottom - trunkHeight),
-                hitboxSurf,
+            hitboxRect = pygame.Rect(tree.rect.centerx - trunkWidth // 2, tree.rect.bottom - trunkHeight, trunkWidth, trunkHeight)
+            hitboxSprite = Collider(
+                hitboxRect,
                 [self.collisionSprites],
-                z=LAYERS['main']
+                hitbox=hitboxRect.inflate(-trunkWidth * 0.2, -trunkHeight * 0.75)
             )
             
             tree.hitboxSprite = hitboxSprite
 
         for obj in self.tmxData.get_layer_by_name("rock"):
             Generic((obj.x * ZOOM_X, obj.y * ZOOM_Y), obj.image, [self.allSprites])
-            rockHitbox = pygame.Surface((int(16 * ZOOM_X), int(16 * ZOOM_Y)))
-            rockHitbox.set_alpha(0)
-            Generic((obj.x * ZOOM_X, obj.y * ZOOM_Y), rockHitbox, [self.collisionSprites])
+            rockRect = pygame.Rect(obj.x * ZOOM_X, obj.y * ZOOM_Y, int(16 * ZOOM_X), int(16 * ZOOM_Y))
+            Collider(rockRect, [self.collisionSprites], hitbox=rockRect.inflate(-rockRect.width * 0.2, -rockRect.height * 0.75))
 
     def run(self, deltaTime):
         self.allSprites.update(deltaTime)
@@ -218,6 +214,11 @@ class CameraGroup(pygame.sprite.Group):
         self.offset = pygame.math.Vector2(0, 0)
         self.displaySurface = pygame.display.get_surface()
 
+    def add_internal(self, sprite, *args): #colliders have nothing to draw
+        if isinstance(sprite, Collider):
+            raise TypeError("Collider sprites have no image and cannot join the render group")
+        super().add_internal(sprite, *args)
+
     def customisedDraw(self, player):
         self.offset.x = player.rect.centerx - SCREEN_WIDTH / 2
         self.offset.y = player.rect.centery - SCREEN_HEIGHT / 2
@@ -15,6 +15,12 @@ class Generic(pygame.sprite.Sprite):
         self.z = z
         self.hitbox = self.rect.copy().inflate(-self.rect.width * 0.2, -self.rect.height * 0.75)
 
+class Collider(pygame.sprite.Sprite): #invisible collision-only sprite, no image or pixel memory
+    def __init__(self, rect, groups, hitbox=None):
+        super().__init__(groups) #collision groups only, the camera group refuses colliders
+        self.rect = pygame.Rect(rect) #area covered
+        self.hitbox = self.rect.copy() if hitbox is None else pygame.Rect(hitbox) #area the player collides with
+
 class Wildflower(Generic):
     def __init__(self, pos, surf, groups):
         super().__init__(pos, surf, groups)
@@ -0,0 +1,119 @@
+#texture atlas: packs small images into a few sheets at build time and hands out subsurfaces at runtime
+#rebuild after changing any packed art, run from gameData: python atlas.py
+import os
+import json
+import pygame
+from settings import ATLAS_DIR, ATLAS_SHEETS, ATLAS_MAX_WIDTH, ATLAS_PADDING
+from loader import normalisePath, defaultLoader
+
+IMAGE_EXTENSIONS = ('.png', '.jpg', '.jpeg')
+
+# build time
+
+def collectImages(folders): #every image under the folders, keyed by normalised path
+    paths = []
+    for folder in folders:
+        for root, _, files in os.walk(folder):
+            for name in sorted(files):
+                if name.lower().endswith(IMAGE_EXTENSIONS):
+                    paths.append(normalisePath(os.path.join(root, name)))
+    return paths
+
+def packShelves(sizes, maxWidth=ATLAS_MAX_WIDTH, padding=ATLAS_PADDING): #shelf packing, tallest first, returns positions and sheet size
+    order = sorted(range(len(sizes)), key=lambda i: (-sizes[i][1], -sizes[i][0]))
+    positions = [None] * len(sizes)
+    x = y = shelfHeight = sheetWidth = 0
+    for i in order:
+        width, height = sizes[i][0] + padding * 2, sizes[i][1] + padding * 2
+        if x + width > maxWidth and x > 0: #start a new shelf under the current one
+            y += shelfHeight
+            x = shelfHeight = 0
+        positions[i] = (x + padding, y + padding)
+        x += width
+        shelfHeight = max(shelfHeight, height)
+        sheetWidth = max(sheetWidth, x)
+    return positions, (sheetWidth, y + shelfHeight)
+
+def buildSheet(name, folders, directory=ATLAS_DIR):
+    paths = collectImages(folders)
+    images = [pygame.image.load(path) for path in paths]
+    positions, size = packShelves([image.get_size() for image in images])
+
+    sheet = pygame.Surface(size, pygame.SRCALPHA)
+    sheet.fill((0, 0, 0, 0))
+    frames = {}
+    for path, image, pos in zip(paths, images, positions):
+        if image.get_flags() & pygame.SRCALPHA:
+            sheet.blit(image, pos, special_flags=pygame.BLEND_RGBA_MAX) #copies pixels exactly, a normal blit would darken soft edges
+        else:
+            sheet.blit(image, pos) #opaque or colour-keyed
+        frames[path] = [pos[0], pos[1], image.get_width(), image.get_height()]
+
+    pygame.image.save(sheet, os.path.join(directory, f"{name}.png"))
+    with open(os.path.join(directory, f"{name}.json"), 'w') as f:
+        json.dump({'image': f"{name}.png", 'frames': frames}, f, indent=1, sort_keys=True)
+    return len(frames), size
+
+def buildAtlas(directory=ATLAS_DIR):
+    os.makedirs(directory, exist_ok=True)
+    for name, folders in ATLAS_SHEETS.items():
+        count, size = buildSheet(name, folders, directory)
+        print(f"{name}: {count} images in {size[0]}x{size[1]}")
+
+# runtime
+
+class Atlas:
+    def __init__(self, directory=ATLAS_DIR):
+        self.directory = directory
+        self.frames = None #path -> (sheet name, rect), read on first use
+        self.folders = {} #folder -> its packed paths, in file name order
+        self.sheets = {} #sheet name -> converted sheet surface, loaded on first use
+        self.images = {} #path -> subsurface, so every caller shares one
+
+    def loadIndex(self):
+        self.frames = {}
+        if not os.path.isdir(self.directory):
+            return #no atlas built, every lookup misses and callers load files themselves
+        for fileName in sorted(os.listdir(self.directory)):
+            if fileName.endswith('.json'):
+                with open(os.path.join(self.directory, fileName)) as f:
+                    index = json.load(f)
+                sheetName = os.path.splitext(index['image'])[0]
+                for path, rect in index['frames'].items():
+                    self.frames[path] = (sheetName, pygame.Rect(rect))
+        for path in sorted(self.frames):
+            self.folders.setdefault(path.rsplit('/', 1)[0], []).append(path)
+
+    def getSheet(self, name):
+        sheet = self.sheets.get(name)
+        if sheet is None:
+            sheet = defaultLoader.get(f"{self.directory}/{name}.png") #usually already decoded behind the menu
+            self.sheets[name] = sheet
+        return sheet
+
+    def getImage(self, path): #subsurface for a packed image, None if it isn't in the atlas
+        if self.frames is None:
+            self.loadIndex()
+        key = normalisePath(path)
+        image = self.images.get(key)
+        if image is None:
+            entry = self.frames.get(key)
+            if entry is None:
+                return None
+            sheetName, rect = entry
+            image = self.getSheet(sheetName).subsurface(rect)
+            self.images[key] = image
+        return image
+
+    def getFolder(self, path): #subsurfaces for every packed image directly in a folder, None if none are packed
+        if self.frames is None:
+            self.loadIndex()
+        paths = self.folders.get(normalisePath(path))
+        if not paths:
+            return None
+        return [self.getImage(imagePath) for imagePath in paths]
+
+defaultAtlas = Atlas()
+
+if __name__ == '__main__':
+    buildAtlas()
@@ -0,0 +1,173 @@
+#offline measurements, run from gameData: python benchmarks.py <command>
+import os
+import sys
+import csv
+import gc
+import time
+import argparse
+import timeit
+import tracemalloc
+
+os.environ.setdefault('SDL_VIDEODRIVER', 'dummy') #no window needed
+os.environ.setdefault('SDL_AUDIODRIVER', 'dummy')
+
+import pygame
+from settings import *
+
+def stressPositions(count, spacing=TILE_SIZE): #entities laid out on a square grid, like a crowded farm
+    columns = max(1, int(count ** 0.5))
+    return [((i % columns) * spacing, (i // columns) * spacing) for i in range(count)]
+
+def entityFactories(): #name -> function building one entity at pos, with shared surfaces like the game uses
+    from sprites import Generic, Rock, SoilTile, Crop, Tree, Stump, Wood, Stone, Particle
+    tileSurf = pygame.Surface((TILE_SIZE, TILE_SIZE), pygame.SRCALPHA)
+    treeSurf = pygame.Surface((TILE_SIZE * 2, TILE_SIZE * 3), pygame.SRCALPHA)
+    return {
+        'Generic': lambda pos: Generic(pos, tileSurf, []),
+        'Rock': lambda pos: Rock(pos, tileSurf, []),
+        'SoilTile': lambda pos: SoilTile(pos, [], tileSurf, tileSurf),
+        'Crop': lambda pos: Crop(pos, 'corn', []),
+        'Tree': lambda pos: Tree(pos, treeSurf, [], 'tree', False),
+        'Stump': lambda pos: Stump(pos, tileSurf, []),
+        'Wood': lambda pos: Wood(pos, tileSurf, []),
+        'Stone': lambda pos: Stone(pos, tileSurf, []),
+        'Particle': lambda pos: Particle(pos, tileSurf, [], (0, 0))
+    }
+
+def measureEntity(factory, count):
+    positions = stressPositions(count)
+    factory(positions[0]) #first build may load and cache shared images, keep that out of the numbers
+
+    tracemalloc.start()
+    before = tracemalloc.take_snapshot()
+    entities = [factory(pos) for pos in positions]
+    after = tracemalloc.take_snapshot()
+    tracemalloc.stop()
+    allocated = sum(stat.size_diff for stat in after.compare_to(before, 'filename'))
+    bytesPerEntity = (allocated - sys.getsizeof(entities)) / count #the list holding them is not the entity's cost
+
+    # the reads every frame does: sort key, blit rect, and a component check
+    access = timeit.timeit("for e in entities: e.z; e.rect; 'pickup' in e.components", globals={'entities': entities}, number=20)
+    nsPerAccess = access / (20 * count * 3) * 1e9
+    return bytesPerEntity, nsPerAccess
+
+def entitiesCommand(args):
+    pygame.init()
+    pygame.display.set_mode((1, 1))
+    print(f"{'entity':<10}{'bytes/entity':>14}{'ns/attribute':>14}")
+    for name, factory in entityFactories().items():
+        bytesPerEntity, nsPerAccess = measureEntity(factory, args.count)
+        print(f"{name:<10}{bytesPerEntity:>14.0f}{nsPerAccess:>14.1f}")
+
+def measureScene(tmxData, counts, frames): #frame times and memory of one populated level
+    from level import Level
+    from stressScene import populate
+    from telemetry import percentile
+    from profiler import liveSurfaceBytes
+
+    from eventLog import eventLog
+    eventLog.flush() #logged exceptions hold their traceback, and so the previous scene's level
+    gc.collect() #which is cyclic garbage, its surfaces would count towards this one
+    level = Level(tmxData)
+    tracemalloc.start()
+    added = populate(level, **counts)
+    entityBytes = tracemalloc.get_traced_memory()[0] #Python memory the added entities hold, frames run untraced
+    tracemalloc.stop()
+
+    updateTimes, drawTimes, frameTimes = [], [], []
+    for _ in range(frames):
+        start = time.perf_counter()
+        level.update(SIM_STEP)
+        drawStart = time.perf_counter()
+        level.draw()
+        end = time.perf_counter()
+        updateTimes.append((drawStart - start) * 1000)
+        drawTimes.append((end - drawStart) * 1000)
+        frameTimes.append((end - start) * 1000)
+    frameTimes.sort()
+    return {
+        'entities': sum(added.values()),
+        **added,
+        'allSprites': len(level.allSprites),
+        'frameMean': sum(frameTimes) / frames,
+        'frameP50': percentile(frameTimes, 50),
+        'frameP95': percentile(frameTimes, 95),
+        'frameP99': percentile(frameTimes, 99),
+        'updateMean': sum(updateTimes) / frames,
+        'drawMean': sum(drawTimes) / frames,
+        'entityMB': entityBytes / 1048576,
+        'surfaceMB': liveSurfaceBytes() / 1048576
+    }
+
+def plotScaling(rows, path): #frame time and memory against entity count, matplotlib is optional
+    try:
+        import matplotlib
+        matplotlib.use('Agg')
+        import matplotlib.pyplot as plt
+    except ImportError:
+        print("matplotlib is not installed, skipping the plot")
+        return None
+    entities = [row['entities'] for row in rows]
+    figure, (timeAxis, memoryAxis) = plt.subplots(1, 2, figsize=(11, 4))
+    for key in ('frameP50', 'frameP95', 'updateMean', 'drawMean'):
+        timeAxis.plot(entities, [row[key] for row in rows], marker='o', label=key)
+    timeAxis.axhline(1000 / 60, color='grey', linestyle='--', label='60 fps')
+    timeAxis.set(xlabel='entities added', ylabel='ms', title='Frame time')
+    timeAxis.legend()
+    for key in ('entityMB', 'surfaceMB'):
+        memoryAxis.plot(entities, [row[key] for row in rows], marker='o', label=key)
+    memoryAxis.set(xlabel='entities added', ylabel='MB', title='Memory')
+    memoryAxis.legend()
+    figure.tight_layout()
+    figure.savefig(path)
+    return path
+
+def scalingCommand(args):
+    from stressScene import tiledMap, mixedCounts
+    from eventLog import eventLog
+    eventLog.setLevel('warning') #thousands of crops each report their growth otherwise
+    pygame.init()
+    pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT)) #the level draws to the display surface
+
+    rows = []
+    print(f"{'entities':>9}{'sprites':>9}{'p50 ms':>9}{'p95 ms':>9}{'update':>9}{'draw':>9}{'entity MB':>11}{'surface MB':>12}")
+    for total in args.counts:
+        tmxData = tiledMap(args.repeat, args.repeat) #a fresh map per level, tiledMap edits the layers
+        row = measureScene(tmxData, mixedCounts(total), args.frames)
+        rows.append(row)
+        print(f"{row['entities']:>9}{row['allSprites']:>9}{row['frameP50']:>9.2f}{row['frameP95']:>9.2f}{row['updateMean']:>9.2f}"
+              f"{row['drawMean']:>9.2f}{row['entityMB']:>11.2f}{row['surfaceMB']:>12.1f}")
+
+    os.makedirs(os.path.dirname(args.csv) or '.', exist_ok=True)
+    with open(args.csv, 'w', newline='') as f:
+        writer = csv.DictWriter(f, fieldnames=list(rows[0]))
+        writer.writeheader()
+        for row in rows:
+            writer.writerow({key: f"{value:.4f}" if isinstance(value, float) else value for key, value in row.items()})
+    print("CSV written to", args.csv)
+    if args.plot:
+        path = plotScaling(rows, os.path.splitext(args.csv)[0] + '.png')
+        if path:
+            print("Plot written to", path)
+
+def main():
+    parser = argparse.ArgumentParser(description="Witherford benchmarks")
+    commands = parser.add_subparsers(dest='command', required=True)
+
+    entities = commands.add_parser('entities', help="bytes per entity and attribute access time")
+    entities.add_argument('--count', type=int, default=5000, help="entities of each kind to build")
+    entities.set_defaults(run=entitiesCommand)
+
+    scaling = commands.add_parser('scaling', help="frame time and memory of stress scenes against entity count")
+    scaling.add_argument('--counts', type=int, nargs='+', default=[0, 1000, 2000, 4000, 8000, 16000], help="entities added per scene, split by stressScene.SCENE_MIX")
+    scaling.add_argument('--repeat', type=int, default=1, help="myfarm.tmx repeated this many times across and down")
+    scaling.add_argument('--frames', type=int, default=120, help="frames timed per scene")
+    scaling.add_argument('--csv', default=f"{PROFILE_DIR}/scaling.csv", help="where the results go")
+    scaling.add_argument('--plot', action='store_true', help="also plot them next to the CSV, needs matplotlib")
+    scaling.set_defaults(run=scalingCommand)
+
+    args = parser.parse_args()
+    args.run(args)
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,54 @@
+import pygame
+from settings import KEY_BINDINGS
+
+class ActionMap: #turns key events into named actions, so game code never looks at raw keys
+    def __init__(self, bindings=KEY_BINDINGS):
+        self.actionsForKey = {} #key code -> actions it triggers, one key can drive several
+        self.keysForAction = {} #action -> key codes bound to it
+        self.held = set() #actions whose key is down right now
+        self.pressed = set() #actions pressed since the last sim tick
+        self.released = set() #actions released since the last sim tick
+        for action, keyNames in bindings.items():
+            self.rebind(action, *keyNames)
+
+    def rebind(self, action, *keyNames): #replace every key bound to action, key names as pygame.key.name gives them
+        for key in self.keysForAction.pop(action, ()):
+            self.actionsForKey[key].discard(action)
+        keys = [pygame.key.key_code(name) for name in keyNames]
+        self.keysForAction[action] = keys
+        for key in keys:
+            self.actionsForKey.setdefault(key, set()).add(action)
+        self.held.discard(action)
+
+    def keyNames(self, action): #for showing bindings in menus
+        return [pygame.key.name(key) for key in self.keysForAction.get(action, ())]
+
+    def handleEvent(self, event): #True if the event was a bound key
+        if event.type == pygame.KEYDOWN:
+            actions = self.actionsForKey.get(event.key, ())
+            self.pressed.update(actions)
+            self.held.update(actions)
+            return bool(actions)
+        if event.type == pygame.KEYUP:
+            actions = self.actionsForKey.get(event.key, ())
+            self.released.update(actions)
+            self.held.difference_update(actions)
+            return bool(actions)
+        return False
+
+    def isHeld(self, action):
+        return action in self.held
+
+    def wasPressed(self, action): #once per press, however long the key is held
+        return action in self.pressed
+
+    def wasReleased(self, action):
+        return action in self.released
+
+    def clearEdges(self): #called after a sim tick has seen this frame's presses and releases
+        self.pressed.clear()
+        self.released.clear()
+
+    def releaseAll(self): #forget held keys, e.g. after a menu swallowed the key-up events
+        self.held.clear()
+        self.clearEdges()
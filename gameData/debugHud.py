@@ -0,0 +1,170 @@
+#debug HUD (F3): fps, frame-time graph, sprite counts, blits and font renders per frame, surface memory
+#the counters are proxies swapped in when the HUD is shown and swapped out when it is hidden, so a hidden HUD costs nothing
+from itertools import islice
+import pygame
+from settings import HUD_REFRESH, HUD_GRAPH_FRAMES, HUD_GRAPH_SIZE, HUD_GRAPH_MAX_MS, HUD_FRAME_BUDGET_MS
+from sprites import Crop, Tree
+from atlas import defaultAtlas
+from loader import defaultLoader
+
+class CountingSurface: #stands in for the camera's render target, counting blits
+    def __init__(self, surface):
+        self.surface = surface
+        self.blits = 0
+
+    def blit(self, *args, **kwargs):
+        self.blits += 1
+        return self.surface.blit(*args, **kwargs)
+
+    def __getattr__(self, name): #everything else goes straight to the real surface
+        return getattr(self.surface, name)
+
+class CountingFont: #stands in for a UI font, counting renders; pygame fonts can't have render patched
+    def __init__(self, font, counter):
+        self.font = font
+        self.counter = counter
+
+    def render(self, *args, **kwargs):
+        self.counter[0] += 1
+        return self.font.render(*args, **kwargs)
+
+    def __getattr__(self, name):
+        return getattr(self.font, name)
+
+def surfaceMemory(level): #pixel bytes of the surfaces the level can reach, sheets shared by subsurfaces counted once
+    seen = set()
+    total = 0
+    surfaces = [sprite.image for sprite in level.allSprites]
+    surfaces.extend(level.ground.chunks.values())
+    surfaces.extend(level.ground.tileImages.values())
+    surfaces.extend(defaultAtlas.sheets.values())
+    surfaces.extend(defaultLoader.images.values())
+    for stages in Crop.stageCache.values():
+        surfaces.extend(stages)
+    surfaces.extend(Tree.leafImages or ())
+    surfaces.append(level.allSprites.renderSurface)
+    surfaces.append(level.displaySurface)
+    for surface in surfaces:
+        if surface is None:
+            continue
+        surface = surface.get_abs_parent() #a subsurface owns no pixels of its own
+        if id(surface) not in seen:
+            seen.add(id(surface))
+            total += surface.get_width() * surface.get_height() * surface.get_bytesize()
+    return total
+
+class DebugHud:
+    def __init__(self, level, telemetry=None):
+        self.level = level
+        self.telemetry = telemetry #set by MainGame once every system is scheduled
+        self.visible = False
+        self.font = pygame.font.Font('assets/fonts/Pixellari.ttf', 18) #the HUD's own renders aren't counted
+        self.panel = None #text lines, rebuilt every HUD_REFRESH ms rather than every frame
+        self.panelBackground = None
+        self.graphBackground = pygame.Surface(HUD_GRAPH_SIZE, pygame.SRCALPHA)
+        self.graphBackground.fill((0, 0, 0, 150))
+        self.lastRefresh = 0
+        self.blitCounter = None
+        self.fontRenders = [0] #shared with every CountingFont, a list so the proxies can bump it
+        self.fontHolders = [] #(object, attribute, original font) to put back on hide
+        self.blitsLastFrame = 0
+        self.rendersLastFrame = 0
+
+    def input(self, deltaTime): #level input system
+        if self.level.actions.wasPressed('debugHud'):
+            self.hide() if self.visible else self.show()
+
+    def show(self):
+        camera = self.level.allSprites
+        self.blitCounter = CountingSurface(camera.blitTarget)
+        camera.blitTarget = self.blitCounter
+        for holder in (self.level.overlay, self.level.shop, self.level.player.inventory, self.level.time):
+            for name, value in list(vars(holder).items()):
+                if isinstance(value, pygame.font.Font):
+                    setattr(holder, name, CountingFont(value, self.fontRenders))
+                    self.fontHolders.append((holder, name, value))
+        self.visible = True
+        self.lastRefresh = 0
+
+    def hide(self):
+        self.level.allSprites.blitTarget = self.blitCounter.surface
+        self.blitCounter = None
+        for holder, name, font in self.fontHolders:
+            setattr(holder, name, font)
+        self.fontHolders = []
+        self.visible = False
+        self.panel = None
+
+    def counts(self):
+        level = self.level
+        return [
+            ('allSprites', len(level.allSprites)),
+            ('collisionSprites', len(level.collisionSprites)),
+            ('crops', len(level.crops)),
+            ('trees', len(level.trees)),
+            ('particles', len(level.particles)),
+            ('itemsGroup', len(level.itemsGroup)),
+            ('world', len(level.world))
+        ]
+
+    def fps(self): #frames drawn in the last second of telemetry
+        rows = self.telemetry.rows
+        if not rows:
+            return 0
+        latest = rows[-1][1]
+        frames = 0
+        for _, seconds, _ in reversed(rows):
+            if latest - seconds > 1.0:
+                break
+            frames += 1
+        return frames
+
+    def refresh(self):
+        lines = []
+        if self.telemetry is not None:
+            frameStats = self.telemetry.summary(['frame'])['frame']
+            lines.append(f"FPS {self.fps()}  frame p50 {frameStats['p50']:.2f} p99 {frameStats['p99']:.2f} ms")
+        lines.append(f"blits {self.blitsLastFrame}  font renders {self.rendersLastFrame}")
+        lines.extend(f"{name:<17}{count:>6}" for name, count in self.counts())
+        lines.append(f"surfaces {surfaceMemory(self.level) / 1048576:.1f} MB")
+        self.panel = [self.font.render(line, True, (255, 255, 255)) for line in lines]
+        panelWidth = max(max(line.get_width() for line in self.panel) + 12, HUD_GRAPH_SIZE[0])
+        self.panelBackground = pygame.Surface((panelWidth, sum(line.get_height() for line in self.panel) + 8), pygame.SRCALPHA)
+        self.panelBackground.fill((0, 0, 0, 150))
+
+    def drawGraph(self, surface, topLeft): #one bar per frame, the line is the frame budget
+        width, height = HUD_GRAPH_SIZE
+        rect = pygame.Rect(topLeft, HUD_GRAPH_SIZE)
+        surface.blit(self.graphBackground, rect)
+        frameIndex = self.telemetry.columns.index('frame')
+        rows = list(islice(reversed(self.telemetry.rows), HUD_GRAPH_FRAMES))[::-1] #newest frames without copying the window
+        barWidth = max(1, width // HUD_GRAPH_FRAMES)
+        for i, (_, _, values) in enumerate(rows):
+            barHeight = min(height, int(values[frameIndex] / HUD_GRAPH_MAX_MS * height))
+            color = (120, 220, 120) if values[frameIndex] <= HUD_FRAME_BUDGET_MS else (230, 90, 60)
+            pygame.draw.line(surface, color, (rect.x + i * barWidth, rect.bottom - 1), (rect.x + i * barWidth, rect.bottom - 1 - barHeight), barWidth)
+        budgetY = rect.bottom - int(HUD_FRAME_BUDGET_MS / HUD_GRAPH_MAX_MS * height)
+        pygame.draw.line(surface, (255, 255, 255), (rect.x, budgetY), (rect.right, budgetY))
+
+    def draw(self, alpha): #level render system, runs last so the counts cover this frame's world and overlay
+        if not self.visible:
+            return
+        self.blitsLastFrame = self.blitCounter.blits
+        self.blitCounter.blits = 0
+        self.rendersLastFrame = self.fontRenders[0]
+        self.fontRenders[0] = 0
+
+        now = pygame.time.get_ticks()
+        if self.panel is None or now - self.lastRefresh >= HUD_REFRESH:
+            self.refresh()
+            self.lastRefresh = now
+
+        surface = self.level.displaySurface
+        x, y = 10, 90
+        surface.blit(self.panelBackground, (x, y))
+        lineY = y + 4
+        for line in self.panel:
+            surface.blit(line, (x + 6, lineY))
+            lineY += line.get_height()
+        if self.telemetry is not None:
+            self.drawGraph(surface, (x, y + self.panelBackground.get_height() + 4))
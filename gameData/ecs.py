@@ -0,0 +1,60 @@
+import pygame
+
+# every component an entity class can declare in its components set
+COMPONENTS = ('renderable', 'collider', 'breakable', 'choppable', 'pickup', 'growable', 'tillable', 'expiring')
+
+class ComponentStore: #entities that have one component, packed densely so systems iterate without gaps
+    def __init__(self, name):
+        self.name = name
+        self.entities = [] #dense, order changes on removal
+        self.index = {} #entity -> position in entities
+
+    def add(self, entity):
+        if entity not in self.index:
+            self.index[entity] = len(self.entities)
+            self.entities.append(entity)
+
+    def remove(self, entity): #swap the last entity into the hole so removal is O(1)
+        position = self.index.pop(entity, None)
+        if position is None:
+            return
+        last = self.entities.pop()
+        if last is not entity:
+            self.entities[position] = last
+            self.index[last] = position
+
+    def __contains__(self, entity):
+        return entity in self.index
+
+    def __len__(self):
+        return len(self.entities)
+
+    def __iter__(self): #over a copy, systems kill entities while iterating
+        return iter(self.entities[:])
+
+class World(pygame.sprite.Group): #every entity joins this group, which files it under each of its components
+    def __init__(self, *sprites):
+        self.stores = {name: ComponentStore(name) for name in COMPONENTS}
+        super().__init__(*sprites)
+
+    # pygame calls these whenever a sprite joins or leaves, including kill()
+    def add_internal(self, sprite, *args):
+        super().add_internal(sprite, *args)
+        for name in sprite.components:
+            self.stores[name].add(sprite)
+
+    def remove_internal(self, sprite):
+        super().remove_internal(sprite)
+        for name in sprite.components:
+            self.stores[name].remove(sprite)
+
+    def store(self, name):
+        return self.stores[name]
+
+    def query(self, *names): #entities that have every named component
+        stores = sorted((self.stores[name] for name in names), key=len)
+        smallest, others = stores[0], stores[1:] #walk the smallest store, check membership in the rest
+        return [entity for entity in smallest.entities if all(entity in store for store in others)]
+
+    def stats(self): #entity count per component
+        return {name: len(store) for name, store in self.stores.items()}
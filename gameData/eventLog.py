@@ -0,0 +1,144 @@
+#structured event log: game code records events into a ring buffer, a background thread formats and writes them
+#recording never formats or touches the console, and a level or category that is switched off costs one no-op call
+import sys
+import threading
+import time
+from collections import deque
+from functools import partial
+from settings import EVENT_LOG_LEVEL, EVENT_LOG_MUTED, EVENT_LOG_SIZE, EVENT_LOG_FLUSH_INTERVAL, EVENT_LOG_FILE
+
+LEVELS = ('debug', 'info', 'warning', 'error') #lowest first, a threshold keeps its level and everything after it
+
+def noop(*args):
+    pass
+
+class CategoryLog: #one category's debug/info/warning/error, levels under the threshold are bound to noop
+    def __init__(self, log, name):
+        self.log = log
+        self.name = name
+        self.configure()
+
+    def configure(self): #rebinds the level methods, called whenever the threshold or muted categories change
+        for rank, level in enumerate(LEVELS):
+            if self.log.accepts(self.name, rank):
+                setattr(self, level, partial(self.log.record, rank, self.name))
+            else:
+                setattr(self, level, noop)
+
+    def enabled(self, level): #for callers that would have to do real work just to build the arguments
+        return self.log.accepts(self.name, LEVELS.index(level))
+
+class EventLog:
+    def __init__(self, size=EVENT_LOG_SIZE, level=EVENT_LOG_LEVEL, muted=EVENT_LOG_MUTED, interval=EVENT_LOG_FLUSH_INTERVAL, path=EVENT_LOG_FILE):
+        # deque append and popleft are atomic under the GIL, so the game and the flusher share it without a lock
+        self.buffer = deque(maxlen=size) #(seconds since start, level rank, category, message, args), oldest dropped when full
+        self.dropped = 0 #events pushed out before a flush reached them
+        self.threshold = self.rankOf(level)
+        self.muted = set(muted)
+        self.categories = {} #name -> CategoryLog
+        self.interval = interval
+        self.path = path #None writes to stdout
+        self.startTime = time.perf_counter()
+        self.flusher = None
+        self.stopping = threading.Event()
+
+    @staticmethod
+    def rankOf(level): #'off' ranks past every level so nothing is accepted
+        return len(LEVELS) if level == 'off' else LEVELS.index(level)
+
+    # recording
+
+    def category(self, name): #the object game code logs through, one per category and shared
+        log = self.categories.get(name)
+        if log is None:
+            log = self.categories[name] = CategoryLog(self, name)
+        return log
+
+    def accepts(self, category, rank):
+        return rank >= self.threshold and category not in self.muted
+
+    def record(self, rank, category, message, *args): #message is %-formatted with args, but only when flushed
+        if len(self.buffer) == self.buffer.maxlen:
+            self.dropped += 1
+        self.buffer.append((time.perf_counter() - self.startTime, rank, category, message, args))
+
+    # switching
+
+    def setLevel(self, level):
+        self.threshold = self.rankOf(level)
+        self.reconfigure()
+
+    def mute(self, category):
+        self.muted.add(category)
+        self.reconfigure()
+
+    def unmute(self, category):
+        self.muted.discard(category)
+        self.reconfigure()
+
+    def reconfigure(self):
+        for log in self.categories.values():
+            log.configure()
+
+    # reading
+
+    @staticmethod
+    def format(event):
+        seconds, rank, category, message, args = event
+        try:
+            text = message % args if args else message
+        except (TypeError, ValueError):
+            text = f"{message} {args}" #a bad format string shouldn't lose the event
+        return f"{seconds:9.3f} {LEVELS[rank]:<7} {category:<8} {text}"
+
+    def recent(self, count=20, category=None): #newest events still in the buffer, formatted, without removing them
+        events = list(self.buffer) #copied in one step, the flusher may be draining at the same time
+        if category is not None:
+            events = [event for event in events if event[2] == category]
+        return [self.format(event) for event in events[-count:]]
+
+    def drain(self):
+        events = []
+        while True:
+            try:
+                events.append(self.buffer.popleft())
+            except IndexError:
+                return events
+
+    def flush(self): #format and write everything buffered, safe from any thread
+        events = self.drain()
+        if not events and not self.dropped:
+            return
+        lines = [self.format(event) for event in events]
+        if self.dropped:
+            lines.append(f"{'':9} warning log      {self.dropped} events dropped, the ring buffer was full")
+            self.dropped = 0
+        text = '\n'.join(lines) + '\n'
+        if self.path is None:
+            sys.stdout.write(text)
+            sys.stdout.flush()
+        else:
+            with open(self.path, 'a') as f:
+                f.write(text)
+
+    # background flushing
+
+    def start(self): #flush every interval on a daemon thread until stop
+        if self.flusher is not None:
+            return
+        self.stopping.clear()
+        self.flusher = threading.Thread(target=self.flushLoop, name='eventLog', daemon=True)
+        self.flusher.start()
+
+    def flushLoop(self):
+        while not self.stopping.wait(self.interval):
+            self.flush()
+
+    def stop(self): #joins the flusher and writes whatever is left
+        if self.flusher is not None:
+            self.stopping.set()
+            self.flusher.join()
+            self.flusher = None
+        self.flush()
+
+eventLog = EventLog()
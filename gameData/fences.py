@@ -0,0 +1,82 @@
+import pygame
+from settings import LAYERS, ZOOM_X, ZOOM_Y, FENCE_BAKE_TILES
+from sprites import Generic, Collider
+from support import scaleByZoom
+
+def findFenceRuns(cells): #merge fence cells into (x, y, width, height) runs, in tiles
+    runs = []
+    remaining = set(cells)
+
+    # horizontal runs first, anything two tiles or longer
+    for y in sorted({y for _, y in cells}):
+        row = sorted(x for x, cellY in remaining if cellY == y)
+        start = 0
+        while start < len(row):
+            end = start
+            while end + 1 < len(row) and row[end + 1] == row[end] + 1:
+                end += 1
+            length = end - start + 1
+            if length >= 2:
+                runs.append((row[start], y, length, 1))
+                for x in row[start:end + 1]:
+                    remaining.discard((x, y))
+            start = end + 1
+
+    # whatever is left is posts or vertical fence, merge down each column
+    for x in sorted({x for x, _ in remaining}):
+        column = sorted(y for cellX, y in remaining if cellX == x)
+        start = 0
+        while start < len(column):
+            end = start
+            while end + 1 < len(column) and column[end + 1] == column[end] + 1:
+                end += 1
+            runs.append((x, column[start], 1, end - start + 1))
+            start = end + 1
+
+    return runs
+
+def runHitbox(run, tileWidth, tileHeight): #union of the per-tile Generic hitboxes along the run
+    x, y, width, height = run
+    insetX = tileWidth * 0.1 #Generic shrinks each tile by 20% wide
+    insetY = tileHeight * 0.375 #and 75% tall, centred
+    left = x * tileWidth + insetX
+    top = y * tileHeight + insetY
+    right = (x + width) * tileWidth - insetX
+    bottom = (y + height) * tileHeight - insetY
+    return pygame.Rect(round(left), round(top), round(right - left), round(bottom - top))
+
+def bakeFenceBlocks(tiles, tileWidth, tileHeight, groups): #draw the fence into a few composite surfaces
+    blocks = {}
+    for (x, y), surf in tiles.items():
+        blocks.setdefault((x // FENCE_BAKE_TILES, y // FENCE_BAKE_TILES), []).append((x, y, surf))
+
+    for blockTiles in blocks.values():
+        minX = min(x for x, _, _ in blockTiles)
+        minY = min(y for _, y, _ in blockTiles)
+        maxX = max(x for x, _, _ in blockTiles)
+        maxY = max(y for _, y, _ in blockTiles)
+
+        # only as big as the fence inside this block
+        bakedSurf = pygame.Surface(((maxX - minX + 1) * tileWidth, (maxY - minY + 1) * tileHeight), pygame.SRCALPHA)
+        for x, y, surf in blockTiles:
+            bakedSurf.blit(scaleByZoom(surf), ((x - minX) * tileWidth, (y - minY) * tileHeight))
+        Generic((minX * tileWidth, minY * tileHeight), bakedSurf, groups, z=LAYERS['main'])
+
+    return len(blocks)
+
+def compileFences(layer, tileWidth, tileHeight, renderGroups, collisionGroups):
+    tiles = {(x, y): surf for x, y, surf in layer.tiles() if surf} #fence layer cells that have a tile
+    if not tiles:
+        return 0, 0
+
+    scaledWidth = int(tileWidth * ZOOM_X) #fence tiles in world pixels
+    scaledHeight = int(tileHeight * ZOOM_Y)
+
+    runs = findFenceRuns(tiles.keys())
+    for run in runs:
+        x, y, width, height = run
+        runRect = pygame.Rect(x * scaledWidth, y * scaledHeight, width * scaledWidth, height * scaledHeight)
+        Collider(runRect, collisionGroups, hitbox=runHitbox(run, scaledWidth, scaledHeight))
+
+    blockCount = bakeFenceBlocks(tiles, scaledWidth, scaledHeight, renderGroups)
+    return len(runs), blockCount
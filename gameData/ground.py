@@ -0,0 +1,110 @@
+import pygame
+from collections import OrderedDict
+from settings import ZOOM_X, ZOOM_Y, GROUND_LAYERS, GROUND_OBJECT_LAYERS, GROUND_CHUNK_TILES, GROUND_MAX_CHUNKS
+from support import scaleByZoom
+
+class GroundLayer:
+    def __init__(self, tmxData, chunkTiles=GROUND_CHUNK_TILES, maxChunks=GROUND_MAX_CHUNKS):
+        self.tmxData = tmxData
+        self.tileWidth = int(tmxData.tilewidth * ZOOM_X) #tile size in world pixels
+        self.tileHeight = int(tmxData.tileheight * ZOOM_Y)
+        self.chunkTiles = chunkTiles
+        self.chunkWidth = chunkTiles * self.tileWidth #chunk size in world pixels
+        self.chunkHeight = chunkTiles * self.tileHeight
+        self.columns = -(-tmxData.width // chunkTiles) #chunks across the map, rounded up
+        self.rows = -(-tmxData.height // chunkTiles)
+        self.maxChunks = maxChunks
+
+        # tile layers in map order, so later layers paint over earlier ones
+        self.tileLayers = [layer for layer in tmxData.layers if layer.name in GROUND_LAYERS and hasattr(layer, 'data')]
+
+        # static image objects (barn, house, decor) are baked into the ground too
+        self.objects = []
+        for layer in tmxData.layers:
+            if layer.name in GROUND_OBJECT_LAYERS and not hasattr(layer, 'data'):
+                for obj in layer:
+                    if getattr(obj, 'image', None):
+                        image = scaleByZoom(obj.image)
+                        self.objects.append((image.get_rect(topleft=(obj.x * ZOOM_X, obj.y * ZOOM_Y)), image))
+
+        self.tileImages = {} #gid -> scaled tile surface, shared by every chunk
+        self.chunks = OrderedDict() #(cx, cy) -> surface, least recently used first
+        self.chunksBuilt = 0 #counters so the cache can be tuned
+        self.chunksEvicted = 0
+
+    def getTileImage(self, gid):
+        image = self.tileImages.get(gid)
+        if image is None:
+            image = self.tmxData.get_tile_image_by_gid(gid)
+            if image is not None:
+                image = scaleByZoom(image)
+            self.tileImages[gid] = image
+        return image
+
+    def buildChunk(self, cx, cy):
+        firstX = cx * self.chunkTiles
+        firstY = cy * self.chunkTiles
+        lastX = min(firstX + self.chunkTiles, self.tmxData.width) #last chunk may be clipped by the map edge
+        lastY = min(firstY + self.chunkTiles, self.tmxData.height)
+
+        chunkRect = pygame.Rect(cx * self.chunkWidth, cy * self.chunkHeight,
+                                (lastX - firstX) * self.tileWidth, (lastY - firstY) * self.tileHeight)
+        surf = pygame.Surface(chunkRect.size).convert() #opaque, ground covers the whole map
+        surf.fill((0, 0, 0))
+
+        for layer in self.tileLayers:
+            for y in range(firstY, lastY):
+                row = layer.data[y]
+                for x in range(firstX, lastX):
+                    gid = row[x]
+                    if gid:
+                        image = self.getTileImage(gid)
+                        if image:
+                            surf.blit(image, ((x - firstX) * self.tileWidth, (y - firstY) * self.tileHeight))
+
+        for rect, image in self.objects:
+            if rect.colliderect(chunkRect):
+                surf.blit(image, (rect.x - chunkRect.x, rect.y - chunkRect.y)) #clipped to the chunk by SDL
+
+        self.chunksBuilt += 1
+        return surf
+
+    def getChunk(self, cx, cy):
+        surf = self.chunks.get((cx, cy))
+        if surf is None:
+            surf = self.buildChunk(cx, cy)
+            self.chunks[(cx, cy)] = surf
+            while len(self.chunks) > self.maxChunks:
+                self.chunks.popitem(last=False) #evict the least recently drawn chunk
+                self.chunksEvicted += 1
+        else:
+            self.chunks.move_to_end((cx, cy))
+        return surf
+
+    def visibleRange(self, offset, viewSize, margin=0):
+        firstX = max(0, int(offset[0] // self.chunkWidth) - margin)
+        firstY = max(0, int(offset[1] // self.chunkHeight) - margin)
+        lastX = min(self.columns - 1, int((offset[0] + viewSize[0]) // self.chunkWidth) + margin)
+        lastY = min(self.rows - 1, int((offset[1] + viewSize[1]) // self.chunkHeight) + margin)
+        return firstX, firstY, lastX, lastY
+
+    def prefetch(self, offset, viewSize): #build at most one chunk from the ring around the view
+        firstX, firstY, lastX, lastY = self.visibleRange(offset, viewSize, margin=1)
+        for cy in range(firstY, lastY + 1):
+            for cx in range(firstX, lastX + 1):
+                if (cx, cy) not in self.chunks and len(self.chunks) < self.maxChunks:
+                    self.getChunk(cx, cy)
+                    return
+
+    def draw(self, surface, offset):
+        viewSize = surface.get_size()
+        firstX, firstY, lastX, lastY = self.visibleRange(offset, viewSize)
+
+        # never let the cache be smaller than what is on screen, or it would thrash
+        self.maxChunks = max(self.maxChunks, (lastX - firstX + 1) * (lastY - firstY + 1))
+
+        for cy in range(firstY, lastY + 1):
+            for cx in range(firstX, lastX + 1):
+                surface.blit(self.getChunk(cx, cy), (cx * self.chunkWidth - int(offset[0]), cy * self.chunkHeight - int(offset[1])))
+
+        self.prefetch(offset, viewSize)
@@ -1,6 +1,13 @@
 import pygame
 import os
 from settings import *
+from support import loadImage
+from eventLog import eventLog
+
+economyLog = eventLog.category('economy')
+growthLog = eventLog.category('growth')
+inputLog = eventLog.category('input')
+assetLog = eventLog.category('assets')
 
 class Inventory:
     def __init__(self, size=10, level=None):
@@ -12,14 +19,14 @@ class Inventory:
 
         # Inventory slot graphics
         try:
-            self.slotImage = pygame.image.load("assets/inventory/slot.png").convert_alpha()
+            self.slotImage = loadImage("assets/inventory/slot.png")
             self.slotImage = pygame.transform.scale(self.slotImage, (40, 40))
         except Exception:
             self.slotImage = pygame.Surface((40, 40))
             self.slotImage.fill((100, 100, 100))
 
         try:
-            self.selectedImage = pygame.image.load("assets/inventory/selected.png").convert_alpha()
+            self.selectedImage = loadImage("assets/inventory/selected.png")
             self.selectedImage = pygame.transform.scale(self.selectedImage, (44, 44))
         except Exception:
             self.selectedImage = pygame.Surface((44, 44))
@@ -35,7 +42,7 @@ class Inventory:
         for key, item in ITEMS.items():
             if 'imagePath' in item:
                 try:
-                    loadedImg = pygame.image.load(item['imagePath']).convert_alpha()
+                    loadedImg = loadImage(item['imagePath'])
                     item['image'] = pygame.transform.scale(loadedImg, (32, 32))
                 except Exception:
                     item['image'] = pygame.Surface((32, 32))
@@ -46,7 +53,7 @@ class Inventory:
         for i, item in enumerate(self.items):
             if item['name'] == itemKey:
                 self.items[i]['quantity'] += quantity
-                print(f"Added {quantity} {itemKey}. Total: {self.items[i]['quantity']}")
+                economyLog.debug("Added %d %s. Total: %d", quantity, itemKey, self.items[i]['quantity'])
                 return True
         
         # Add new item if there's space
@@ -56,7 +63,7 @@ class Inventory:
                 if itemKey == 'wood':
                     try:
                         wood_path = "graphics/items/wood.png"
-                        wood_img = pygame.image.load(wood_path).convert_alpha()
+                        wood_img = loadImage(wood_path)
                         icon = pygame.transform.scale(wood_img, (32, 32))
                     except:
                         icon = pygame.Surface((32, 32))
@@ -65,7 +72,7 @@ class Inventory:
                 elif itemKey == 'stone':
                     try:
                         stone_path = "graphics/items/stone.png"
-                        stone_img = pygame.image.load(stone_path).convert_alpha()
+                        stone_img = loadImage(stone_path)
                         icon = pygame.transform.scale(stone_img, (32, 32))
                     except:
                         icon = pygame.Surface((32, 32))
@@ -87,13 +94,13 @@ class Inventory:
                         seed_path = f"graphics/seeds/{seed_filename}.png"
                         
                         if os.path.exists(seed_path):
-                            seed_img = pygame.image.load(seed_path).convert_alpha()
+                            seed_img = loadImage(seed_path)
                             icon = pygame.transform.scale(seed_img, (32, 32))
                         else:
                             # Fallback: try graphics/items folder
                             item_path = f"graphics/items/{seed_filename}.png"
                             if os.path.exists(item_path):
-                                item_img = pygame.image.load(item_path).convert_alpha()
+                                item_img = loadImage(item_path)
                                 icon = pygame.transform.scale(item_img, (32, 32))
                             else:
                                 # Ultimate fallback: create colored seed icon
@@ -110,7 +117,7 @@ class Inventory:
                                 pygame.draw.ellipse(icon, (255, 255, 255), (10, 10, 12, 12), 1)
                                 
                     except Exception as e:
-                        print(f"Error loading image for {itemKey}: {e}")
+                        assetLog.error("Error loading image for %s: %s", itemKey, e)
                         # Final fallback
                         icon = pygame.Surface((32, 32))
                         icon.fill((200, 200, 200))
@@ -121,10 +128,10 @@ class Inventory:
                 'image': icon
             }
             self.items.append(item_data)
-            print(f"Added {itemKey} to inventory. Total: {quantity}")
+            economyLog.debug("Added %s to inventory. Total: %d", itemKey, quantity)
             return True
         
-        print(f"Inventory full! Could not add {itemKey}")
+        economyLog.warning("Inventory full! Could not add %s", itemKey)
         return False
 
     # Remove item
@@ -151,7 +158,7 @@ class Inventory:
             return
         item = self.items[self.selectedIndex]
 
-        print(f"Using {item['name']}")
+        inputLog.debug("Using %s", item['name'])
 
         # Handle seed planting
         if item['name'] in ['kale','parsnips','beans','potatoes','melon','corn','hotPeppers',
@@ -160,17 +167,26 @@ class Inventory:
                 success = self.level.plantCrop(item['name'], self.level.player)
                 if success:
                     self.removeItem(self.selectedIndex, 1)
-                    print(f"Planted {item['name']} seed")
+                    growthLog.debug("Planted %s seed", item['name'])
                 else:
-                    print("Could not plant seed - no tilled soil in front")
+                    growthLog.debug("Could not plant seed - no tilled soil in front")
             else:
-                print("No level reference or plantCrop method")
+                inputLog.warning("No level reference or plantCrop method")
 
         elif item.get('type') == "tool":
-            print(f"Swinging {item['name']}")
+            inputLog.debug("Swinging %s", item['name'])
 
         elif item.get('type') == "material":
-            print(f"Used {item['name']}")
+            inputLog.debug("Used %s", item['name'])
+
+    # Inventory keys from the action map
+    def input(self, actions):
+        if actions.wasPressed('inventory'):
+            self.toggle()
+        if actions.wasPressed('inventoryNext'):
+            self.selectNext()
+        if actions.wasPressed('inventoryPrev'):
+            self.selectPrev()
 
     # Toggle visibility
     def toggle(self):
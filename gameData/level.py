@@ -1,38 +1,70 @@
 import pygame
 import os
-from pytmx.util_pygame import load_pygame
+from pytmx import TiledMap
 from settings import *
-from sprites import *
+import random
+from sprites import Collider, Crop, Particle, Rock, SoilTile, Stone, Tree, Wood
 from overlay import Overlay
 from shop import Shop
 from saveSystem import SaveSystem
+from support import scaleByZoom, loadImage
+from loader import tmxImageLoader
+from fences import compileFences
+from ground import GroundLayer
+from spatial import SpatialGroup, PickupIndex
+from pool import SpritePool
+from ecs import World
+from scheduler import SystemScheduler
+from controls import ActionMap
+from profiler import startupProfile
+from eventLog import eventLog
+
+growthLog = eventLog.category('growth')
+saveLog = eventLog.category('save')
 
 class Level:
-    def __init__(self):
+    def __init__(self, tmxData=None): #tmxData stands in for myfarm.tmx, e.g. a bigger map from stressScene
         self.displaySurface = pygame.display.get_surface() #main display surface
+        self.actions = ActionMap() #key events become named actions, consumed once per tick
 
         self.untiledSoil = pygame.transform.smoothscale(
-            pygame.image.load('graphics/soil/untiled.png').convert_alpha(), #load and scale soil images
+            loadImage('graphics/soil/untiled.png'), #load and scale soil images
             (int(TILE_SIZE * ZOOM_X), int(TILE_SIZE * ZOOM_Y)) # scale size
         )
         self.tilledSoilImage = pygame.transform.smoothscale(    
-            pygame.image.load('graphics/soil/tilled.png').convert_alpha(),
+            loadImage('graphics/soil/tilled.png'),
             (int(TILE_SIZE * ZOOM_X), int(TILE_SIZE * ZOOM_Y))
         ) # scale size
 
         # sprite groups
         self.allSprites = CameraGroup() #camera group for all sprites
-        self.soilTiles = pygame.sprite.Group() #group for soil tiles 
-        self.collisionSprites = pygame.sprite.Group() #group for collision
-        self.crops = pygame.sprite.Group() #group for crops
-        self.trees = pygame.sprite.Group() #group for trees
+        self.soilTiles = SpatialGroup() #group for soil tiles 
+        self.collisionSprites = SpatialGroup() #group for collision
+        self.crops = SpatialGroup() #group for crops
+        self.trees = SpatialGroup() #group for trees
+        self.rocks = SpatialGroup() #group for breakable rocks
         self.particles = pygame.sprite.Group() #group for particles
-        self.itemsGroup = pygame.sprite.Group() #group for items
+        self.itemsGroup = PickupIndex() #ground items, bucketed by tile for pickup checks
+        self.world = World() #every entity, filed under its components
+
+        # spatially indexed groups, looked up with query()
+        self.spatial = {
+            'soil': self.soilTiles,
+            'tree': self.trees,
+            'rock': self.rocks,
+            'crop': self.crops,
+            'item': self.itemsGroup,
+            'collider': self.collisionSprites
+        }
+
+        # pools for the sprites that are spawned and killed all the time
+        self.particlePool = SpritePool(Particle)
+        self.itemPools = {'wood': SpritePool(Wood), 'stone': SpritePool(Stone)}
 
         # wood surface (fallback if missing)
         try:
             woodPath = "graphics/items/wood.png"
-            woodSurf = pygame.image.load(woodPath).convert_alpha() #load wood image
+            woodSurf = loadImage(woodPath) #load wood image
             self.woodSurf = pygame.transform.scale(woodSurf, (int(32 * ZOOM_X), int(32 * ZOOM_Y))) #scale wood image
         except Exception:
             surf = pygame.Surface((int(32 * ZOOM_X), int(32 * ZOOM_Y)), pygame.SRCALPHA) #create empty surface
@@ -42,7 +74,7 @@ class Level:
         # stone surface (fallback if missing) - SMALLER SIZE
         try:
             stonePath = "graphics/items/stone.png"
-            stoneSurf = pygame.image.load(stonePath).convert_alpha() #load stone image
+            stoneSurf = loadImage(stonePath) #load stone image
             self.stoneSurf = pygame.transform.scale(stoneSurf, (int(24 * ZOOM_X), int(24 * ZOOM_Y))) #scale stone image - smaller size
         except Exception:
             surf = pygame.Surface((int(24 * ZOOM_X), int(24 * ZOOM_Y)), pygame.SRCALPHA) #create empty surface
@@ -50,7 +82,8 @@ class Level:
             self.stoneSurf = surf #use empty surface if loading fails
 
         # map
-        self.tmxData = load_pygame('graphics/world/myfarm.tmx') #load tmx map
+        with startupProfile.section('tmx'):
+            self.tmxData = tmxData or TiledMap('graphics/world/myfarm.tmx', image_loader=tmxImageLoader) #load tmx map, tilesets from the asset loader
         mapWidth = self.tmxData.width * self.tmxData.tilewidth #in pixels
         mapHeight = self.tmxData.height * self.tmxData.tileheight #in pixels
         self.mapRect = pygame.Rect(0, 0, mapWidth, mapHeight) #rectangle for map size
@@ -66,62 +99,65 @@ class Level:
         from transition import Time
         self.time = Time()
 
+        self.scheduler = SystemScheduler()
+        self.scheduleSystems()
+
     def getTileInFront(self, player): #get tile coordinates in front of player
-        tileX = player.rect.centerx // TILE_SIZE #get tile coordinates
-        tileY = player.rect.centery // TILE_SIZE #get tile coordinates
-        direction = player.status #player direction
-        if "Idle" in direction: 
-            direction = direction.replace("Idle", "") #remove idle
-        for tool in ["Axe", "Water", "Hoe", "Pickaxe"]: #remove tool from direction
-            if direction.endswith(tool): 
-                direction = direction[:-len(tool)]
-                break
-        if direction == "up":
-            tileY = tileY - 1
-        if direction == "down":
-            tileY = tileY + 1
-        if direction == "left":
-            tileX = tileX - 1
-        if direction == "right":
-            tileX = tileX + 1
-        return int(tileX), int(tileY)
+        deltaX, deltaY = player.state.tileDelta #from the precomputed state table
+        return int(player.rect.centerx // TILE_SIZE + deltaX), int(player.rect.centery // TILE_SIZE + deltaY)
+
+    def query(self, rect, kind=None): #sprites of one kind (or every kind) overlapping rect
+        if kind is not None:
+            return self.spatial[kind].query(rect)
+        found = []
+        for group in self.spatial.values():
+            found.extend(group.query(rect))
+        return found
+
+    def tileRect(self, tileX, tileY): #world rect of a tile
+        return pygame.Rect(tileX * TILE_SIZE, tileY * TILE_SIZE, TILE_SIZE, TILE_SIZE)
+
+    def getSoilTile(self, tileX, tileY):
+        for tile in self.query(self.tileRect(tileX, tileY), kind='soil'):
+            if (tile.rect.x // TILE_SIZE, tile.rect.y // TILE_SIZE) == (tileX, tileY): #found tile
+                return tile
+        return None
 
     def tillSoil(self, player):
         tileX, tileY = self.getTileInFront(player) #get tile in front of player
-        for tile in self.soilTiles:
-            if (tile.rect.x // TILE_SIZE, tile.rect.y // TILE_SIZE) == (tileX, tileY): #found tile
-                if not tile.tilled: 
-                    tile.till()
-                return
+        tile = self.getSoilTile(tileX, tileY)
+        if tile:
+            if not tile.tilled: 
+                tile.till()
+            return
         pos = (tileX * TILE_SIZE, tileY * TILE_SIZE) #position of new soil tile
-        soilTile = SoilTile(pos, groups=[self.allSprites, self.soilTiles], untiledImage=self.untiledSoil, tilledImage=self.tilledSoilImage) #create new soil tile
+        soilTile = SoilTile(pos, groups=[self.allSprites, self.soilTiles, self.world], untiledImage=self.untiledSoil, tilledImage=self.tilledSoilImage) #create new soil tile
         soilTile.till()
 
     def waterSoil(self, targetPos): #targetPos is pixel position
-        for tile in self.soilTiles: #check all soil tiles
+        for tile in self.query(pygame.Rect(targetPos, (1, 1)), kind='soil'): #only tiles under the point
             if tile.rect.collidepoint(targetPos):
                 tile.water()
                 break
 
+    def closestTo(self, sprites, targetRect): #sprite whose centre is nearest the target centre
+        closest = None
+        minDistance = float('inf')
+        targetCenter = targetRect.center
+        for sprite in sprites:
+            center = sprite.rect.center
+            distance = ((center[0] - targetCenter[0]) ** 2 + 
+                    (center[1] - targetCenter[1]) ** 2) ** 0.5
+            if distance < minDistance:
+                closest = sprite
+                minDistance = distance
+        return closest
+
     def chopTree(self, tileX, tileY):
         # More precise targeting so only check the exact tile
-        targetPos = (tileX * TILE_SIZE, tileY * TILE_SIZE)
-        targetRect = pygame.Rect(targetPos, (TILE_SIZE, TILE_SIZE))
-                
-        closestTree = None
-        minDistance = float('inf')
-        
-        for tree in self.trees:
-            if tree.alive and not tree.isChopped and tree.rect.colliderect(targetRect):
-                # Find the closest tree to the target center
-                treeCenter = tree.rect.center
-                targetCenter = targetRect.center
-                distance = ((treeCenter[0] - targetCenter[0]) ** 2 + 
-                        (treeCenter[1] - targetCenter[1]) ** 2) ** 0.5
-                
-                if distance < minDistance:
-                    closestTree = tree
-                    minDistance = distance
+        targetRect = self.tileRect(tileX, tileY)
+        candidates = [tree for tree in self.query(targetRect, kind='tree') if tree.has('choppable') and tree.alive and not tree.isChopped]
+        closestTree = self.closestTo(candidates, targetRect)
         
         if closestTree:
             # Call chop with the correct parameter names
@@ -139,25 +175,8 @@ class Level:
 
     def breakRock(self, tileX, tileY):
         # More precise targeting so only check the exact tile
-        targetPos = (tileX * TILE_SIZE, tileY * TILE_SIZE)
-        targetRect = pygame.Rect(targetPos, (TILE_SIZE, TILE_SIZE))
-                
-        closestRock = None
-        minDistance = float('inf')
-        
-        # Check both the visible rock sprites and collision sprites
-        for sprite in self.allSprites:
-            if (hasattr(sprite, 'breakable') and sprite.breakable and 
-                sprite.rect.colliderect(targetRect)):
-                # Find the closest rock to the target center
-                rockCenter = sprite.rect.center
-                targetCenter = targetRect.center
-                distance = ((rockCenter[0] - targetCenter[0]) ** 2 + 
-                        (rockCenter[1] - targetCenter[1]) ** 2) ** 0.5
-                
-                if distance < minDistance:
-                    closestRock = sprite
-                    minDistance = distance
+        targetRect = self.tileRect(tileX, tileY)
+        closestRock = self.closestTo([rock for rock in self.query(targetRect, kind='rock') if rock.has('breakable')], targetRect)
         
         if closestRock:
             # Spawn stone items
@@ -166,15 +185,14 @@ class Level:
                 offset_x = random.randint(-15, 15)
                 offset_y = random.randint(-15, 15)
                 stonePos = (closestRock.rect.centerx + offset_x, closestRock.rect.centery + offset_y)
-                Stone(stonePos, self.stoneSurf, [self.allSprites, self.itemsGroup])
+                self.dropItem('stone', stonePos)
             
             # Remove the rock from all groups
             closestRock.kill()
             
             # Also remove any collision sprites at the same position
-            for collision_sprite in self.collisionSprites:
-                if (collision_sprite.rect.centerx == closestRock.rect.centerx and 
-                    collision_sprite.rect.centery == closestRock.rect.centery):
+            for collision_sprite in self.query(closestRock.rect, kind='collider'):
+                if collision_sprite.rect.center == closestRock.rect.center:
                     collision_sprite.kill()
             
             return True
@@ -182,48 +200,44 @@ class Level:
         return False
 
     def isPlantable(self, tilePos):
-        for crop in self.crops:
+        for crop in self.query(self.tileRect(*tilePos), kind='crop'):
             if (crop.rect.x // TILE_SIZE, crop.rect.y // TILE_SIZE) == tilePos: #already a crop here
                 return False
         return True
 
     def plantCrop(self, cropName, player):
         tileX, tileY = self.getTileInFront(player) #get tile in front of player
-        for tile in self.soilTiles:
-            if (tile.rect.x // TILE_SIZE, tile.rect.y // TILE_SIZE) == (tileX, tileY): #found tile
-                if tile.tilled and self.isPlantable((tileX, tileY)): #can plant here
-                    cropPos = (tileX * TILE_SIZE, tileY * TILE_SIZE) #position of crop
-                    Crop(cropPos, cropName, [self.allSprites, self.crops])
-                    print(f"Planted {cropName} at ({tileX}, {tileY})")
-                    return True
+        tile = self.getSoilTile(tileX, tileY)
+        if tile:
+            if tile.tilled and self.isPlantable((tileX, tileY)): #can plant here
+                cropPos = (tileX * TILE_SIZE, tileY * TILE_SIZE) #position of crop
+                Crop(cropPos, cropName, [self.allSprites, self.crops, self.world])
+                growthLog.debug("Planted %s at (%d, %d)", cropName, tileX, tileY)
+                return True
+            else:
+                if not tile.tilled:
+                    growthLog.debug("Cannot plant %s - soil not tilled", cropName)
                 else:
-                    if not tile.tilled:
-                        print(f"Cannot plant {cropName} - soil not tilled")
-                    else:
-                        print(f"Cannot plant {cropName} - already occupied")
-                    return False
-        print(f"No soil tile found at ({tileX}, {tileY})")
+                    growthLog.debug("Cannot plant %s - already occupied", cropName)
+                return False
+        growthLog.debug("No soil tile found at (%d, %d)", tileX, tileY)
         return False
     
     def harvestCrop(self, tileX, tileY):
-        targetPos = (tileX * TILE_SIZE, tileY * TILE_SIZE)
-        targetRect = pygame.Rect(targetPos, (TILE_SIZE, TILE_SIZE))
-        
-        for crop in self.crops:
-            if (crop.rect.colliderect(targetRect) and crop.fullyGrown):
+        for crop in self.query(self.tileRect(tileX, tileY), kind='crop'):
+            if crop.fullyGrown:
                 crop.harvest()
                 success = self.player.inventory.addItem(crop.cropName, random.randint(1, 3))
                 if success:
-                    print(f"Harvested {crop.cropName}")
+                    growthLog.info("Harvested %s", crop.cropName)
                     return True
         return False
 
     def setup(self):
-        mapWidth = self.tmxData.width * self.tmxData.tilewidth #in pixels
-        mapHeight = self.tmxData.height * self.tmxData.tileheight #in pixels
-        groundSurf = pygame.image.load("graphics/world/myfarm.png").convert_alpha()
-        groundSurf = pygame.transform.smoothscale(groundSurf, (int(mapWidth * ZOOM_X), int(mapHeight * ZOOM_Y))) #scale to fit
-        Generic((0, 0), groundSurf, [self.allSprites], z=LAYERS['ground']) #ground layer
+        # ground is streamed in chunks from the TMX tile layers instead of one map-sized image
+        with startupProfile.section('ground'):
+            self.ground = GroundLayer(self.tmxData)
+        self.allSprites.ground = self.ground
  
         self.spawnObstacles()
 
@@ -235,72 +249,90 @@ class Level:
         if not spawnPoint:
             spawnPoint = (400 * ZOOM_X, 300 * ZOOM_Y) #default spawn if none found
 
-        from player import Player
-        self.player = Player(spawnPoint, [self.allSprites], self.collisionSprites, self) #add player
-        self.player.setMapBounds(self.mapRect) #set map boundaries
-        self.overlay = Overlay(self.player)
+        with startupProfile.section('player'):
+            from player import Player
+            self.player = Player(spawnPoint, [self.allSprites], self.collisionSprites, self) #add player
+            self.player.setMapBounds(self.mapRect) #set map boundaries
+            self.overlay = Overlay(self.player)
 
     def spawnObstacles(self):
-        for x, y, surf in self.tmxData.get_layer_by_name("fence").tiles(): #fence layer
-            if surf:
-                scaled_surf = pygame.transform.scale(surf, (int(surf.get_width() * ZOOM_X), int(surf.get_height() * ZOOM_Y))) #scale surface
-                pos = (x * self.tmxData.tilewidth * ZOOM_X, y * self.tmxData.tileheight * ZOOM_Y) #position
-                Generic(pos, scaled_surf, [self.allSprites, self.collisionSprites]) #add to groups
+        # fence tiles are merged into run colliders and a few baked surfaces
+        with startupProfile.section('fences'):
+            compileFences(self.tmxData.get_layer_by_name("fence"), self.tmxData.tilewidth, self.tmxData.tileheight,
+                          [self.allSprites, self.world], [self.collisionSprites, self.world])
         
-        # Get all tree objects
-        treeObjects = []
-        for obj in self.tmxData.get_layer_by_name("tree"):
-            treeObjects.append(obj)
+        with startupProfile.section('treeClustering'):
+            treeGroups = self.clusterTreeObjects()
+
+        # Create tree sprites for each valid cluster
+        with startupProfile.section('trees'):
+            for cluster in treeGroups:
+                self.createTreeFromGroup(cluster)
         
-        #group pixels that are close together
+        # Create rocks with proper collision
+        with startupProfile.section('rocks'):
+            for obj in self.tmxData.get_layer_by_name("rock"):
+                scaled_surf = scaleByZoom(obj.image)
+                # Create one sprite that handles both visibility and collision
+                Rock((obj.x * ZOOM_X, obj.y * ZOOM_Y), scaled_surf, [self.allSprites, self.collisionSprites, self.rocks, self.world])
+                
+    def clusterTreeObjects(self): #tree layer objects grouped into whole trees, objects under 32 pixels apart belong together
+        # Sort objects by position, the order clusters are found and drawn in
+        sortedObjects = sorted(self.tmxData.get_layer_by_name("tree"), key=lambda obj: (obj.y, obj.x))
+
+        # Bucket objects into 32 pixel cells, so neighbours are only looked for in the 3x3 cells around an object
+        cells = {}
+        for i, obj in enumerate(sortedObjects):
+            cells.setdefault((int(obj.x // 32), int(obj.y // 32)), []).append(i)
+
+        def isClose(a, b):
+            return ((a.x - b.x) ** 2 + (a.y - b.y) ** 2) ** 0.5 < 32  # 32 pixel radius
+
+        def neighbours(i):
+            obj = sortedObjects[i]
+            cellX, cellY = int(obj.x // 32), int(obj.y // 32)
+            for dy in (-1, 0, 1):
+                for dx in (-1, 0, 1):
+                    for j in cells.get((cellX + dx, cellY + dy), ()):
+                        if j != i and isClose(obj, sortedObjects[j]):
+                            yield j
+
         treeGroups = []
         usedObjects = set()
-        
-        # Sort objects by position to make clustering more efficient
-        sortedObjects = sorted(treeObjects, key=lambda obj: (obj.y, obj.x))
-        
-        for i, obj in enumerate(sortedObjects):
+        for i in range(len(sortedObjects)):
             if i in usedObjects:
                 continue
-                
-            # Start a new cluster with this object
-            currentCluster = [obj]
-            usedObjects.add(i)
-            
-            # Look for nearby objects (within 32 pixels)
+
+            # Every object reachable from this one in under 32 pixel steps
+            component = {i}
+            frontier = [i]
+            while frontier:
+                for j in neighbours(frontier.pop()):
+                    if j not in component:
+                        component.add(j)
+                        frontier.append(j)
+            usedObjects |= component
+
+            # Order the members the way growing the cluster pass by pass adds them, which is the order they are blitted in
+            members = sorted(component)
+            currentCluster = [sortedObjects[i]]
+            added = {i}
             clusterChanged = True
             while clusterChanged:
                 clusterChanged = False
-                for j, otherObj in enumerate(sortedObjects):
-                    if j in usedObjects:
+                for j in members:
+                    if j in added:
                         continue
-                    
-                    # Check if this object is close to any object in the current cluster
-                    for clusterObj in currentCluster:
-                        distance = ((clusterObj.x - otherObj.x) ** 2 + 
-                                (clusterObj.y - otherObj.y) ** 2) ** 0.5
-                        
-                        if distance < 32:  # 32 pixel radius
-                            currentCluster.append(otherObj)
-                            usedObjects.add(j)
-                            clusterChanged = True
-                            break
-            
+                    if any(isClose(clusterObj, sortedObjects[j]) for clusterObj in currentCluster):
+                        currentCluster.append(sortedObjects[j])
+                        added.add(j)
+                        clusterChanged = True
+
             # Only create trees from clusters that look like actual trees
             if 8 <= len(currentCluster) <= 16:
                 treeGroups.append(currentCluster)
-        
-        # Create tree sprites for each valid cluster
-        for cluster in treeGroups:
-            self.createTreeFromGroup(cluster)
-        
-        # Create rocks with proper collision
-        for obj in self.tmxData.get_layer_by_name("rock"):
-            scaled_surf = pygame.transform.scale(obj.image, (int(obj.image.get_width() * ZOOM_X), int(obj.image.get_height() * ZOOM_Y)))
-            # Create one sprite that handles both visibility and collision
-            rock = Generic((obj.x * ZOOM_X, obj.y * ZOOM_Y), scaled_surf, [self.allSprites, self.collisionSprites])
-            rock.breakable = True  # Mark rock as breakable
-                
+        return treeGroups
+
     def createTreeFromGroup(self, group):
         if not group:
             return
@@ -331,13 +363,16 @@ class Level:
             treeSurface.blit(obj.image, (xOffset, yOffset))
         
         # Scale the tree surface
-        scaled_tree_surface = pygame.transform.scale(treeSurface, (int(width * ZOOM_X), int(height * ZOOM_Y)))
+        scaled_tree_surface = scaleByZoom(treeSurface)
         
         # Create the tree sprite at the calculated center
+        self.addTree((centerX * ZOOM_X - (width * ZOOM_X) / 2, centerY * ZOOM_Y - (height * ZOOM_Y) / 2), scaled_tree_surface)
+
+    def addTree(self, pos, surface): #tree sprite plus its collider
         tree = Tree(
-            pos=(centerX * ZOOM_X - (width * ZOOM_X) / 2, centerY * ZOOM_Y - (height * ZOOM_Y) / 2),
-            surf=scaled_tree_surface,
-            groups=[self.allSprites, self.trees],
+            pos=pos,
+            surf=surface,
+            groups=[self.allSprites, self.trees, self.world],
             name='tree',
             playerAdded=self.playerAdded
         )
@@ -350,50 +385,99 @@ class Level:
         hitboxX = tree.rect.centerx - trunkWidth // 2
         hitboxY = tree.rect.centery - trunkHeight // 2
         
-        # Create hitbox sprite (invisible collision only)
-        hitboxSurf = pygame.Surface((trunkWidth, trunkHeight))
-        hitboxSurf.fill((0, 0, 0))
-        hitboxSurf.set_alpha(0)  # Completely invisible
-        
-        hitboxSprite = Generic(
-            (hitboxX, hitboxY),
-            hitboxSurf,
-            [self.collisionSprites],
-            z=LAYERS['main']
+        # Create hitbox collider (invisible, no surface)
+        hitboxRect = pygame.Rect(hitboxX, hitboxY, trunkWidth, trunkHeight)
+        hitboxSprite = Collider(
+            hitboxRect,
+            [self.collisionSprites, self.world],
+            hitbox=hitboxRect.inflate(-trunkWidth * 0.2, -trunkHeight * 0.75) #same footprint the old Generic hitbox had
         )
         tree.hitboxSprite = hitboxSprite
+        return tree
 
-    def run(self, deltaTime):
-        self.allSprites.update(deltaTime)
+    def scheduleSystems(self): #every entity is updated by exactly one system per tick
+        self.scheduler.add('input', 'shop', lambda deltaTime: self.shop.input(self.actions))
+        self.scheduler.add('input', 'inventory', lambda deltaTime: self.player.inventory.input(self.actions))
+        self.scheduler.add('input', 'player', lambda deltaTime: self.player.input())
+        self.scheduler.add('input', 'saving', self.saveInput)
+        self.scheduler.add('simulation', 'player', self.player.update)
+        self.scheduler.add('simulation', 'growth', self.updateGrowth)
+        self.scheduler.add('simulation', 'particles', self.particles.update)
+        self.scheduler.add('simulation', 'chopping', self.updateChopping)
+        self.scheduler.add('time', 'clock', self.updateClock)
+        self.scheduler.add('spawn', 'expiry', self.updateExpiry)
+        if PICKUP_MAGNET_RADIUS > 0:
+            self.scheduler.add('spawn', 'magnet', self.attractItems)
+        self.scheduler.add('render', 'world', lambda alpha: self.allSprites.customisedDraw(self.player, alpha)) #draw with camera
+        self.scheduler.add('render', 'overlay', lambda alpha: self.overlay.display())
+        self.scheduler.add('render', 'clock', lambda alpha: self.time.draw()) # Draw time overlay
+        self.scheduler.add('render', 'inventory', lambda alpha: self.player.inventory.draw(self.displaySurface))
+        self.scheduler.add('render', 'shop', lambda alpha: self.shop.draw())
 
+    def update(self, deltaTime): #one fixed simulation step, deltaTime in seconds
+        self.scheduler.tick(deltaTime)
+        self.actions.clearEdges() #presses are seen by exactly one tick
+
+    def saveInput(self, deltaTime):
+        if self.actions.wasPressed('save'):
+            self.saveSystem.saveGame()
+        if self.actions.wasPressed('load'):
+            self.saveSystem.loadGame()
+
+    def updateGrowth(self, deltaTime):
+        for crop in self.world.store('growable'):
+            crop.update(deltaTime)
+
+    def updateChopping(self, deltaTime):
+        if self.player.selectedTool == 'axe' and self.player.timers['tool use'].active:
+            for tree in self.query(self.player.rect, kind='tree'): #only trees the player is touching
+                tree.chop(self.particles, self.allSprites, self.player)
+
+    def updateClock(self, deltaTime):
         shouldAutoSave = self.time.update(deltaTime)
         if shouldAutoSave:
-            print("Auto-saving game...")
+            saveLog.info("Auto-saving game...")
             self.saveSystem.saveGame()
 
-        self.time.update(deltaTime)  # Update time system
-        self.crops.update(deltaTime)
-        self.particles.update(deltaTime)
-        self.trees.update(deltaTime)
-        self.itemsGroup.update(deltaTime)
+    def updateExpiry(self, deltaTime): #remove sprites whose lifetime has run out
+        for sprite in self.world.store('expiring'):
+            sprite.update(deltaTime)
 
-        keys = pygame.key.get_pressed() #get key states
-        for sprite in [s for s in self.allSprites if getattr(s, 'pickup', False)]: #only items that can be picked up
-            if self.player.rect.colliderect(sprite.rect) and keys[pygame.K_f]: #player touching item and pressing F
-                added = self.player.inventory.addItem(sprite.pickupKey, 1, getattr(sprite, 'icon', None)) #add to inventory
-                if added:
-                    sprite.kill()
+    def dropItem(self, itemKey, pos, count=1): #spawn a ground item, merging it into a nearby stack of the same kind
+        for stack in self.itemsGroup.near(pos, ITEM_STACK_RADIUS):
+            if stack.pickupKey == itemKey:
+                stack.count += count
+                return stack
 
-        if keys[pygame.K_F5]: #save game
-            self.saveSystem.saveGame()
-        if keys[pygame.K_F9]: #load game
-            self.saveSystem.loadGame()
+        if len(self.itemsGroup) >= GROUND_ITEM_LIMIT: #too many stacks, merge into the closest one anywhere
+            sameKind = [item for item in self.itemsGroup if item.pickupKey == itemKey]
+            if sameKind:
+                stack = self.closestTo(sameKind, pygame.Rect(pos, (0, 0)))
+                stack.count += count
+                return stack
+
+        surf = self.woodSurf if itemKey == 'wood' else self.stoneSurf
+        return self.itemPools[itemKey].acquire(pos, surf, [self.allSprites, self.itemsGroup, self.world], count)
 
-        self.allSprites.customisedDraw(self.player) #draw with camera
-        self.overlay.display()
-        self.time.draw()  # Draw time overlay
-        self.player.inventory.draw(self.displaySurface)
-        self.shop.draw()
+    def poolStats(self): #hit/miss counters for every sprite pool
+        return [pool.stats() for pool in [self.particlePool, *self.itemPools.values()]]
+
+    def collectItem(self, item): #move a ground item stack into the inventory
+        added = self.player.inventory.addItem(item.pickupKey, item.count, item.icon) #add to inventory
+        if added:
+            item.kill()
+        return added
+
+    def attractItems(self, deltaTime): #pull nearby items towards the player and collect them on contact
+        playerCenter = self.player.rect.center
+        for item in self.itemsGroup.near(playerCenter, PICKUP_MAGNET_RADIUS):
+            if item.rect.colliderect(self.player.hitbox):
+                self.collectItem(item)
+            else:
+                self.itemsGroup.pull(item, playerCenter, PICKUP_MAGNET_SPEED * deltaTime)
+
+    def draw(self, alpha=1.0): #alpha is how far we are between the last two sim steps
+        self.scheduler.render(alpha)
 
 class CameraGroup(pygame.sprite.Group):
     def __init__(self):
@@ -401,13 +485,39 @@ class CameraGroup(pygame.sprite.Group):
         self.mapRect = pygame.Rect(0, 0, 0, 0) #to be set later
         self.offset = pygame.math.Vector2(0, 0) #camera offset
         self.displaySurface = pygame.display.get_surface() #main display surface
+        self.ground = None #chunked ground layer, drawn under every sprite
+
+        # world is drawn at the internal resolution and upscaled once per frame
+        if RENDER_SCALE == 1:
+            self.renderSurface = self.displaySurface #no target needed at 1x
+        else:
+            self.renderSurface = pygame.Surface((INTERNAL_WIDTH, INTERNAL_HEIGHT)).convert()
+        self.blitTarget = self.renderSurface #what the ground and sprites are drawn through, the debug HUD swaps in a counting proxy
 
-    def customisedDraw(self, player):
-        self.offset.x = player.rect.centerx - SCREEN_WIDTH / 2 #center camera on player
-        self.offset.y = player.rect.centery - SCREEN_HEIGHT / 2 #center camera on player
-        self.offset.x = max(0, min(self.offset.x, self.mapRect.width - SCREEN_WIDTH)) #clamp to map boundaries
-        self.offset.y = max(0, min(self.offset.y, self.mapRect.height - SCREEN_HEIGHT)) #clamp to map boundaries
+    def add_internal(self, sprite, *args): #colliders have nothing to draw
+        if isinstance(sprite, Collider):
+            raise TypeError("Collider sprites have no image and cannot join the render group")
+        super().add_internal(sprite, *args)
+
+    def customisedDraw(self, player, alpha=1.0):
+        cameraCenter = pygame.math.Vector2(player.rect.center) + self.interpolation(player, alpha)
+        self.offset.x = cameraCenter.x - INTERNAL_WIDTH / 2 #center camera on player
+        self.offset.y = cameraCenter.y - INTERNAL_HEIGHT / 2 #center camera on player
+        self.offset.x = max(0, min(self.offset.x, self.mapRect.width - INTERNAL_WIDTH)) #clamp to map boundaries
+        self.offset.y = max(0, min(self.offset.y, self.mapRect.height - INTERNAL_HEIGHT)) #clamp to map boundaries
         
+        if self.ground:
+            self.ground.draw(self.blitTarget, self.offset)
+
         for sprite in sorted(self.sprites(), key=lambda spr: spr.z): #draw in order of z
-            offsetPos = sprite.rect.topleft - self.offset #apply offset
-            self.displaySurface.blit(sprite.image, offsetPos) #draw sprite
\ No newline at end of file
+            offsetPos = sprite.rect.topleft - self.offset + self.interpolation(sprite, alpha) #apply offset
+            self.blitTarget.blit(sprite.image, offsetPos) #draw sprite
+
+        if self.renderSurface is not self.displaySurface:
+            # nearest-neighbour integer upscale straight into the display, no temporary surface
+            pygame.transform.scale(self.renderSurface, self.displaySurface.get_size(), self.displaySurface)
+
+    def interpolation(self, sprite, alpha): #how far to pull a moving sprite back towards its last step
+        if not sprite.moving: #static sprites have no previous position
+            return pygame.math.Vector2()
+        return (sprite.previousPos - sprite.pos) * (1 - alpha)
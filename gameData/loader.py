@@ -0,0 +1,99 @@
+#asset loader: worker threads decode image files, the main thread converts them for the display
+#pygame lets go of the GIL while it decodes, but convert_alpha needs the display so it never leaves the main thread
+import os
+from concurrent.futures import ThreadPoolExecutor
+import pygame
+from pytmx.util_pygame import handle_transformation, smart_convert
+from settings import LOADER_WORKERS, STARTUP_ASSETS, ATLAS_DIR, ATLAS_SHEETS
+
+def normalisePath(path): #one spelling per file, so 'graphics\\items\\wood.png' and 'graphics/items/wood.png' match
+    return os.path.normpath(path).replace(os.sep, '/')
+
+def startupAssets(): #everything worth decoding before the first Level is built
+    return [f"{ATLAS_DIR}/{name}.png" for name in ATLAS_SHEETS] + STARTUP_ASSETS
+
+class AssetLoader:
+    def __init__(self, workers=LOADER_WORKERS):
+        self.workers = workers
+        self.executor = None #started by the first queue, so importing the module starts no threads
+        self.pending = {} #path -> future of the decoded, not yet converted surface
+        self.images = {} #path -> converted surface
+        self.errors = {} #path -> exception its decode raised, handed to the next get
+        self.queued = 0 #paths queued since the last time everything finished, for progress
+
+    def queue(self, paths): #start decoding in the background, paths already loaded or loading are skipped
+        if not self.pending:
+            self.queued = 0
+        for path in paths:
+            key = normalisePath(path)
+            if key in self.images or key in self.pending:
+                continue
+            if self.executor is None:
+                self.executor = ThreadPoolExecutor(self.workers, thread_name_prefix='assetLoader')
+            self.pending[key] = self.executor.submit(pygame.image.load, key)
+            self.queued += 1
+
+    def finish(self, key, future): #main thread only, blocks if the decode hasn't finished
+        del self.pending[key]
+        try:
+            self.images[key] = future.result().convert_alpha()
+        except Exception as error:
+            self.errors[key] = error
+
+    def poll(self, budget=None): #convert decodes that have finished, stopping after budget ms, returns how many
+        start = pygame.time.get_ticks()
+        finished = 0
+        for key, future in list(self.pending.items()):
+            if future.done():
+                self.finish(key, future)
+                finished += 1
+                if budget is not None and pygame.time.get_ticks() - start >= budget:
+                    break
+        return finished
+
+    def progress(self): #0 to 1 over the paths queued so far
+        if not self.queued:
+            return 1.0
+        return (self.queued - len(self.pending)) / self.queued
+
+    def done(self):
+        return not self.pending
+
+    def get(self, path): #converted surface, waits only for this file if it is still decoding
+        key = normalisePath(path)
+        image = self.images.get(key)
+        if image is not None:
+            return image
+        future = self.pending.get(key)
+        if future is not None:
+            self.finish(key, future)
+        elif key not in self.errors:
+            self.images[key] = pygame.image.load(key).convert_alpha() #never queued, load it here
+        if key in self.errors:
+            raise self.errors.pop(key) #the next get tries the file again
+        return self.images[key]
+
+    def release(self, path): #drop a surface only one caller needed, e.g. after it has been scaled
+        self.images.pop(normalisePath(path), None)
+
+    def shutdown(self): #drop queued decodes and wait for running ones, before pygame.quit
+        if self.executor is not None:
+            self.executor.shutdown(wait=True, cancel_futures=True)
+            self.executor = None
+        self.pending.clear()
+
+defaultLoader = AssetLoader()
+
+def tmxImageLoader(filename, colorkey, **kwargs): #pytmx image_loader, same as pytmx's own but the tileset comes from the loader
+    if colorkey:
+        colorkey = pygame.Color(f"#{colorkey}")
+    pixelalpha = kwargs.get('pixelalpha', True)
+    image = defaultLoader.get(filename)
+
+    def loadTile(rect=None, flags=None):
+        tile = image.subsurface(rect) if rect else image.copy()
+        if flags:
+            tile = handle_transformation(tile, flags)
+        return smart_convert(tile, colorkey, pixelalpha)
+
+    return loadTile
@@ -1,284 +1,246 @@
-import pygame
+import time
+launchTime = time.perf_counter()  # Before the heavy imports, so time-to-first-frame covers them
 import sys
-from settings import SCREEN_WIDTH, SCREEN_HEIGHT, ZOOM_X, ZOOM_Y, TIME_RATE
+from profiler import startupProfile, FrameProfiler
+if '--profile-startup' in sys.argv:
+    startupProfile.start(launchTime)  # Times every import from here on
+import pygame
+from settings import SCREEN_WIDTH, SCREEN_HEIGHT, ZOOM_X, ZOOM_Y, TIME_RATE, SIM_STEP, MAX_FRAME_TIME, RENDER_FPS, VSYNC, LOADER_POLL_BUDGET, PROFILE_DIR, PROFILE_FRAMES, PROFILE_TOP
 from level import Level
 from inventory import Inventory
+from ui import Button, MenuScreen, LoadingScreen
+from loader import defaultLoader, startupAssets
+from saveSystem import SaveSystem
+from eventLog import eventLog
+from telemetry import FrameTelemetry
+from debugHud import DebugHud
+from memoryDiagnostics import MemoryDiagnostics, startTracing
 
 class MainGame:
     def __init__(self):
+        if startupProfile.enabled:
+            startupProfile.instrumentLoader(defaultLoader)  # Asset loads timed by category
         pygame.init()  # Initialize Pygame
+        eventLog.start()  # Events are written by a background thread, never from the frame loop
 
-        self.windowScreen = pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT))
+        if VSYNC:
+            # pygame only honours vsync on SCALED or OPENGL displays
+            self.windowScreen = pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT), pygame.SCALED, vsync=1)
+        else:
+            self.windowScreen = pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT))
         self.clock = pygame.time.Clock()
         pygame.display.set_caption("Witherford")  # Game title
 
-        self.level = Level()
+        # Decode the background first and everything the world needs behind it, on worker threads
+        backgroundPath = "graphics/background/0.png"
+        defaultLoader.queue([backgroundPath] + startupAssets())
 
-        # Load and scale background image
-        self.backgroundImage = pygame.image.load("graphics/background/0.png").convert_alpha()
-        self.backgroundImage = pygame.transform.scale(self.backgroundImage, (SCREEN_WIDTH, SCREEN_HEIGHT))
+        # Load and scale background image, waiting only for this one file
+        self.backgroundImage = pygame.transform.scale(defaultLoader.get(backgroundPath), (SCREEN_WIDTH, SCREEN_HEIGHT))
+        defaultLoader.release(backgroundPath)  # Only the scaled copy is kept
 
         # Load fonts
         self.font = pygame.font.Font("assets/fonts/Pixellari.ttf", 120)
         self.smallFont = pygame.font.Font("assets/fonts/Pixellari.ttf", 40)
 
-    def menu(self):
-        while True:
-            self.windowScreen.blit(self.backgroundImage, (0, 0))
-
-            # Title
-            titleText = self.font.render("Witherford", True, (255, 255, 255)) #renders the title text
-            self.windowScreen.blit(titleText, (SCREEN_WIDTH // 2 - titleText.get_width() // 2, SCREEN_HEIGHT // 4 - titleText.get_height() // 2))
-            mousePos = pygame.mouse.get_pos()
-            
-            # Buttons
-            choice = self.drawButton("New Game", SCREEN_HEIGHT // 2 - 60, mousePos, highlightColor=(150, 200, 255), defaultColor=(100, 149, 245))
-            if choice == "clicked":
-                return self.newGameMenu()
-
-            choice = self.drawButton("Load Game", SCREEN_HEIGHT // 2, mousePos, highlightColor=(150, 200, 255), defaultColor=(100, 149, 245))
-            if choice == "clicked":
-                return self.loadGameMenu()
-
-            choice = self.drawButton("Press Escape to Exit", SCREEN_HEIGHT // 2 + 60, mousePos, highlightColor=(255, 100, 100), defaultColor=(200, 60, 60))
-            if choice == "clicked":
-                pygame.quit()
-                sys.exit()
-
-            # Event handling
-            for event in pygame.event.get():
-                if event.type == pygame.QUIT:
-                    pygame.quit()
-                    sys.exit()
-                elif event.type == pygame.KEYDOWN:
-                    if event.key == pygame.K_ESCAPE:
-                        pygame.quit()
-                        sys.exit()
-                elif event.type == pygame.MOUSEBUTTONDOWN:
-                    if self.checkButtonClick("New Game", SCREEN_HEIGHT // 2 - 60, mousePos):
-                        return self.newGameMenu()
-                    elif self.checkButtonClick("Load Game", SCREEN_HEIGHT // 2, mousePos):
-                        return self.loadGameMenu()
-                    elif self.checkButtonClick("Press Escape to Exit", SCREEN_HEIGHT // 2 + 60, mousePos):
-                        pygame.quit()
-                        sys.exit()
-
-            pygame.display.update()
-            self.clock.tick(60)
-
-    def newGameMenu(self):
-        while True:
-            self.windowScreen.blit(self.backgroundImage, (0, 0))
-
-            # Title
-            titleText = self.font.render("New Game", True, (255, 255, 255))
-            self.windowScreen.blit(titleText,
-                (SCREEN_WIDTH // 2 - titleText.get_width() // 2,
-                 SCREEN_HEIGHT // 6),
-            )
-
-            mousePos = pygame.mouse.get_pos()
-            slotsInfo = self.level.saveSystem.getSaveSlotsInfo()
-
-            # Draw save slots
-            slotButtons = []
-            for i, slotInfo in enumerate(slotsInfo):
-                yPos = SCREEN_HEIGHT // 3 + i * 80
-                
-                if slotInfo['exists']:
-                    slotText = f"Slot {slotInfo['slot']}: Day {slotInfo.get('dayCount', 1)} - {slotInfo.get('season', 'Spring')}"
-                    buttonColor = (200, 200, 100)  # Yellow for existing save
-                else:
-                    slotText = f"Slot {slotInfo['slot']}: Empty"
-                    buttonColor = (100, 149, 245)  # Blue for empty slot
-
-                choice = self.drawButton(slotText, yPos, mousePos, highlightColor=(150, 200, 255), defaultColor=buttonColor)
-                
-                if choice == "clicked":
-                    # Start new game in this slot (overwrite if exists)
-                    self.level.saveSystem.currentSlot = slotInfo['slot']
-                    return "new"
-
-                slotButtons.append((slotText, yPos))
-
-            # Back button
-            choice = self.drawButton("Back", SCREEN_HEIGHT - 100, mousePos, highlightColor=(255, 150, 150), defaultColor=(200, 100, 100))
-            if choice == "clicked":
-                return "back"
-
-            # Event handling
-            for event in pygame.event.get():
-                if event.type == pygame.QUIT:
-                    pygame.quit()
-                    sys.exit()
-                elif event.type == pygame.KEYDOWN:
-                    if event.key == pygame.K_ESCAPE:
-                        return "back"
-                elif event.type == pygame.MOUSEBUTTONDOWN:
-                    for slotText, yPos in slotButtons:
-                        if self.checkButtonClick(slotText, yPos, mousePos):
-                            slotNum = int(slotText.split(":")[0].split(" ")[1])
-                            self.level.saveSystem.currentSlot = slotNum
-                            return "new"
-                    
-                    if self.checkButtonClick("Back", SCREEN_HEIGHT - 100, mousePos):
-                        return "back"
-
+        self.mainMenu = self.buildMainMenu() #static, so built once
+        self.loadingScreen = LoadingScreen(self.backgroundImage, self.smallFont)
+        self.saveSystem = SaveSystem()  # Slot index only, the menus never need the world
+        self.level = None  # Built once a slot is picked, see getLevel
+        self.firstFrames = {}  # 'menu' -> seconds from launch to its first frame, 'game' -> seconds from picking a slot
+        self.slotPickedTime = None
+
+    def markFirstFrame(self, name, since=launchTime):
+        if name not in self.firstFrames:
+            self.firstFrames[name] = time.perf_counter() - since
+            eventLog.category('startup').info("Time to first %s frame: %.3fs", name, self.firstFrames[name])
+
+    def streamAssets(self, surface): # Menu idle callback: converts finished decodes and draws the progress strip
+        self.markFirstFrame('menu')  # The menu has drawn itself before its first idle call
+        defaultLoader.poll(LOADER_POLL_BUDGET)
+        if defaultLoader.done():
+            pygame.display.update(self.loadingScreen.clearBar(surface))
+            return False
+        pygame.display.update(self.loadingScreen.drawBar(surface, defaultLoader.progress()))
+        return True
+
+    def getLevel(self): # Finishes loading behind a progress screen the first time, later calls reuse the warm Level
+        if self.level is None:
+            if not self.loadingScreen.run(self.windowScreen, defaultLoader, LOADER_POLL_BUDGET):
+                self.quit()
+            self.loadingScreen.draw(self.windowScreen, 1.0, "Building world")
+            with startupProfile.section('level'):
+                self.level = Level()
+        return self.level
+
+    def profileStartup(self): # --profile-startup: launch to first game frame with no input, then report and exit
+        with startupProfile.section('streamAssets'):
+            self.loadingScreen.run(self.windowScreen, defaultLoader, LOADER_POLL_BUDGET)
+        level = self.getLevel()
+        with startupProfile.section('firstFrame'):
+            level.draw(0.0)
             pygame.display.update()
-            self.clock.tick(60)
-
-    def loadGameMenu(self):
-        while True:
-            self.windowScreen.blit(self.backgroundImage, (0, 0))
-
-            # Title
-            titleText = self.font.render("Load Game", True, (255, 255, 255))
-            self.windowScreen.blit(
-                titleText,
-                (SCREEN_WIDTH // 2 - titleText.get_width() // 2,
-                 SCREEN_HEIGHT // 6),
-            )
-
-            mousePos = pygame.mouse.get_pos()
-            slotsInfo = self.level.saveSystem.getSaveSlotsInfo()
-
-            # Draw save slots (only existing ones)
-            slotButtons = []
-            validSlots = [slot for slot in slotsInfo if slot['exists']]
-            
-            if not validSlots:
-                # No save files message
-                noSavesText = self.smallFont.render("No save files found!", True, (255, 255, 255))
-                self.windowScreen.blit(noSavesText, (SCREEN_WIDTH // 2 - noSavesText.get_width() // 2, SCREEN_HEIGHT // 2))
-
-            for i, slotInfo in enumerate(validSlots):
-                yPos = SCREEN_HEIGHT // 3 + i * 80
+        startupProfile.stop()
+        print(startupProfile.report())
+        print("Folded stacks written to", startupProfile.writeFolded(f"{PROFILE_DIR}/startup.folded"))
+        self.quit()
+
+    def saveTag(self): # Names exported files after the slot and day they came from
+        return f"slot{self.level.saveSystem.currentSlot}-day{self.level.time.dayCount}"
+
+    def telemetryInput(self, deltaTime): # Level input system, so the export key goes through the action map like any other
+        if self.level.actions.wasPressed('exportTelemetry'):
+            framesPath, summaryPath = self.telemetry.exportCsv(tag=self.saveTag())
+            eventLog.category('telemetry').info("Exported %d frames to %s and %s\n%s", len(self.telemetry.rows), framesPath, summaryPath, self.telemetry.report())
+
+    def frameProfilerInput(self, deltaTime):
+        if self.level.actions.wasPressed('profileFrames'):
+            self.frameProfiler.request()
+
+    def quit(self):
+        defaultLoader.shutdown()  # Worker threads must not outlive pygame
+        eventLog.stop()  # Writes whatever is still buffered
+        pygame.quit()
+        sys.exit()
+
+    def buildMainMenu(self):
+        screen = MenuScreen(self.backgroundImage, escapeValue='quit')
+        screen.addTitle("Witherford", self.font, SCREEN_HEIGHT // 4 - self.font.get_height() // 2)
+        screen.addButton(Button("New Game", self.smallFont, (SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2 - 60), (100, 149, 245), (150, 200, 255), value='new'))
+        screen.addButton(Button("Load Game", self.smallFont, (SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2), (100, 149, 245), (150, 200, 255), value='load'))
+        screen.addButton(Button("Press Escape to Exit", self.smallFont, (SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2 + 60), (200, 60, 60), (255, 100, 100), value='quit'))
+        return screen
+
+    def buildSlotMenu(self, title, slotsInfo, existingColor, emptyColor=None):
+        screen = MenuScreen(self.backgroundImage, escapeValue='back')
+        screen.addTitle(title, self.font, SCREEN_HEIGHT // 6)
+
+        for i, slotInfo in enumerate(slotsInfo):
+            yPos = SCREEN_HEIGHT // 3 + i * 80
+            if slotInfo['exists']:
                 slotText = f"Slot {slotInfo['slot']}: Day {slotInfo.get('dayCount', 1)} - {slotInfo.get('season', 'Spring')}"
+                buttonColor = existingColor
+            else:
+                slotText = f"Slot {slotInfo['slot']}: Empty"
+                buttonColor = emptyColor
+            screen.addButton(Button(slotText, self.smallFont, (SCREEN_WIDTH // 2, yPos), buttonColor, (150, 200, 255), value=slotInfo['slot']))
 
-                choice = self.drawButton(slotText, yPos, mousePos, highlightColor=(150, 200, 255), defaultColor=(100, 200, 100))
-                
-                if choice == "clicked":
-                    # Load game from this slot
-                    if self.level.saveSystem.loadGame(slotInfo['slot']):
-                        return "load"
-                    else:
-                        print(f"Failed to load slot {slotInfo['slot']}")
-
-                slotButtons.append((slotText, yPos))
-
-            # Back button
-            choice = self.drawButton("Back", SCREEN_HEIGHT - 100, mousePos, highlightColor=(255, 150, 150), defaultColor=(200, 100, 100))
-            if choice == "clicked":
-                return "back"
-
-            # Event handling
-            for event in pygame.event.get():
-                if event.type == pygame.QUIT:
-                    pygame.quit()
-                    sys.exit()
-                elif event.type == pygame.KEYDOWN:
-                    if event.key == pygame.K_ESCAPE:
-                        return "back"
-                elif event.type == pygame.MOUSEBUTTONDOWN:
-                    for slotText, yPos in slotButtons:
-                        if self.checkButtonClick(slotText, yPos, mousePos):
-                            slotNum = int(slotText.split(":")[0].split(" ")[1])
-                            if self.level.saveSystem.loadGame(slotNum):
-                                return "load"
-                    
-                    if self.checkButtonClick("Back", SCREEN_HEIGHT - 100, mousePos):
-                        return "back"
-
-            pygame.display.update()
-            self.clock.tick(60)
-
-    def drawButton(self, text, yPos, mousePos, highlightColor, defaultColor):
-        buttonText = self.smallFont.render(text, True, (255, 255, 255))
-        buttonRect = buttonText.get_rect(center=(SCREEN_WIDTH // 2, yPos))
+        screen.addButton(Button("Back", self.smallFont, (SCREEN_WIDTH // 2, SCREEN_HEIGHT - 100), (200, 100, 100), (255, 150, 150), value='back'))
+        return screen
 
-        if buttonRect.collidepoint(mousePos):
-            pygame.draw.rect(self.windowScreen, highlightColor, buttonRect.inflate(20, 10))
-            return "hover"
-        else:
-            pygame.draw.rect(self.windowScreen, defaultColor, buttonRect.inflate(20, 10))
+    def menu(self):
+        while True:
+            choice = self.mainMenu.run(self.windowScreen, idle=self.streamAssets)
+            if choice == 'quit':
+                self.quit()
+            elif choice == 'new':
+                result = self.newGameMenu()
+            else:
+                result = self.loadGameMenu()
+
+            if result == 'quit':
+                self.quit()
+            if result != 'back':
+                return result
 
-        self.windowScreen.blit(buttonText, buttonRect)
-        return "idle"
+    def newGameMenu(self):
+        slotsInfo = self.saveSystem.getSaveSlotsInfo() #read once per visit, not per frame
+        screen = self.buildSlotMenu("New Game", slotsInfo, existingColor=(200, 200, 100), emptyColor=(100, 149, 245))
+        choice = screen.run(self.windowScreen)
+        if choice in ('back', 'quit'):
+            return choice
+        return ("new", choice)  # Start new game in this slot (overwrite if exists)
 
-    def checkButtonClick(self, text, yPos, mousePos):
-        buttonText = self.smallFont.render(text, True, (255, 255, 255))
-        buttonRect = buttonText.get_rect(center=(SCREEN_WIDTH // 2, yPos))
-        return buttonRect.collidepoint(mousePos)
+    def loadGameMenu(self):
+        slotsInfo = self.saveSystem.getSaveSlotsInfo()
+        validSlots = [slot for slot in slotsInfo if slot['exists']]
+        screen = self.buildSlotMenu("Load Game", validSlots, existingColor=(100, 200, 100))
+        if not validSlots:
+            screen.addLabel("No save files found!", self.smallFont, (SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2))
+
+        choice = screen.run(self.windowScreen)
+        if choice in ('back', 'quit'):
+            return choice
+        return ("load", choice)
+
+    def startGame(self, mode, slot): # Builds or reuses the Level and puts the chosen slot in it, False if the save failed to load
+        self.slotPickedTime = time.perf_counter()
+        level = self.getLevel()
+        if mode == "load":
+            return level.saveSystem.loadGame(slot)
+
+        # New game: reset the game state
+        level.saveSystem.currentSlot = slot
+        # Reset player to default position and state
+        level.player.setPosition((400 * ZOOM_X, 300 * ZOOM_Y))
+        level.player.money = 100
+        level.player.inventory.items = []
+        level.time.currentTime = 6 * TIME_RATE  # 6:00 AM
+        level.time.dayCount = 1
+        level.time.season = 'spring'
+        # Clear farm objects for fresh start
+        level.saveSystem.clearFarmObjects()
+        return True
 
     def run(self):
-        menuChoice = self.menu()  # Show menu first and get choice
+        while True:
+            mode, slot = self.menu()  # Show menu first and get choice
+            if self.startGame(mode, slot):
+                break
+            eventLog.category('save').warning("Failed to load slot %s", slot)
         running = True
-        
-        # If new game was chosen, reset the game state
-        if menuChoice == "new":
-            # Reset player to default position and state
-            self.level.player.rect.center = (400 * ZOOM_X, 300 * ZOOM_Y)
-            self.level.player.money = 100
-            self.level.player.inventory.items = []
-            self.level.time.currentTime = 6 * TIME_RATE  # 6:00 AM
-            self.level.time.dayCount = 1
-            self.level.time.season = 'spring'
-            # Clear farm objects for fresh start
-            self.level.saveSystem.clearFarmObjects()
 
+        self.debugHud = DebugHud(self.level)
+        self.level.scheduler.add('input', 'telemetry', self.telemetryInput)
+        self.level.scheduler.add('input', 'debugHud', self.debugHud.input)
+        self.level.scheduler.add('render', 'debugHud', self.debugHud.draw)  # Last, over the overlay, inventory and shop
+        self.telemetry = FrameTelemetry(self.level.scheduler)  # After every system is scheduled, they become its columns
+        self.debugHud.telemetry = self.telemetry
+        self.frameProfiler = FrameProfiler(PROFILE_FRAMES, PROFILE_TOP, PROFILE_DIR)
+        self.frameProfiler.installSignal()
+        self.level.scheduler.add('input', 'frameProfiler', self.frameProfilerInput)
+        if '--trace-memory' in sys.argv:
+            startTracing()  # After the Level is built, growth during play is what the snapshots are after
+            self.memory = MemoryDiagnostics(self.level)
+            self.memory.take()  # Baseline for the first day boundary
+            self.level.time.dayListeners.append(lambda day: self.memory.dayStarted(self.saveTag()))
+        self.level.actions.releaseAll()  # The menus swallowed any key-up events
+        accumulator = 0.0  # Real time not yet simulated
+        self.clock.tick()  # Don't count time spent in the menus
         while running:
+            self.frameProfiler.beginFrame()  # Starts a capture the hotkey or SIGUSR1 asked for
+            frameStart = time.perf_counter()
             for event in pygame.event.get():
                 if event.type == pygame.QUIT:
                     running = False
-                    sys.exit()
-
-                # Save/Load controls
-                if event.type == pygame.KEYDOWN:
-                    if event.key == pygame.K_F5:
-                        self.level.saveSystem.saveGame()
-                    elif event.key == pygame.K_F9:
-                        self.level.saveSystem.loadGame()
-                        
-                # Inventory controls  
-                if event.type == pygame.KEYDOWN:
-                    if event.key == pygame.K_i:
-                        self.level.player.inventory.toggle()
-                    elif event.key == pygame.K_e:
-                        self.level.player.inventory.selectNext()
-                    elif event.key == pygame.K_q:
-                        self.level.player.inventory.selectPrev()
-                    elif event.key == pygame.K_b:  # Shop control
-                        self.level.shop.toggle()
-                    
-                    # Shop navigation (only if shop is visible)
-                    if self.level.shop.visible:
-                        if event.key == pygame.K_w:
-                            self.level.shop.selectPrev()
-                        elif event.key == pygame.K_s:
-                            self.level.shop.selectNext()
-                        elif event.key == pygame.K_TAB:
-                            self.level.shop.switchMode()
-                        elif event.key == pygame.K_SPACE:
-                            if self.level.shop.mode == 'buy':
-                                self.level.shop.buyItem()
-                            else:
-                                self.level.shop.sellItem()
-                        elif event.key == pygame.K_ESCAPE:
-                            self.level.shop.visible = False
-
-            deltaTime = self.clock.tick(100) / 1000.0  # Frame delta in seconds
-            self.level.run(deltaTime)
-
-            # Handle tree chopping
-            for tree in self.level.trees:
-                if self.level.player.selectedTool == 'axe' and getattr(self.level.player, 'timers', None):
-                    if self.level.player.timers['tool use'].active and self.level.player.rect.colliderect(tree.rect):
-                        tree.chop(self.level.particles, self.level.allSprites, self.level.player)
-
-            self.level.player.inventory.draw(self.windowScreen)
+                    self.quit()
+
+                self.level.actions.handleEvent(event) # Player, shop, inventory and saving read the actions during the next tick
+
+            # Fixed-timestep simulation: the sim always advances in SIM_STEP slices,
+            # however long the frame took, and rendering interpolates between steps
+            tickStart = time.perf_counter()
+            frameTime = min(self.clock.tick(RENDER_FPS) / 1000.0, MAX_FRAME_TIME)  # Frame delta in seconds
+            frameStart += time.perf_counter() - tickStart  # Waiting for the frame cap isn't frame work
+            accumulator += frameTime
+            ticks = 0
+            while accumulator >= SIM_STEP:
+                self.level.update(SIM_STEP)
+                accumulator -= SIM_STEP
+                ticks += 1
+
+            self.level.draw(accumulator / SIM_STEP)
+            displayStart = time.perf_counter()
             pygame.display.update()
-
+            self.telemetry.endFrame(frameStart, frameTime, time.perf_counter() - displayStart, ticks)
+            captured = self.frameProfiler.endFrame(self.saveTag())
+            if captured:
+                eventLog.category('profile').info("Profiled %d frames to %s and %s", PROFILE_FRAMES, *captured)
+            self.markFirstFrame('game', self.slotPickedTime)
 
 if __name__ == "__main__":
-    game = MainGame()
+    with startupProfile.section('menu'):
+        game = MainGame()
+    if startupProfile.enabled:
+        game.profileStartup()
     game.run()
\ No newline at end of file
@@ -0,0 +1,160 @@
+#memory diagnostics: python main.py --trace-memory
+#a tracemalloc snapshot at every day boundary, diffed against the last one by sprite class, surface allocation site and Python allocation site
+#surface pixels are allocated by SDL, outside tracemalloc, so surfaces are walked and sized directly and grouped by where their Surface object was made
+import gc
+import os
+import time
+import tracemalloc
+from collections import deque
+import pygame
+from settings import MEMORY_TRACE_FRAMES, MEMORY_TOP, MEMORY_TREND_DAYS, PROFILE_DIR
+from profiler import liveSurfaces, surfaceBytes
+from eventLog import eventLog
+
+memoryLog = eventLog.category('memory')
+
+SNAPSHOT_FILTERS = (
+    tracemalloc.Filter(False, tracemalloc.__file__), #the snapshots' own bookkeeping
+    tracemalloc.Filter(False, '<frozen importlib._bootstrap>'),
+    tracemalloc.Filter(False, '<frozen importlib._bootstrap_external>'),
+    tracemalloc.Filter(False, '<unknown>')
+)
+
+def startTracing(frames=MEMORY_TRACE_FRAMES): #only what is allocated from here on gets a site, which is what growth is made of
+    if not tracemalloc.is_tracing():
+        tracemalloc.start(frames)
+
+def allocationSite(obj): #'sprites.py:352' for the innermost frame that created obj
+    traceback = tracemalloc.get_object_traceback(obj)
+    if traceback is None:
+        return '(before tracing)'
+    frame = traceback[-1]
+    return f"{os.path.basename(frame.filename)}:{frame.lineno}"
+
+def spriteCensus(pooled): #class name -> [live instances, instances in no group], pooled ones are detached on purpose
+    census = {}
+    for obj in gc.get_objects():
+        if isinstance(obj, pygame.sprite.Sprite):
+            entry = census.setdefault(type(obj).__name__, [0, 0])
+            entry[0] += 1
+            if not obj.groups() and id(obj) not in pooled:
+                entry[1] += 1
+    return census
+
+def surfaceSites(): #allocation site -> [surfaces, pixel bytes]
+    sites = {}
+    for surface in liveSurfaces():
+        entry = sites.setdefault(allocationSite(surface), [0, 0])
+        entry[0] += 1
+        entry[1] += surfaceBytes(surface)
+    return sites
+
+class MemoryDiagnostics:
+    def __init__(self, level, top=MEMORY_TOP, trendDays=MEMORY_TREND_DAYS, directory=PROFILE_DIR):
+        self.level = level
+        self.top = top
+        self.directory = directory
+        self.snapshot = None #the last tracemalloc snapshot, what the next one is diffed against
+        self.sprites = {}
+        self.surfaces = {}
+        self.history = {} #'group crops', 'class Crop', 'detached Crop', 'surface bytes' -> sizes at the last trendDays + 1 snapshots
+        self.trendDays = trendDays
+        self.reports = [] #paths written so far
+
+    def groupSizes(self):
+        level = self.level
+        return {
+            'allSprites': len(level.allSprites),
+            'collisionSprites': len(level.collisionSprites),
+            'soilTiles': len(level.soilTiles),
+            'crops': len(level.crops),
+            'trees': len(level.trees),
+            'rocks': len(level.rocks),
+            'particles': len(level.particles),
+            'itemsGroup': len(level.itemsGroup),
+            'world': len(level.world)
+        }
+
+    def pooledIds(self):
+        return {id(sprite) for pool in (self.level.particlePool, *self.level.itemPools.values()) for sprite in pool.free}
+
+    def take(self): #snapshot, sprite census and surface sites, the first one is the baseline
+        gc.collect() #only what is really still referenced
+        self.snapshot = tracemalloc.take_snapshot().filter_traces(SNAPSHOT_FILTERS)
+        self.sprites = spriteCensus(self.pooledIds())
+        self.surfaces = surfaceSites()
+        self.record(self.groupSizes(), self.sprites, self.surfaces)
+
+    def record(self, groups, sprites, surfaces): #adds this snapshot to every trend
+        sizes = {f"group {name}": size for name, size in groups.items()}
+        for name, (count, detached) in sprites.items():
+            sizes[f"class {name}"] = count
+            sizes[f"detached {name}"] = detached
+        sizes['surface bytes'] = sum(bytesUsed for _, bytesUsed in surfaces.values())
+        for name in self.history.keys() - sizes.keys(): #a class with no instances left counts as zero
+            sizes[name] = 0
+        for name, size in sizes.items():
+            self.history.setdefault(name, deque(maxlen=self.trendDays + 1)).append(size)
+
+    def growing(self): #names that grew at each of the last trendDays snapshots
+        flagged = []
+        for name, sizes in self.history.items():
+            if len(sizes) == sizes.maxlen and all(later > earlier for earlier, later in zip(sizes, list(sizes)[1:])):
+                flagged.append((name, sizes[0], sizes[-1]))
+        return flagged
+
+    def dayStarted(self, tag=''): #Time day listener, diff against the previous snapshot and write a report
+        start = time.perf_counter()
+        if self.snapshot is None:
+            self.take()
+            return None
+        previous, previousSprites, previousSurfaces = self.snapshot, self.sprites, self.surfaces
+        self.take()
+
+        lines = [f"Memory at {tag or 'day boundary'}: {tracemalloc.get_traced_memory()[0] / 1048576:.1f} MB traced Python memory, "
+                 f"{self.history['surface bytes'][-1] / 1048576:.1f} MB of surfaces"]
+
+        lines.append("")
+        lines.append(f"{'sprite class':<20}{'live':>8}{'change':>8}{'detached':>10}{'change':>8}")
+        for name in sorted(self.sprites.keys() | previousSprites.keys()):
+            count, detached = self.sprites.get(name, (0, 0))
+            oldCount, oldDetached = previousSprites.get(name, (0, 0))
+            lines.append(f"{name:<20}{count:>8}{count - oldCount:>+8}{detached:>10}{detached - oldDetached:>+8}")
+
+        lines.append("")
+        lines.append(f"{'surface allocation site':<32}{'surfaces':>9}{'change':>8}{'MB':>9}{'change':>9}")
+        siteChanges = []
+        for site in self.surfaces.keys() | previousSurfaces.keys():
+            count, bytesUsed = self.surfaces.get(site, (0, 0))
+            oldCount, oldBytes = previousSurfaces.get(site, (0, 0))
+            if count != oldCount or bytesUsed != oldBytes:
+                siteChanges.append((bytesUsed - oldBytes, count - oldCount, site, count, bytesUsed))
+        for bytesChange, countChange, site, count, bytesUsed in sorted(siteChanges, reverse=True)[:self.top]:
+            lines.append(f"{site:<32}{count:>9}{countChange:>+8}{bytesUsed / 1048576:>9.2f}{bytesChange / 1048576:>+9.2f}")
+        if not siteChanges:
+            lines.append("  no change")
+
+        lines.append("")
+        lines.append("Python allocation growth by site:")
+        growth = [stat for stat in self.snapshot.compare_to(previous, 'lineno') if stat.size_diff > 0]
+        for stat in growth[:self.top]:
+            frame = stat.traceback[0]
+            lines.append(f"  {stat.size_diff / 1024:+9.1f} KiB {stat.count_diff:+7d} blocks  {os.path.basename(frame.filename)}:{frame.lineno}")
+        if not growth:
+            lines.append("  no growth")
+
+        flagged = self.growing()
+        if flagged:
+            lines.append("")
+            lines.append(f"Growing at each of the last {self.trendDays} day boundaries:")
+            for name, first, last in flagged:
+                lines.append(f"  {name:<28}{first:>10} -> {last}")
+                memoryLog.warning("%s grew at each of the last %d day boundaries, %d -> %d", name, self.trendDays, first, last)
+
+        os.makedirs(self.directory, exist_ok=True)
+        path = os.path.join(self.directory, f"memory{'-' + tag if tag else ''}-{time.strftime('%Y%m%d-%H%M%S')}.txt")
+        with open(path, 'w') as f:
+            f.write('\n'.join(lines) + '\n')
+        self.reports.append(path)
+        memoryLog.info("Memory snapshot written to %s in %.0f ms", path, (time.perf_counter() - start) * 1000)
+        return path
@@ -4,30 +4,28 @@ from settings import *
 from support import *
 from timer import Timer
 from inventory import Inventory
+from playerState import Direction, Action, TOOL_ACTIONS, STATE_TABLE
+from eventLog import eventLog
 
-PLAYER_TOOL_OFFSET = {
-    'up': pygame.math.Vector2(0, -32), 
-    'down': pygame.math.Vector2(0, 32),
-    'left': pygame.math.Vector2(-32, 0),
-    'right': pygame.math.Vector2(32, 0)
-}
+economyLog = eventLog.category('economy')
+inputLog = eventLog.category('input')
+timeLog = eventLog.category('time')
+assetLog = eventLog.category('assets')
 
 class Player(pygame.sprite.Sprite):
+    moving = True #the camera interpolates the player between sim steps
+
     def __init__(self, pos, groups, collisionSprites, level): 
         super().__init__(groups) # Initialize sprite with given groups
         self.level = level # Reference to the game level
 
         # Load assets
         self.importAssets() #import the assets for the player
-        self.status = 'downIdle' # Initial status
+        self.clips = {key: self.animations[state.animation] for key, state in STATE_TABLE.items()} # (direction, action) -> frames
+        self.facing = Direction.DOWN # Direction the player last moved or faced
+        self.setState(Direction.DOWN, Action.IDLE) # Initial state
         self.frameIndex = 0 # Animation frame index
-
-        # Use a fallback surface if animation empty
-        if self.animations.get(self.status) and len(self.animations[self.status]) > 0: # Check if animation list is not empty
-            self.image = self.animations[self.status][self.frameIndex] # Set initial image
-        else:
-            self.image = pygame.Surface((32, 32)) #
-            self.image.fill((255,0,255))
+        self.image = self.clip[self.frameIndex] # Set initial image, importAssets guarantees at least one frame
 
         self.rect = self.image.get_rect(center=pos) # Center the rect on the given position
         self.z = LAYERS['main']
@@ -35,6 +33,7 @@ class Player(pygame.sprite.Sprite):
         # Movement
         self.direction = pygame.math.Vector2() # Initialize direction vector
         self.pos = pygame.math.Vector2(self.rect.center) # Use float for precise movement
+        self.previousPos = self.pos.copy() # Position at the previous sim step, for render interpolation
         self.speed = 180
 
         # Collision
@@ -52,9 +51,7 @@ class Player(pygame.sprite.Sprite):
         # Timers
         self.timers = {
             'tool use': Timer(350, self.useTool),
-            'tool switch': Timer(200),
             'seed use': Timer(350, self.useSeed),
-            'seed switch': Timer(200),
             'harvest use': Timer(350, self.useHarvest)
         }
 
@@ -84,9 +81,23 @@ class Player(pygame.sprite.Sprite):
         self.boundary = None
         self.targetPos = pygame.math.Vector2(self.rect.center)
 
+    @property
+    def status(self): # Animation name of the current state, e.g. 'leftAxe'
+        return self.state.animation
+
+    def setState(self, direction, action):
+        self.state = STATE_TABLE[(direction, action)]
+        self.clip = self.clips[(direction, action)]
+
     def setMapBounds(self, rect):
         self.boundary = rect.copy() # Set movement boundaries
 
+    def setPosition(self, center): # Teleport without interpolating across the jump
+        self.rect.center = center
+        self.hitbox.center = self.rect.center
+        self.pos.update(self.rect.center)
+        self.previousPos.update(self.pos)
+
     def useTool(self):
         tileX, tileY = self.level.getTileInFront(self) # Get tile in front of player
         if self.selectedTool == 'hoe':
@@ -117,14 +128,7 @@ class Player(pygame.sprite.Sprite):
 
     def importAssets(self):
         characterPath = "graphics/character/"
-        self.animations = {name:[] for name in [
-            'up','down','left','right',
-            'upIdle','downIdle','leftIdle','rightIdle',
-            'upHoe','downHoe','leftHoe','rightHoe',
-            'upAxe','downAxe','leftAxe','rightAxe',
-            'upPickaxe','downPickaxe','leftPickaxe','rightPickaxe',
-            'upWater','downWater','leftWater','rightWater'
-        ]}
+        self.animations = {state.animation: [] for state in STATE_TABLE.values()} # one folder per state
         for key in self.animations.keys(): 
             fullPath = os.path.join(characterPath,key) # Full path to animation folder
             if os.path.exists(fullPath): # Check if folder exists
@@ -136,235 +140,164 @@ class Player(pygame.sprite.Sprite):
                     fallback = pygame.Surface((32, 32))
                     fallback.fill((255, 0, 255))
                     self.animations[key] = [fallback]
-                    print(f"Created fallback for {key} - no frames loaded")
+                    assetLog.warning("Created fallback for %s - no frames loaded", key)
             else:
                 # Create a simple fallback frame for missing folders
                 fallback = pygame.Surface((32, 32))
                 fallback.fill((255, 0, 255))
                 self.animations[key] = [fallback]
-                print(f"Created fallback for {key} - folder missing")
+                assetLog.warning("Created fallback for %s - folder missing", key)
 
     def pickupItem(self):
-        # Find the nearest pickupable item
-        nearest_item = None
-        min_distance = float('inf')
-        
-        if hasattr(self.level, 'itemsGroup'):
-            for item in self.level.itemsGroup:
-                if hasattr(item, 'pickup') and item.pickup:
-                    distance = pygame.math.Vector2(item.rect.center).distance_to(
-                        pygame.math.Vector2(self.rect.center))
-                    
-                    if distance < 50 and distance < min_distance:  # Within pickup range
-                        nearest_item = item
-                        min_distance = distance
+        # Find the nearest pickupable item, only looking at tiles around the player
+        nearby = self.level.itemsGroup.near(self.rect.center, PICKUP_RADIUS)
+        nearest_item = nearby[0] if nearby else None
         
         if nearest_item:
             # Add to inventory instead of just destroying
             success = self.inventory.addItem(
                 nearest_item.pickupKey, 
-                1,
-                getattr(nearest_item, 'icon', None)
+                nearest_item.count, # The whole stack
+                nearest_item.icon
             )
             
             if success:
-                print(f"Picked up {nearest_item.pickupKey}")
+                economyLog.debug("Picked up %s", nearest_item.pickupKey)
                 nearest_item.kill()
             else:
-                print("Inventory full - couldn't pick up item")
+                economyLog.warning("Inventory full - couldn't pick up item")
 
     def animate(self, deltaTime):
         # Store current position and rect before any animation changes
         current_center = self.rect.center
         
-        # Get the current animation frames for the status
-        current_animation = self.animations.get(self.status, [])
+        # Frames for the current state, every state has at least a fallback frame
+        current_animation = self.clip
         
-        if current_animation and len(current_animation) > 0:
-            # 8 frames per second for smooth walking animation
-            animation_speed = 8.0  # frames per second
-            
-            # Update frame index based on time
-            self.frameIndex += animation_speed * deltaTime
-            
-            # Loop animation if we exceed frame count
-            if self.frameIndex >= len(current_animation):
-                self.frameIndex = 0
-            
-            # Get the current frame
-            current_frame = current_animation[int(self.frameIndex)]
-            
-            # Update the image while preserving the rect properties
-            old_rect = self.rect.copy()
-            self.image = current_frame
-            self.rect = self.image.get_rect(center=current_center)
-            
-        else:
-            # Fallback: use downIdle if current animation is completely empty
-            fallback_animation = self.animations.get('downIdle', [])
-            if fallback_animation and len(fallback_animation) > 0:
-                self.image = fallback_animation[0]
-                self.rect = self.image.get_rect(center=current_center)
-            else:
-                # Ultimate fallback
-                self.image = pygame.Surface((32, 32))
-                self.image.fill((255, 0, 255))
-                self.rect = self.image.get_rect(center=current_center)
+        # 8 frames per second for smooth walking animation
+        animation_speed = 8.0  # frames per second
+        
+        # Update frame index based on time
+        self.frameIndex += animation_speed * deltaTime
+        
+        # Loop animation if we exceed frame count
+        if self.frameIndex >= len(current_animation):
+            self.frameIndex = 0
+        
+        # Update the image while preserving the rect centre
+        self.image = current_animation[int(self.frameIndex)]
+        self.rect = self.image.get_rect(center=current_center)
         
         # Ensure hitbox stays aligned with the player
         self.hitbox.center = self.rect.center
         
-    def input(self):
-        keys = pygame.key.get_pressed()
-        
-        #debugging - MOVED TO TOP SO IT ALWAYS WORKS
-        if keys[pygame.K_1]:  # Press 1 to set to morning (6 AM)
-            if hasattr(self.level, 'time'):
-                self.level.time.currentTime = 6 * TIME_RATE
-                print(f"DEBUG: Set time to 6 AM - currentTime: {self.level.time.currentTime}")
-            else:
-                print("DEBUG: No time system found")
-        if keys[pygame.K_2]:  # Press 2 to set to noon (12 PM)
-            if hasattr(self.level, 'time'):
-                self.level.time.currentTime = 12 * TIME_RATE
-                print(f"DEBUG: Set time to 12 PM - currentTime: {self.level.time.currentTime}")
-        if keys[pygame.K_3]:  # Press 3 to set to evening (6 PM)
-            if hasattr(self.level, 'time'):
-                self.level.time.currentTime = 18 * TIME_RATE
-                print(f"DEBUG: Set time to 6 PM - currentTime: {self.level.time.currentTime}")
-        if keys[pygame.K_4]:  # Press 4 to set to night (10 PM)
-            if hasattr(self.level, 'time'):
-                self.level.time.currentTime = 22 * TIME_RATE
-                print(f"DEBUG: Set time to 10 PM - currentTime: {self.level.time.currentTime}")
-        if keys[pygame.K_5]:  # Press 5 to advance time by 1 hour
-            if hasattr(self.level, 'time'):
-                self.level.time.currentTime += 60
-                print(f"DEBUG: Advanced time by 1 hour - currentTime: {self.level.time.currentTime}")
-        if keys[pygame.K_6]:  # Press 6 to advance time by 6 hours
-            if hasattr(self.level, 'time'):
-                self.level.time.currentTime += 360
-                print(f"DEBUG: Advanced time by 6 hours - currentTime: {self.level.time.currentTime}")
-
-        if keys[pygame.K_b]:  # B key to open shop
-            self.level.shop.toggle()
-
-        if self.level.shop.visible:
-            # Use W/S or PageUp/PageDown for navigation
-            if keys[pygame.K_w] or keys[pygame.K_PAGEUP]:
-                self.level.shop.selectPrev()
-            if keys[pygame.K_s] or keys[pygame.K_PAGEDOWN]:
-                self.level.shop.selectNext()
-            if keys[pygame.K_TAB]:
-                self.level.shop.switchMode()
-            if keys[pygame.K_SPACE]:
-                if self.level.shop.mode == 'buy':
-                    self.level.shop.buyItem()
-                else:
-                    self.level.shop.sellItem()
-            if keys[pygame.K_ESCAPE]:
-                self.level.shop.visible = False
-                
+    def input(self): # Consume this tick's actions from the level's action map
+        actions = self.level.actions
+
+        #debugging
+        if actions.wasPressed('debugMorning'):  # Press 1 to set to morning (6 AM)
+            self.level.time.currentTime = 6 * TIME_RATE
+            inputLog.debug("Set time to 6 AM - currentTime: %s", self.level.time.currentTime)
+        if actions.wasPressed('debugNoon'):  # Press 2 to set to noon (12 PM)
+            self.level.time.currentTime = 12 * TIME_RATE
+            inputLog.debug("Set time to 12 PM - currentTime: %s", self.level.time.currentTime)
+        if actions.wasPressed('debugEvening'):  # Press 3 to set to evening (6 PM)
+            self.level.time.currentTime = 18 * TIME_RATE
+            inputLog.debug("Set time to 6 PM - currentTime: %s", self.level.time.currentTime)
+        if actions.wasPressed('debugNight'):  # Press 4 to set to night (10 PM)
+            self.level.time.currentTime = 22 * TIME_RATE
+            inputLog.debug("Set time to 10 PM - currentTime: %s", self.level.time.currentTime)
+        if actions.wasPressed('debugHour'):  # Press 5 to advance time by 1 hour
+            self.level.time.currentTime += 60
+            inputLog.debug("Advanced time by 1 hour - currentTime: %s", self.level.time.currentTime)
+        if actions.wasPressed('debugSixHours'):  # Press 6 to advance time by 6 hours
+            self.level.time.currentTime += 360
+            inputLog.debug("Advanced time by 6 hours - currentTime: %s", self.level.time.currentTime)
+
         if not self.timers['tool use'].active:
             self.direction.x = 0
             self.direction.y = 0
 
             # Movement
-            if keys[pygame.K_UP]:
+            if actions.isHeld('moveUp'):
                 self.direction.y = -1
-                self.status = 'up'
-            elif keys[pygame.K_DOWN]:
+                self.facing = Direction.UP
+            elif actions.isHeld('moveDown'):
                 self.direction.y = 1
-                self.status = 'down'
-            if keys[pygame.K_LEFT]:
+                self.facing = Direction.DOWN
+            if actions.isHeld('moveLeft'):
                 self.direction.x = -1
-                self.status = 'left'
-            elif keys[pygame.K_RIGHT]:
+                self.facing = Direction.LEFT
+            elif actions.isHeld('moveRight'):
                 self.direction.x = 1
-                self.status = 'right'
-
-            if self.direction.magnitude() == 0:
-                if 'left' in self.status:
-                    self.status = 'leftIdle'
-                elif 'right' in self.status:
-                    self.status = 'rightIdle'
-                elif 'up' in self.status:
-                    self.status = 'upIdle'
-                else:
-                    self.status = 'downIdle'
+                self.facing = Direction.RIGHT
 
             #Sleep interaction(when near bed)
-            if keys[pygame.K_z] and self.canSleep and not self.sleepTimer.active:
+            if actions.wasPressed('sleep') and self.canSleep and not self.sleepTimer.active:
                 self.sleepTimer.activate()
-                print("Going to sleep...")
+                timeLog.info("Going to sleep...")
+
+            if self.level.shop.visible: # Space and the shop keys belong to the shop while it is open
+                return
 
-            # Tool use
-            if keys[pygame.K_SPACE]:
+            # Tool use, repeats while held
+            if actions.isHeld('useTool'):
                 self.timers['tool use'].activate()
                 self.direction = pygame.math.Vector2()
                 self.frameIndex = 0
 
             # Switch tool
-            if keys[pygame.K_t] and not self.timers['tool switch'].active:
-                self.timers['tool switch'].activate()
+            if actions.wasPressed('switchTool'):
                 self.toolIndex = (self.toolIndex + 1) % len(self.tools)
                 self.selectedTool = self.tools[self.toolIndex]
 
             # Seed use
-            if keys[pygame.K_LCTRL]:
+            if actions.isHeld('useSeed'):
                 self.timers['seed use'].activate()
                 self.direction = pygame.math.Vector2()
                 self.frameIndex = 0
 
             # Switch seed
-            if keys[pygame.K_e] and not self.timers['seed switch'].active:
-                self.timers['seed switch'].activate()
+            if actions.wasPressed('switchSeed'):
                 self.seedIndex = (self.seedIndex + 1) % len(self.seeds)
                 self.selectedSeed = self.seeds[self.seedIndex]
 
             # Harvest use
-            if keys[pygame.K_h] and not self.timers['harvest use'].active:
+            if actions.isHeld('harvest') and not self.timers['harvest use'].active:
                 self.timers['harvest use'].activate()
                 self.direction = pygame.math.Vector2()
                 self.frameIndex = 0
 
             # F key pickup
-            if keys[pygame.K_f] and not self.timers['tool use'].active:
+            if actions.isHeld('pickup') and not self.timers['tool use'].active:
                 self.pickupItem()
 
     def getStatus(self):
-        base = 'down'
-        if 'up' in self.status:
-            base = 'up'
-        elif 'down' in self.status:
-            base = 'down'
-        elif 'left' in self.status:
-            base = 'left'
-        elif 'right' in self.status:
-            base = 'right'
-
-        if self.direction.magnitude() == 0 and not self.timers['tool use'].active: 
-            self.status = base + 'Idle' # Idle if not moving
-        elif self.timers['tool use'].active: 
-            self.status = base + self.selectedTool.capitalize() # Tool use animation
+        if self.timers['tool use'].active:
+            action = TOOL_ACTIONS[self.selectedTool] # Tool use animation
         elif self.timers['harvest use'].active:
-            self.status = base + 'Hoe' # Use hoe animation for harvesting
+            action = Action.HOE # Use hoe animation for harvesting
+        elif self.direction.x or self.direction.y:
+            action = Action.WALK
+        else:
+            action = Action.IDLE # Idle if not moving
+        if action is not self.state.action or self.facing is not self.state.direction:
+            self.setState(self.facing, action)
 
     def sleep(self):
         #move to the next day
         if hasattr(self.level, 'time'):
             self.level.time.currentTime = 6 * TIME_RATE  # Wake up at 6 AM
             self.level.time.dayCount += 1
-            print(f"Good morning! Day {self.level.time.dayCount}")
+            timeLog.info("Good morning! Day %d", self.level.time.dayCount)
+            self.level.time.startDay()
 
     def updateTimers(self):
         for timer in self.timers.values():
             timer.update() # Update all timers
 
     def collision(self, direction):
-        for sprite in self.collisionSprites.sprites():
-            if not hasattr(sprite, 'hitbox'):
-                sprite.hitbox = sprite.rect.copy() # Ensure sprite has a hitbox
-            
+        for sprite in self.collisionSprites.query(self.hitbox): # Only colliders near the player
             if sprite.hitbox.colliderect(self.hitbox):
                 if direction == 'horizontal': 
                     if self.direction.x > 0:  # moving right
@@ -401,20 +334,11 @@ class Player(pygame.sprite.Sprite):
             self.rect.center = (round(self.pos.x), round(self.pos.y)) # Update rect position
             self.hitbox.center = self.rect.center # Keep hitbox aligned
 
-    def getTargetPos(self): # Calculate target position based on direction
-        baseDir = 'down' # Default direction
-        if 'up' in self.status:
-            baseDir = 'up'
-        elif 'down' in self.status:
-            baseDir = 'down'
-        elif 'left' in self.status:
-            baseDir = 'left' 
-        elif 'right' in self.status:
-            baseDir = 'right' # Determine base direction
-        self.targetPos = pygame.math.Vector2(self.rect.center) + PLAYER_TOOL_OFFSET[baseDir] # Calculate target position
-
-    def update(self, deltaTime): # Called every frame
-        self.input() # Handle input
+    def getTargetPos(self): # Calculate target position based on the facing direction
+        self.targetPos = pygame.math.Vector2(self.rect.center) + self.state.toolOffset
+
+    def update(self, deltaTime): # Called every sim step, deltaTime in seconds
+        self.previousPos.update(self.pos) # Remember where this step started, input already ran in the input phase
         self.move(deltaTime) # Move player
         self.getStatus() # Update status
         self.updateTimers() # Update timers
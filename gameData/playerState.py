@@ -0,0 +1,47 @@
+from collections import namedtuple
+from enum import Enum
+from pygame.math import Vector2
+from settings import TILE_SIZE
+
+class Direction(Enum):
+    UP = 'up'
+    DOWN = 'down'
+    LEFT = 'left'
+    RIGHT = 'right'
+
+class Action(Enum): #values are the animation folder suffixes
+    WALK = ''
+    IDLE = 'Idle'
+    HOE = 'Hoe'
+    AXE = 'Axe'
+    WATER = 'Water'
+    PICKAXE = 'Pickaxe'
+
+TOOL_ACTIONS = { #selected tool -> action it animates as
+    'hoe': Action.HOE,
+    'axe': Action.AXE,
+    'wateringCan': Action.WATER,
+    'pickaxe': Action.PICKAXE
+}
+
+TILE_DELTAS = { #tile the player faces, relative to the one they stand on
+    Direction.UP: (0, -1),
+    Direction.DOWN: (0, 1),
+    Direction.LEFT: (-1, 0),
+    Direction.RIGHT: (1, 0)
+}
+
+PlayerState = namedtuple('PlayerState', ['direction', 'action', 'animation', 'toolOffset', 'tileDelta'])
+
+# every (direction, action) pair, resolved once so the player never builds or parses status strings
+STATE_TABLE = {
+    (direction, action): PlayerState(
+        direction,
+        action,
+        direction.value + action.value, #animation folder, e.g. 'leftAxe'
+        Vector2(TILE_DELTAS[direction]) * TILE_SIZE, #where tools land, from the player's centre
+        TILE_DELTAS[direction]
+    )
+    for direction in Direction
+    for action in Action
+}
@@ -0,0 +1,46 @@
+from settings import POOL_MAX_SIZE
+
+class SpritePool: #recycles killed sprites instead of constructing new ones
+    def __init__(self, spriteClass, maxSize=POOL_MAX_SIZE):
+        self.spriteClass = spriteClass
+        self.maxSize = maxSize #free sprites kept beyond this are left to the GC
+        self.free = []
+
+        # counters so the effect can be measured
+        self.hits = 0 #acquires served from the free list
+        self.misses = 0 #acquires that had to construct a sprite
+        self.released = 0 #sprites handed back on kill
+        self.dropped = 0 #sprites handed back while the free list was full
+
+    def acquire(self, *args, **kwargs): #same arguments as the sprite constructor
+        if self.free:
+            sprite = self.free.pop()
+            sprite.reset(*args, **kwargs) #reset state in place
+            self.hits += 1
+        else:
+            sprite = self.spriteClass(*args, **kwargs)
+            self.misses += 1
+        sprite.pool = self #kill() hands it back here
+        return sprite
+
+    def release(self, sprite):
+        self.released += 1
+        if len(self.free) < self.maxSize:
+            self.free.append(sprite)
+        else:
+            self.dropped += 1
+
+    def hitRate(self):
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
+
+    def stats(self):
+        return {
+            'class': self.spriteClass.__name__,
+            'hits': self.hits,
+            'misses': self.misses,
+            'released': self.released,
+            'dropped': self.dropped,
+            'free': len(self.free),
+            'hitRate': self.hitRate()
+        }
@@ -0,0 +1,282 @@
+#start-up profiler: python main.py --profile-startup
+#times imports, asset loads by category and named sections, then prints a flame-style tree and writes folded stacks
+#frame profiler: F10 or SIGUSR1 runs cProfile over the next few frames of a running game
+#stdlib only at module level, main.py imports it before pygame so pygame's own import is timed too
+import builtins
+import cProfile
+import gc
+import os
+import pstats
+import signal
+import sys
+import threading
+import time
+
+class NullSection: #what section() hands out when profiling is off, entering it does nothing
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+NULL_SECTION = NullSection()
+
+class Section:
+    def __init__(self, profiler, name, measureSurfaces):
+        self.profiler = profiler
+        self.name = name
+        self.measureSurfaces = measureSurfaces
+
+    def __enter__(self):
+        self.profiler.push(self.name, self.measureSurfaces)
+        return self
+
+    def __exit__(self, *exc):
+        self.profiler.pop()
+        return False
+
+def liveSurfaces(): #every surface held by a Python object that owns its pixels, subsurfaces share their parent's so they are skipped
+    import pygame
+    seen = set()
+    surfaces = []
+    for holder in gc.get_objects(): #surfaces aren't tracked by gc themselves, so look one reference down from everything that is
+        for obj in gc.get_referents(holder):
+            if isinstance(obj, pygame.Surface) and id(obj) not in seen:
+                seen.add(id(obj))
+                if obj.get_parent() is None:
+                    surfaces.append(obj)
+    return surfaces
+
+def liveSurfaceBytes(): #pixel memory of every live surface
+    return sum(surfaceBytes(surface) for surface in liveSurfaces())
+
+def surfaceBytes(surface):
+    return surface.get_width() * surface.get_height() * surface.get_bytesize()
+
+def assetCategory(path): #'graphics/tilesets/barn.png' -> 'tilesets'
+    parts = path.split('/')
+    return parts[1] if len(parts) > 2 else parts[0]
+
+class StartupProfiler:
+    def __init__(self):
+        self.enabled = False
+        self.stack = [] #open frames: (folded name, start time, surface bytes at entry or None, overhead at entry)
+        self.overhead = 0.0 #seconds spent scanning surfaces, taken back out of every frame it happened inside
+        self.inclusive = {} #folded stack 'startup;level;tmx' -> seconds, children included
+        self.calls = {} #folded stack -> times entered
+        self.surfaces = {} #folded stack -> surface bytes its section left alive
+        self.assets = {} #category -> [surfaces created, their bytes], times come from the asset frames
+        self.originalImport = None
+
+    def start(self, startTime=None): #startTime lets main.py count what ran before the profiler was imported
+        self.enabled = True
+        self.stack = [('startup', startTime or time.perf_counter(), None, self.overhead)]
+        self.originalImport = builtins.__import__
+        builtins.__import__ = self.timedImport
+
+    def stop(self):
+        if self.originalImport is not None:
+            builtins.__import__ = self.originalImport
+            self.originalImport = None
+        while self.stack:
+            self.pop()
+        self.enabled = False
+
+    # frames
+
+    def section(self, name, measureSurfaces=True): #with startupProfile.section('tmx'): ... free when profiling is off
+        if not self.enabled:
+            return NULL_SECTION
+        return Section(self, name, measureSurfaces)
+
+    def push(self, name, measureSurfaces=False):
+        folded = f"{self.stack[-1][0]};{name}" if self.stack else name
+        bytesBefore = self.scanSurfaces() if measureSurfaces else None #before the clock starts, the scan isn't the section's cost
+        self.stack.append((folded, time.perf_counter(), bytesBefore, self.overhead))
+
+    def pop(self):
+        end = time.perf_counter()
+        folded, start, bytesBefore, overheadBefore = self.stack.pop()
+        self.inclusive[folded] = self.inclusive.get(folded, 0.0) + end - start - (self.overhead - overheadBefore)
+        self.calls[folded] = self.calls.get(folded, 0) + 1
+        if bytesBefore is not None:
+            self.surfaces[folded] = self.surfaces.get(folded, 0) + self.scanSurfaces() - bytesBefore
+
+    def scanSurfaces(self):
+        start = time.perf_counter()
+        total = liveSurfaceBytes()
+        self.overhead += time.perf_counter() - start
+        return total
+
+    # imports
+
+    def timedImport(self, name, globals=None, locals=None, fromlist=(), level=0):
+        if level or name in sys.modules or threading.current_thread() is not threading.main_thread(): #nothing to time, or not our stack
+            return self.originalImport(name, globals, locals, fromlist, level)
+        self.push(f"import {name}")
+        try:
+            return self.originalImport(name, globals, locals, fromlist, level)
+        finally:
+            self.pop()
+
+    # assets
+
+    def instrumentLoader(self, loader): #swaps timed versions of get and finish onto this loader instance
+        from loader import normalisePath
+        get, finish = loader.get, loader.finish
+
+        def timedGet(path):
+            key = normalisePath(path)
+            loadsHere = key not in loader.images and key not in loader.pending #pending ones are counted by timedFinish
+            category = assetCategory(key)
+            self.push(f"asset {category}", False)
+            try:
+                image = get(path)
+            finally:
+                self.pop()
+            if loadsHere:
+                self.recordAsset(category, image)
+            return image
+
+        def timedFinish(key, future): #convert_alpha of a background decode, on the main thread
+            category = assetCategory(key)
+            self.push(f"convert {category}", False)
+            try:
+                finish(key, future)
+            finally:
+                self.pop()
+            image = loader.images.get(key)
+            if image is not None:
+                self.recordAsset(category, image)
+
+        loader.get = timedGet
+        loader.finish = timedFinish
+
+    def recordAsset(self, category, image):
+        entry = self.assets.setdefault(category, [0, 0])
+        entry[0] += 1
+        entry[1] += surfaceBytes(image)
+
+    # report
+
+    def selfTimes(self): #inclusive minus direct children, what the flame graph format wants
+        selfTimes = dict(self.inclusive)
+        for folded, seconds in self.inclusive.items():
+            parent = folded.rpartition(';')[0]
+            if parent in selfTimes:
+                selfTimes[parent] -= seconds
+        return selfTimes
+
+    def writeFolded(self, path): #one 'a;b;c microseconds' line per stack, for flamegraph.pl or speedscope
+        os.makedirs(os.path.dirname(path) or '.', exist_ok=True)
+        with open(path, 'w') as f:
+            for folded, seconds in sorted(self.selfTimes().items()):
+                if seconds > 0:
+                    f.write(f"{folded} {int(seconds * 1e6)}\n")
+        return path
+
+    def report(self, minShare=0.005, width=30): #indented tree, frames under minShare of the total are folded away
+        total = self.inclusive.get('startup', 0.0) or 1e-9
+        lines = [f"Start-up profile: {total * 1000:.0f} ms, {liveSurfaceBytes() / 1048576:.1f} MB of surfaces alive"]
+
+        children = {}
+        for folded in self.inclusive:
+            children.setdefault(folded.rpartition(';')[0], []).append(folded)
+
+        def walk(folded, depth):
+            seconds = self.inclusive[folded]
+            bar = '#' * max(1, int(width * seconds / total))
+            name = folded.rpartition(';')[2]
+            calls = self.calls[folded]
+            extra = f" x{calls}" if calls > 1 else ''
+            if folded in self.surfaces:
+                extra += f"  {self.surfaces[folded] / 1048576:+.1f} MB"
+            lines.append(f"{seconds * 1000:9.1f} ms {bar:<{width}} {'  ' * depth}{name}{extra}")
+            hidden = 0.0
+            for child in sorted(children.get(folded, ()), key=self.inclusive.get, reverse=True):
+                if self.inclusive[child] >= total * minShare:
+                    walk(child, depth + 1)
+                else:
+                    hidden += self.inclusive[child]
+            if hidden >= 0.0001:
+                lines.append(f"{hidden * 1000:9.1f} ms {'':<{width}} {'  ' * (depth + 1)}(smaller frames)")
+
+        if 'startup' in self.inclusive:
+            walk('startup', 0)
+
+        if self.assets:
+            lines.append("")
+            lines.append("Assets by category:     loads       ms   surface MB")
+            assetTimes = {}
+            for folded, seconds in self.inclusive.items():
+                name = folded.rpartition(';')[2]
+                parentName = folded.rpartition(';')[0].rpartition(';')[2]
+                if name.startswith(('asset ', 'convert ')) and not parentName.startswith('asset '): #a convert inside a get is already in its time
+                    category = name.split(' ', 1)[1]
+                    assetTimes[category] = assetTimes.get(category, 0.0) + seconds
+            for category, (loads, bytesUsed) in sorted(self.assets.items(), key=lambda item: -assetTimes.get(item[0], 0.0)):
+                lines.append(f"  {category:<20} {loads:7d} {assetTimes.get(category, 0.0) * 1000:8.1f} {bytesUsed / 1048576:12.2f}")
+
+        imports = [] #imports not started by another import, so nothing is counted twice
+        for folded, seconds in self.inclusive.items():
+            parent, _, name = folded.rpartition(';')
+            if name.startswith('import ') and not parent.rpartition(';')[2].startswith('import '):
+                imports.append((seconds, name[len('import '):]))
+        if imports:
+            lines.append("")
+            lines.append("Slowest top-level imports:")
+            for seconds, name in sorted(imports, reverse=True)[:10]:
+                lines.append(f"  {seconds * 1000:8.1f} ms  {name}")
+        return '\n'.join(lines)
+
+startupProfile = StartupProfiler()
+
+class FrameProfiler: #cProfile over the next `frames` main loop iterations, dumped as .prof and a text top list
+    def __init__(self, frames=20, top=40, directory='profiles'):
+        self.frames = frames
+        self.top = top
+        self.directory = directory
+        self.requested = False #set by the hotkey or the signal, picked up when the next frame starts
+        self.profile = None #the running capture
+        self.remaining = 0
+
+    def request(self):
+        self.requested = True
+
+    def installSignal(self): #kill -USR1 <pid> starts a capture, where the platform has the signal
+        if hasattr(signal, 'SIGUSR1'):
+            signal.signal(signal.SIGUSR1, lambda signum, frame: self.request()) #only sets a flag, safe between any two bytecodes
+            return True
+        return False
+
+    def beginFrame(self):
+        if self.requested and self.profile is None:
+            self.requested = False
+            self.remaining = self.frames
+            self.profile = cProfile.Profile()
+            self.profile.enable()
+
+    def endFrame(self, tag=''): #returns the (.prof, .txt) paths on the frame that finishes a capture
+        if self.profile is None:
+            return None
+        self.remaining -= 1
+        if self.remaining > 0:
+            return None
+        self.profile.disable()
+        profile, self.profile = self.profile, None
+        return self.dump(profile, tag)
+
+    def dump(self, profile, tag):
+        os.makedirs(self.directory, exist_ok=True)
+        stem = base = os.path.join(self.directory, f"frames{'-' + tag if tag else ''}-{time.strftime('%Y%m%d-%H%M%S')}")
+        repeat = 1
+        while os.path.exists(f"{stem}.prof"): #two captures in the same second
+            repeat += 1
+            stem = f"{base}-{repeat}"
+        profile.dump_stats(f"{stem}.prof") #for snakeviz, gprof2dot or pstats
+        with open(f"{stem}.txt", 'w') as f:
+            f.write(f"{self.frames} frames\n\n")
+            stats = pstats.Stats(profile, stream=f)
+            stats.sort_stats('cumulative').print_stats(self.top)
+            stats.sort_stats('tottime').print_stats(self.top)
+        return f"{stem}.prof", f"{stem}.txt"
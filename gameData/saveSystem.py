@@ -2,10 +2,13 @@ import json
 import os
 import pygame
 from settings import *
+from eventLog import eventLog
+
+saveLog = eventLog.category('save')
 
 class SaveSystem:
-    def __init__(self, level):
-        self.level = level
+    def __init__(self, level=None):
+        self.level = level #None for a slot index that only lists saves, as the menus use
         self.saveDirectory = "saves"
         self.currentSlot = 1
         self.ensureSaveDirectory()
@@ -56,11 +59,11 @@ class SaveSystem:
             with open(savePath, 'w') as f:
                 json.dump(saveData, f, indent=2)
             
-            print(f"Game saved successfully to slot {self.currentSlot}!")
+            saveLog.info("Game saved successfully to slot %d!", self.currentSlot)
             return True
 
         except Exception as e:
-            print(f"Error saving game: {e}")
+            saveLog.error("Error saving game: %s", e)
             return False
 
     def loadGame(self, slot=None):
@@ -70,7 +73,7 @@ class SaveSystem:
         try:
             savePath = self.getSaveFilePath(self.currentSlot)
             if not os.path.exists(savePath):
-                print(f"No save file found in slot {self.currentSlot}!")
+                saveLog.warning("No save file found in slot %d!", self.currentSlot)
                 return False
 
             with open(savePath, 'r') as f:
@@ -85,11 +88,11 @@ class SaveSystem:
             # Load time data
             self.loadTimeData(saveData['time'])
             
-            print(f"Game loaded successfully from slot {self.currentSlot}!")
+            saveLog.info("Game loaded successfully from slot %d!", self.currentSlot)
             return True
 
         except Exception as e:
-            print(f"Error loading game: {e}")
+            saveLog.error("Error loading game: %s", e)
             return False
 
     def getSaveSlotsInfo(self):
@@ -120,7 +123,7 @@ class SaveSystem:
         savePath = self.getSaveFilePath(slot)
         if os.path.exists(savePath):
             os.remove(savePath)
-            print(f"Save slot {slot} deleted!")
+            saveLog.info("Save slot %d deleted!", slot)
             return True
         return False
 
@@ -136,7 +139,7 @@ class SaveSystem:
 
     def getSoilData(self):
         soilData = []
-        for soil in self.level.soilTiles:
+        for soil in self.level.world.query('tillable'):
             soilData.append({
                 'position': {
                     'x': soil.rect.x,
@@ -148,7 +151,7 @@ class SaveSystem:
 
     def getCropData(self):
         cropData = []
-        for crop in self.level.crops:
+        for crop in self.level.world.query('growable'):
             cropData.append({
                 'position': {
                     'x': crop.rect.x,
@@ -163,7 +166,7 @@ class SaveSystem:
 
     def getTreeData(self):
         treeData = []
-        for tree in self.level.trees:
+        for tree in self.level.world.query('choppable'):
             treeData.append({
                 'position': {
                     'x': tree.rect.x,
@@ -176,21 +179,21 @@ class SaveSystem:
 
     def getItemData(self):
         itemData = []
-        for item in self.level.itemsGroup:
-            if hasattr(item, 'pickupKey'):
-                itemData.append({
-                    'position': {
-                        'x': item.rect.x,
-                        'y': item.rect.y
-                    },
-                    'type': item.pickupKey
-                })
+        for item in self.level.world.query('pickup'):
+            itemData.append({
+                'position': {
+                    'x': item.rect.x,
+                    'y': item.rect.y
+                },
+                'type': item.pickupKey,
+                'count': item.count
+            })
         return itemData
 
     def loadPlayerData(self, playerData):
         # Set player position
         pos = playerData['position']
-        self.level.player.rect.center = (pos['x'], pos['y'])
+        self.level.player.setPosition((pos['x'], pos['y']))
         
         # Set player money
         self.level.player.money = playerData['money']
@@ -220,7 +223,7 @@ class SaveSystem:
         # Load items on ground
         for itemData in farmData['items']:
             pos = itemData['position']
-            self.createGroundItem((pos['x'], pos['y']), itemData['type'])
+            self.createGroundItem((pos['x'], pos['y']), itemData['type'], itemData.get('count', 1))
 
     def loadTimeData(self, timeData):
         if hasattr(self.level, 'time'):
@@ -229,18 +232,14 @@ class SaveSystem:
             self.level.time.season = timeData['season']
 
     def clearFarmObjects(self):
-        for soil in self.level.soilTiles:
-            soil.kill()
-        for crop in self.level.crops:
-            crop.kill()
-        for item in self.level.itemsGroup:
-            item.kill()
+        for entity in self.level.world.query('tillable') + self.level.world.query('growable') + self.level.world.query('pickup'):
+            entity.kill()
 
     def createSoilTile(self, pos, tilled):
         from sprites import SoilTile
         soil = SoilTile(
             pos, 
-            groups=[self.level.allSprites, self.level.soilTiles],
+            groups=[self.level.allSprites, self.level.soilTiles, self.level.world],
             untiledImage=self.level.untiledSoil,
             tilledImage=self.level.tilledSoilImage
         )
@@ -249,7 +248,7 @@ class SaveSystem:
 
     def createCrop(self, pos, cropData):
         from sprites import Crop
-        crop = Crop(pos, cropData['type'], [self.level.allSprites, self.level.crops])
+        crop = Crop(pos, cropData['type'], [self.level.allSprites, self.level.crops, self.level.world])
         crop.stage = cropData['stage']
         crop.elapsedTime = cropData['growthProgress']
         crop.fullyGrown = cropData['fullyGrown']
@@ -258,10 +257,6 @@ class SaveSystem:
         if crop.growthStages and crop.stage < len(crop.growthStages):
             crop.image = crop.growthStages[crop.stage]
 
-    def createGroundItem(self, pos, itemType):
-        if itemType == 'wood':
-            from sprites import Wood
-            Wood(pos, self.level.woodSurf, [self.level.allSprites, self.level.itemsGroup])
-        elif itemType == 'stone':
-            from sprites import Stone
-            Stone(pos, self.level.stoneSurf, [self.level.allSprites, self.level.itemsGroup])
\ No newline at end of file
+    def createGroundItem(self, pos, itemType, count=1):
+        if itemType in ('wood', 'stone'):
+            self.level.dropItem(itemType, pos, count)
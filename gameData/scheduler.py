@@ -0,0 +1,63 @@
+import time
+
+PHASES = ('input', 'simulation', 'time', 'spawn', 'render') #run in this order, render once per frame and the rest once per tick
+SIM_PHASES = PHASES[:-1]
+
+class SystemScheduler: #runs each system once per tick in phase order and times it
+    def __init__(self, smoothing=0.1):
+        self.systems = {phase: [] for phase in PHASES} #phase -> [(name, system)] in registration order
+        self.smoothing = smoothing #weight of the newest sample in the running averages
+        self.lastTimes = {} #'phase' or 'phase.system' -> seconds taken the last time it ran
+        self.averageTimes = {} #same keys, exponential moving average in seconds
+        self.frameTimes = {} #same keys, seconds summed since the last takeFrameTimes, a frame can run several ticks
+        self.ticks = 0 #simulation ticks run so far
+
+    def add(self, phase, name, system): #system is called with deltaTime, or alpha for the render phase
+        if phase not in self.systems:
+            raise ValueError(f"Unknown phase '{phase}', expected one of {PHASES}")
+        if any(existing == name for existing, _ in self.systems[phase]):
+            raise ValueError(f"System '{name}' is already scheduled in phase '{phase}'")
+        self.systems[phase].append((name, system))
+
+    def record(self, key, seconds):
+        self.lastTimes[key] = seconds
+        self.frameTimes[key] = self.frameTimes.get(key, 0.0) + seconds
+        average = self.averageTimes.get(key)
+        self.averageTimes[key] = seconds if average is None else average + (seconds - average) * self.smoothing
+
+    def runPhase(self, phase, value):
+        phaseStart = time.perf_counter()
+        for name, system in self.systems[phase]:
+            start = time.perf_counter()
+            system(value)
+            self.record(f"{phase}.{name}", time.perf_counter() - start)
+        self.record(phase, time.perf_counter() - phaseStart)
+
+    def tick(self, deltaTime): #one fixed simulation step
+        for phase in SIM_PHASES:
+            self.runPhase(phase, deltaTime)
+        self.ticks += 1
+
+    def render(self, alpha):
+        self.runPhase('render', alpha)
+
+    def keys(self): #every timing key in run order, each phase followed by its systems
+        keys = []
+        for phase in PHASES:
+            keys.append(phase)
+            keys.extend(f"{phase}.{name}" for name, _ in self.systems[phase])
+        return keys
+
+    def takeFrameTimes(self): #this frame's summed timings, starting the next frame from zero
+        frameTimes = self.frameTimes
+        self.frameTimes = {}
+        return frameTimes
+
+    def report(self): #average milliseconds per phase, each followed by its systems, slowest first
+        lines = []
+        for phase in PHASES:
+            lines.append(f"{phase:<12}{self.averageTimes.get(phase, 0) * 1000:8.3f} ms")
+            names = sorted(self.systems[phase], key=lambda entry: -self.averageTimes.get(f"{phase}.{entry[0]}", 0))
+            for name, _ in names:
+                lines.append(f"  {name:<10}{self.averageTimes.get(f'{phase}.{name}', 0) * 1000:8.3f} ms")
+        return "\n".join(lines)
@@ -9,6 +9,13 @@ TILE_SIZE = 32
 BASE_WIDTH = 1280
 BASE_HEIGHT = 720
 
+# INTERNAL RENDER TARGET
+# the world is drawn at SCREEN size / RENDER_SCALE and scaled up RENDER_SCALE times, ZOOM already draws assets 1:1
+# so 2 draws 640x360 world pixels shown twice as large: a 2x closer camera over a quarter of the map area, not the same view drawn cheaper
+RENDER_SCALE = 1  # 1 draws the world straight to the display
+INTERNAL_WIDTH = SCREEN_WIDTH // RENDER_SCALE
+INTERNAL_HEIGHT = SCREEN_HEIGHT // RENDER_SCALE
+
 # ZOOM SCALE
 ZOOM_X = SCREEN_WIDTH / BASE_WIDTH  
 ZOOM_Y = SCREEN_HEIGHT / BASE_HEIGHT 
@@ -30,6 +37,119 @@ PLAYER_TOOL_OFFSET = {
     'down': Vector2(0, 50)
 }
 
+# GROUND CHUNKS
+GROUND_LAYERS = ('ground', 'grass&stone', 'stone', 'lake')  # TMX tile layers baked into ground chunks
+GROUND_OBJECT_LAYERS = ('barn', 'house', 'decor', 'lake object')  # static image objects baked in with them
+GROUND_CHUNK_TILES = 16  # chunk edge length in tiles
+GROUND_MAX_CHUNKS = 48  # LRU bound on resident chunk surfaces
+
+# SPATIAL INDEX
+SPATIAL_CELL_SIZE = 64  # bucket size in world pixels for SpatialGroup lookups
+
+# PICKUP
+PICKUP_RADIUS = 50  # how close an item must be for the F key pickup, in pixels
+PICKUP_MAGNET_RADIUS = 0  # items within this radius drift to the player and are collected, 0 turns it off
+PICKUP_MAGNET_SPEED = 160  # pixels per second items drift at
+
+# GROUND ITEM STACKS
+ITEM_STACK_RADIUS = 24  # a drop this close to a stack of the same item joins it
+GROUND_ITEM_LIMIT = 64  # past this many stacks, drops merge into the closest stack of their kind
+
+# SPRITE POOLS
+POOL_MAX_SIZE = 256  # free sprites each pool keeps for reuse
+
+# TEXTURE ATLAS
+ATLAS_DIR = 'graphics/atlas'  # packed sheets and their JSON frame maps, rebuilt with: python atlas.py
+ATLAS_SHEETS = {  # sheet name -> source folders packed into it
+    'character': ['graphics/character'],
+    'crops': ['graphics/overlay'],
+    'icons': ['graphics/items', 'graphics/seeds', 'graphics/leaves', 'graphics/stump', 'graphics/soil']
+}
+ATLAS_MAX_WIDTH = 1024  # shelf width in pixels
+ATLAS_PADDING = 1  # transparent gap around every frame
+
+# ASSET LOADING
+LOADER_WORKERS = 4  # decode threads, pygame releases the GIL while it decodes
+LOADER_POLL_BUDGET = 4  # ms of convert_alpha work per menu idle tick, keeps the menu responsive
+MENU_IDLE_WAIT = 16  # ms the menu sleeps between idle ticks while assets stream in
+STARTUP_ASSETS = [  # decoded behind the menu, the atlas sheets are added by loader.startupAssets
+    'graphics/tilesets/spring farm tilemap.png',
+    'graphics/tilesets/spring and summer objects.png',
+    'graphics/tilesets/farm bridges.png',
+    'graphics/tilesets/plants.png',
+    'graphics/tilesets/items.png',
+    'graphics/tilesets/barn.png',
+    'assets/inventory/slot.png',
+    'assets/inventory/selected.png'
+]
+
+# PROFILING
+PROFILE_DIR = 'profiles'  # start-up reports (python main.py --profile-startup), telemetry CSVs and frame captures are written here
+PROFILE_FRAMES = 120  # main loop iterations one frame capture covers
+PROFILE_TOP = 40  # functions listed in a capture's text report
+
+# MEMORY DIAGNOSTICS
+MEMORY_TRACE_FRAMES = 8  # stack depth tracemalloc keeps per allocation when run with --trace-memory
+MEMORY_TOP = 15  # allocation sites listed per snapshot report
+MEMORY_TREND_DAYS = 3  # a group or class that grew at this many day boundaries in a row is flagged
+
+# EVENT LOG
+EVENT_LOG_LEVEL = 'info'  # lowest level kept: 'debug', 'info', 'warning', 'error' or 'off'
+EVENT_LOG_MUTED = []  # categories dropped at any level, e.g. ['growth', 'input']
+EVENT_LOG_SIZE = 4096  # events held between flushes, the oldest are dropped past this
+EVENT_LOG_FLUSH_INTERVAL = 0.5  # seconds between background flushes
+EVENT_LOG_FILE = None  # None prints to the console, a path appends there instead
+
+# TELEMETRY
+TELEMETRY_WINDOW = 3600  # frames kept for percentiles and CSV export, a minute at 60 fps
+TELEMETRY_PERCENTILES = (50, 95, 99)
+
+# DEBUG HUD
+HUD_REFRESH = 250  # ms between text refreshes while the HUD is shown, the graph updates every frame
+HUD_GRAPH_FRAMES = 120  # frames shown in the frame-time graph
+HUD_GRAPH_SIZE = (240, 60)
+HUD_GRAPH_MAX_MS = 33.3  # frame time at the top of the graph
+HUD_FRAME_BUDGET_MS = 1000 / 60  # frames over this line are drawn red
+
+# CONTROLS
+# action -> key names as pygame.key.name gives them, ActionMap.rebind changes them at runtime
+KEY_BINDINGS = {
+    'moveUp': ['up'],
+    'moveDown': ['down'],
+    'moveLeft': ['left'],
+    'moveRight': ['right'],
+    'useTool': ['space'],
+    'switchTool': ['t'],
+    'useSeed': ['left ctrl'],
+    'switchSeed': ['e'],
+    'harvest': ['h'],
+    'pickup': ['f'],
+    'sleep': ['z'],
+    'inventory': ['i'],
+    'inventoryNext': ['e'],
+    'inventoryPrev': ['q'],
+    'shop': ['b'],
+    'shopUp': ['w', 'page up'],
+    'shopDown': ['s', 'page down'],
+    'shopMode': ['tab'],
+    'shopConfirm': ['space'],
+    'shopClose': ['escape'],
+    'save': ['f5'],
+    'debugHud': ['f3'],
+    'profileFrames': ['f10'],  # cProfile the next PROFILE_FRAMES frames, kill -USR1 does the same
+    'exportTelemetry': ['f8'],  # frame times to CSV in PROFILE_DIR
+    'load': ['f9'],
+    'debugMorning': ['1'],  # time of day debug keys
+    'debugNoon': ['2'],
+    'debugEvening': ['3'],
+    'debugNight': ['4'],
+    'debugHour': ['5'],
+    'debugSixHours': ['6']
+}
+
+# FENCES
+FENCE_BAKE_TILES = 32  # fence tiles are baked into composite surfaces per block of this many tiles
+
 # LAYERS
 LAYERS = {
     'water': 0,
@@ -43,7 +163,15 @@ LAYERS = {
 
 #Time System
 TIME_RATE = 60  # 1 real second equals 60 in-game seconds
-DAY_LENGTH = 24 * TIME_RATE  # Total in-game seconds in a day
+DAY_LENGTH = 24 * TIME_RATE  # Total in-game minutes in a day
+GAME_MINUTES_PER_SECOND = TIME_RATE / 60  # every update(deltaTime) takes deltaTime in real seconds
+
+# SIMULATION
+SIM_RATE = 60  # fixed simulation steps per second
+SIM_STEP = 1 / SIM_RATE  # seconds per simulation step
+MAX_FRAME_TIME = 0.25  # longest frame fed to the simulation, stops the spiral of death
+RENDER_FPS = 0  # render frame cap, 0 means uncapped
+VSYNC = False  # sync presentation to the display refresh
 
 #DAY NIGHT COLOURS
 NIGHT_COLOUR = (25, 25, 50, 180) # Dark blue with transparency
@@ -1,5 +1,9 @@
 import pygame
 from settings import *
+from eventLog import eventLog
+
+economyLog = eventLog.category('economy')
+assetLog = eventLog.category('assets')
 
 class Shop:
     def __init__(self, level):
@@ -11,10 +15,6 @@ class Shop:
         self.items_per_page = 6
         self.current_page = 0
         
-        # Input delay to prevent rapid movement
-        self.input_delay = 200
-        self.last_input_time = 0
-        
         # Items available for purchase
         self.buyItems = [
             {'name': 'wood', 'price': 10, 'description': 'Wood (10g)'},
@@ -65,38 +65,46 @@ class Shop:
         
         # Font - CORRECT PATH to assets/fonts
         try:
-            print("Loading ThaleahFat font from assets/fonts...")
             self.font = pygame.font.Font("assets/fonts/ThaleahFat.ttf", 32)
             self.smallFont = pygame.font.Font("assets/fonts/ThaleahFat.ttf", 24)
-            print("Successfully loaded ThaleahFat font")
+            assetLog.debug("Loaded ThaleahFat font")
         except Exception as e:
-            print(f"Error loading ThaleahFat font: {e}")
+            assetLog.warning("Error loading ThaleahFat font: %s", e)
             try:
-                print("Trying Pixellari font from assets/fonts...")
                 self.font = pygame.font.Font("assets/fonts/Pixellari.ttf", 32)
                 self.smallFont = pygame.font.Font("assets/fonts/Pixellari.ttf", 24)
-                print("Successfully loaded Pixellari font")
+                assetLog.debug("Loaded Pixellari font instead")
             except Exception as e2:
-                print(f"Error loading Pixellari font: {e2}")
-                print("Using system font as fallback")
+                assetLog.warning("Error loading Pixellari font: %s - using system font as fallback", e2)
                 self.font = pygame.font.SysFont(None, 32)
                 self.smallFont = pygame.font.SysFont(None, 24)
 
-    def can_process_input(self):
-        current_time = pygame.time.get_ticks()
-        return current_time - self.last_input_time >= self.input_delay
+    def input(self, actions): #shop keys arrive once per press from the action map, so no input delay is needed
+        if actions.wasPressed('shop'):
+            self.toggle()
+        if not self.visible:
+            return
+        if actions.wasPressed('shopUp'):
+            self.selectPrev()
+        if actions.wasPressed('shopDown'):
+            self.selectNext()
+        if actions.wasPressed('shopMode'):
+            self.switchMode()
+        if actions.wasPressed('shopConfirm'):
+            if self.mode == 'buy':
+                self.buyItem()
+            else:
+                self.sellItem()
+        if actions.wasPressed('shopClose'):
+            self.visible = False
 
     def toggle(self):
         self.visible = not self.visible
         if self.visible:
             self.selectedIndex = 0
             self.current_page = 0
-            self.last_input_time = pygame.time.get_ticks()
 
     def selectNext(self):
-        if not self.can_process_input():
-            return
-            
         if self.mode == 'buy':
             total_items = len(self.buyItems)
         else:
@@ -108,13 +116,8 @@ class Shop:
             self.current_page = 0
         elif self.selectedIndex >= (self.current_page + 1) * self.items_per_page:
             self.current_page += 1
-        
-        self.last_input_time = pygame.time.get_ticks()
 
     def selectPrev(self):
-        if not self.can_process_input():
-            return
-            
         if self.mode == 'buy':
             total_items = len(self.buyItems)
         else:
@@ -126,65 +129,37 @@ class Shop:
             self.current_page = (total_items - 1) // self.items_per_page
         elif self.selectedIndex < self.current_page * self.items_per_page:
             self.current_page -= 1
-        
-        self.last_input_time = pygame.time.get_ticks()
 
     def switchMode(self):
-        if not self.can_process_input():
-            return
-            
         self.mode = 'sell' if self.mode == 'buy' else 'buy'
         self.selectedIndex = 0
         self.current_page = 0
-        self.last_input_time = pygame.time.get_ticks()
-
-    def toggle(self):
-        currentTime = pygame.time.get_ticks()
-
-        if hasattr(self, 'lastToggleTime'):
-            if currentTime - self.lastToggleTime < 300:  # 300 ms delay
-                return
-            
-        self.visible = not self.visible
-        if self.visible:
-            self.selectedIndex = 0
-            self.current_page = 0
-            self.lastInputTime = currentTime
-        
-        self.lastToggleTime = currentTime
 
     def canAfford(self, price):
         return self.level.player.money >= price
 
     def buyItem(self):
-        if not self.can_process_input():
-            return False
-            
         if self.mode != 'buy' or self.selectedIndex >= len(self.buyItems):
             return False
         
         item = self.buyItems[self.selectedIndex]
         
         if not self.canAfford(item['price']):
-            print(f"Cannot afford {item['name']}!")
+            economyLog.info("Cannot afford %s!", item['name'])
             return False
         
         self.level.player.money -= item['price']
         success = self.level.player.inventory.addItem(item['name'], 1)
         
         if success:
-            print(f"Bought {item['name']} for {item['price']}g")
-            self.last_input_time = pygame.time.get_ticks()
+            economyLog.info("Bought %s for %dg", item['name'], item['price'])
             return True
         else:
             self.level.player.money += item['price']
-            print("Inventory full!")
+            economyLog.warning("Inventory full!")
             return False
 
     def sellItem(self):
-        if not self.can_process_input():
-            return False
-            
         if self.mode != 'sell' or not self.level.player.inventory.items:
             return False
         
@@ -198,10 +173,9 @@ class Shop:
         self.level.player.money += sell_price
         self.level.player.inventory.removeItem(self.selectedIndex, 1)
         
-        # Use display name for the print message
+        # Use display name for the log message
         display_name = self.displayNames.get(item_name, item_name)
-        print(f"Sold {display_name} for {sell_price}g")
-        self.last_input_time = pygame.time.get_ticks()
+        economyLog.info("Sold %s for %dg", display_name, sell_price)
         return True
 
     def getCurrentPageItems(self):
@@ -0,0 +1,80 @@
+import pygame
+from settings import SPATIAL_CELL_SIZE, TILE_SIZE
+
+class SpatialGroup(pygame.sprite.Group): #sprite group that also buckets its sprites by world position
+    def __init__(self, *sprites, cellSize=SPATIAL_CELL_SIZE):
+        self.cellSize = cellSize
+        self.cells = {} #(cellX, cellY) -> {sprite: None}, dicts keep insertion order so lookups are deterministic
+        self.spriteCells = {} #sprite -> cells it was filed under
+        super().__init__(*sprites)
+
+    def cellKeys(self, rect):
+        size = self.cellSize
+        left = int(rect.left) // size
+        top = int(rect.top) // size
+        right = int(max(rect.left, rect.right - 1)) // size #zero-size rects still occupy one cell
+        bottom = int(max(rect.top, rect.bottom - 1)) // size
+        return [(x, y) for y in range(top, bottom + 1) for x in range(left, right + 1)]
+
+    # pygame calls these whenever a sprite joins or leaves, including kill()
+    def add_internal(self, sprite, *args):
+        super().add_internal(sprite, *args)
+        self.insert(sprite)
+
+    def remove_internal(self, sprite):
+        super().remove_internal(sprite)
+        self.discard(sprite)
+
+    def insert(self, sprite):
+        keys = self.cellKeys(sprite.rect)
+        for key in keys:
+            self.cells.setdefault(key, {})[sprite] = None
+        self.spriteCells[sprite] = keys
+
+    def discard(self, sprite):
+        for key in self.spriteCells.pop(sprite, ()):
+            bucket = self.cells[key]
+            bucket.pop(sprite, None)
+            if not bucket:
+                del self.cells[key]
+
+    def move(self, sprite): #call after changing the rect of a sprite in the group
+        if self.cellKeys(sprite.rect) != self.spriteCells.get(sprite):
+            self.discard(sprite)
+            self.insert(sprite)
+
+    def query(self, rect): #sprites whose rect overlaps rect, touching only nearby cells
+        rect = pygame.Rect(rect)
+        found = {}
+        for key in self.cellKeys(rect):
+            for sprite in self.cells.get(key, ()):
+                if sprite not in found and sprite.rect.colliderect(rect):
+                    found[sprite] = None
+        return list(found)
+
+class PickupIndex(SpatialGroup): #ground items bucketed by tile, so pickup checks only look at nearby tiles
+    def __init__(self, *sprites):
+        super().__init__(*sprites, cellSize=TILE_SIZE)
+
+    def near(self, pos, radius): #items whose centre is within radius of pos, nearest first
+        x, y = pos
+        area = pygame.Rect(x - radius, y - radius, radius * 2, radius * 2)
+        found = []
+        for sprite in self.query(area):
+            dx = sprite.rect.centerx - x
+            dy = sprite.rect.centery - y
+            distanceSquared = dx * dx + dy * dy
+            if distanceSquared <= radius * radius:
+                found.append((distanceSquared, sprite))
+        found.sort(key=lambda entry: entry[0])
+        return [sprite for _, sprite in found]
+
+    def pull(self, sprite, target, distance): #move an item up to distance pixels towards target
+        offset = pygame.math.Vector2(target) - sprite.rect.center
+        if offset.length() <= distance:
+            sprite.rect.center = target
+        else:
+            offset.scale_to_length(distance)
+            sprite.rect.center = (round(sprite.rect.centerx + offset.x), round(sprite.rect.centery + offset.y))
+        sprite.hitbox.center = sprite.rect.center
+        self.move(sprite)
@@ -4,57 +4,116 @@ import os
 import random
 from settings import *
 from timer import Timer
+from support import scaleByZoom, loadImage
+from eventLog import eventLog
+
+growthLog = eventLog.category('growth')
+assetLog = eventLog.category('assets')
+
+class Entity(pygame.sprite.Sprite): #base for world objects, slotted so thousands of them stay small
+    # '_Sprite__g' is the group set pygame's Sprite keeps. Sprite itself defines no __slots__, so instances still have a __dict__
+    # and a misspelt attribute still lands in it; it stays empty because every attribute the game sets has a slot
+    __slots__ = ('_Sprite__g', 'image', 'rect', 'z', 'alive')
+
+    # components this class has, the World files every instance under each of them (see ecs.py)
+    components = frozenset()
+
+    # shared by every instance of a class instead of stored per sprite
+    pickupKey = None #inventory key for pickups
+    icon = None #inventory icon for pickups
+    moving = False #keeps previousPos/pos, so the camera interpolates it
+
+    def __init__(self):
+        super().__init__() #groups are joined by each subclass once the rect exists
+        self.alive = True #alive status
+
+    def has(self, component):
+        return component in self.components
+
+class Generic(Entity):
+    __slots__ = ('hitbox',)
+    components = frozenset({'renderable'})
 
-class Generic(pygame.sprite.Sprite):
     def __init__(self, pos, surf, groups, z=LAYERS['main']): #default layer is 'main' layer
-        super().__init__(groups) #initialize parent class with groups
+        super().__init__() #initialize parent class, groups are joined once the rect exists
         self.image = surf #set image
         self.rect = self.image.get_rect(topleft=pos)    #set rect at position
         self.z = z #layer for rendering order
         self.hitbox = self.rect.copy().inflate(-self.rect.width * 0.2, -self.rect.height * 0.75) #smaller hitbox
-        self.pickup = False #default no pickup
-        self.pickupKey = None #default no pickup key
-        self.icon = None #default no icon
-        self.alive = True    #alive status
+        self.add(groups) #spatial groups bucket by rect, so join last
 
     def destroy(self): #method to destroy the object
         self.alive = False #set alive to false
         self.kill() #remove from all groups
 
-class Particle(pygame.sprite.Sprite):
+class Rock(Generic): #map rock, blocks the player until broken
+    __slots__ = ()
+    components = frozenset({'renderable', 'collider', 'breakable'})
+
+class Collider(Entity): #invisible collision-only sprite, no image or pixel memory
+    __slots__ = ('hitbox',)
+    components = frozenset({'collider'})
+
+    def __init__(self, rect, groups, hitbox=None):
+        super().__init__()
+        self.rect = pygame.Rect(rect) #area covered
+        self.hitbox = self.rect.copy() if hitbox is None else pygame.Rect(hitbox) #area the player collides with
+        self.add(groups) #collision groups only, the camera group refuses colliders
+
+class Particle(Entity):
+    __slots__ = ('originalImage', 'pos', 'previousPos', 'velocity', 'duration', 'elapsed', 'pool')
+    components = frozenset({'renderable'})
+    moving = True
+
     def __init__(self, pos, surf, groups, velocity, duration=2000, z=LAYERS['abovePlayer']): #duration in milliseconds
-        super().__init__(groups) #initialize parent class with groups
-        self.originalImage = surf.copy() #store original image
-        self.image = self.originalImage.copy() #current image
-        self.rect = self.image.get_rect(center=pos) #center at position
-        self.velocity = pygame.math.Vector2(velocity[0], velocity[1]) #velocity vector
+        super().__init__() #groups are joined in reset
+        self.pool = None #pool this particle goes back to when killed
+        self.rect = pygame.Rect(0, 0, 0, 0) #reused for the particle's whole life, and across pool reuse
+        self.pos = pygame.math.Vector2() #float centre, rect is rounded from it
+        self.previousPos = pygame.math.Vector2() #centre at the previous step, for render interpolation
+        self.velocity = pygame.math.Vector2() #velocity vector
+        self.reset(pos, surf, groups, velocity, duration, z)
+
+    def reset(self, pos, surf, groups, velocity, duration=2000, z=LAYERS['abovePlayer']): #(re)initialise in place
+        self.originalImage = surf #shared, never drawn on, so no copy needed
+        self.image = surf #current image
+        self.rect.size = surf.get_size()
+        self.rect.center = pos #center at position
+        self.pos.update(self.rect.center)
+        self.previousPos.update(self.pos)
+        self.velocity.update(velocity[0], velocity[1])
         self.duration = duration #duration in milliseconds
-        self.startTime = pygame.time.get_ticks() #start time in milliseconds
+        self.elapsed = 0 #simulated milliseconds since spawn
         self.z = z #layer for rendering order
         self.alive = True
+        self.add(*groups) #initialize groups
+
+    def kill(self):
+        super().kill()
+        if self.pool:
+            pool, self.pool = self.pool, None #cleared first so a second kill can't release twice
+            pool.release(self)
 
-    def update(self, deltaTime):
+    def update(self, deltaTime): #deltaTime in seconds
         if not self.alive:
             return
-            
-        # Convert deltaTime to seconds
-        dtSeconds = deltaTime / 1000.0
-        
+
+        self.previousPos.update(self.pos)
+
         # Add gravity effect
-        self.velocity.y += 100 * dtSeconds
+        self.velocity.y += 100 * deltaTime
         
         # Add some air resistance
         self.velocity.x *= 0.99
         self.velocity.y *= 0.99
         
         # Update position
-        self.rect.x += self.velocity.x * dtSeconds
-        self.rect.y += self.velocity.y * dtSeconds
+        self.pos += self.velocity * deltaTime
         
         # Handle fade out
-        elapsed = pygame.time.get_ticks() - self.startTime
-        if elapsed < self.duration:
-            progress = elapsed / self.duration
+        self.elapsed += deltaTime * 1000
+        if self.elapsed < self.duration:
+            progress = self.elapsed / self.duration
             alpha = max(0, int(255 * (1 - progress)))
             
             # Scale down over time
@@ -65,52 +124,52 @@ class Particle(pygame.sprite.Sprite):
             self.image = pygame.transform.scale(self.originalImage, (new_width, new_height))
             self.image.set_alpha(alpha)
             
-            # Update rect to maintain center
-            old_center = self.rect.center
-            self.rect = self.image.get_rect()
-            self.rect.center = old_center
+            # Keep the rect centred on the float position
+            self.rect.size = (new_width, new_height)
+            self.rect.center = (round(self.pos.x), round(self.pos.y))
             
         else:
             self.alive = False
             self.kill()
 
-class Tree(pygame.sprite.Sprite):
+class Tree(Entity):
+    __slots__ = ('hitbox', 'name', 'health', 'isChopped', 'logsSpawned', 'playerAdded', 'hitboxSprite', 'invulStart', 'stumpCreated')
+    components = frozenset({'renderable', 'choppable'}) #collision is a separate Collider
+    maxHealth = 5
+    invulDuration = 500 #invulnerability duration in milliseconds
+
+    # loaded by the first tree and shared by all of them
+    stumpSurf = None
+    leafImages = None
+
     def __init__(self, pos, surf, groups, name, playerAdded):
-        super().__init__(groups)
+        super().__init__()
         self.image = surf
         self.rect = self.image.get_rect(topleft=pos)
         self.hitbox = self.rect.copy().inflate(-self.rect.width * 0.2, -self.rect.height * 0.75)
         self.z = LAYERS['main']
+        self.add(groups) #after the rect, for the spatial groups
         self.name = name
         
         # Health system
-        self.maxHealth = 5
         self.health = self.maxHealth #start with full health
-        self.alive = True   #tree is alive
         self.isChopped = False #not chopped initially
         self.logsSpawned = False #logs not spawned yet
         self.playerAdded = playerAdded #whether player planted the tree
         self.hitboxSprite = None #reference to hitbox sprite if any
-        self.invulDuration = 500 #invulnerability duration in milliseconds
         self.invulStart = 0 #time when invulnerability started
         self.stumpCreated = False #whether stump is created
-        
-        # Stump surface
-        self.stumpSurf = self.loadStumpSurface()
-        
-        # Load leaf images
-        self.leafImages = self.loadLeafImages()
-        
+
+        if Tree.leafImages is None:
+            Tree.stumpSurf = self.loadStumpSurface()
+            Tree.leafImages = self.loadLeafImages()
+
     def loadStumpSurface(self):
         stumpPath = os.path.join("graphics", "stump", "0.png")
         if os.path.exists(stumpPath): 
             try:
-                stump = pygame.image.load(stumpPath).convert_alpha() #load image
-                stump = pygame.transform.scale(
-                    stump,
-                    (int(stump.get_width() * ZOOM_X), int(stump.get_height() * ZOOM_Y)) #scale image
-                )
-                return stump
+                stump = loadImage(stumpPath) #load image
+                return scaleByZoom(stump) #scale image
             except Exception:
                 pass
         
@@ -137,7 +196,7 @@ class Tree(pygame.sprite.Sprite):
                 leaf_path = os.path.join(leaf_folder, filename)
                 
                 try:
-                    leaf_surf = pygame.image.load(leaf_path).convert_alpha()
+                    leaf_surf = loadImage(leaf_path)
                     # Scale to reasonable size
                     base_width = leaf_surf.get_width()
                     base_height = leaf_surf.get_height()
@@ -181,7 +240,8 @@ class Tree(pygame.sprite.Sprite):
         
         # spawn leaves when chopped
         if particlesGroup is not None and allSpritesGroup is not None:
-            self.spawnLeaves(particlesGroup, allSpritesGroup)
+            self.spawnLeaves(particlesGroup, allSpritesGroup, player.level.particlePool if player else None,
+                             player.level.world if player else None)
 
         # Check if tree should be chopped down
         if self.health <= 0:
@@ -201,26 +261,28 @@ class Tree(pygame.sprite.Sprite):
                     offset_x = random.randint(-20, 20) #random offset
                     offset_y = random.randint(-10, 10) #random offset
                     logPos = (self.rect.centerx + offset_x, self.rect.centery + offset_y) #position with offset
-                    groups = [allSpritesGroup]
-                    if hasattr(player.level, 'itemsGroup'): #add to items group if exists
-                        groups.append(player.level.itemsGroup)
-                    Wood(logPos, player.level.woodSurf, groups)
+                    player.level.dropItem('wood', logPos) #merges into a nearby wood stack if there is one
             
             # Create stump
             if not self.stumpCreated and allSpritesGroup:
                 self.stumpCreated = True
                 stumpPos = (self.rect.centerx - self.stumpSurf.get_width() // 2, 
                         self.rect.bottom - self.stumpSurf.get_height())
-                Stump(stumpPos, self.stumpSurf, [allSpritesGroup], z=LAYERS['main'])
+                stumpGroups = [allSpritesGroup, player.level.world] if player else [allSpritesGroup]
+                Stump(stumpPos, self.stumpSurf, stumpGroups, z=LAYERS['main'])
             
             self.kill()
             return True
             
         return True
 
-    def spawnLeaves(self, particlesGroup, allSpritesGroup): # Spawn leaf particles
+    def spawnLeaves(self, particlesGroup, allSpritesGroup, pool=None, world=None): # Spawn leaf particles
         if not self.leafImages:
             return
+
+        groups = [particlesGroup, allSpritesGroup, world] if world is not None else [particlesGroup, allSpritesGroup]
+
+        spawnParticle = pool.acquire if pool else Particle #recycle killed particles when a pool is given
             
         numLeaves = random.randint(10, 15)
         
@@ -241,10 +303,13 @@ class Tree(pygame.sprite.Sprite):
             duration = random.randint(1500, 2500)
             
             # Create particle
-            Particle(pos, leaf_surf, [particlesGroup, allSpritesGroup], 
+            spawnParticle(pos, leaf_surf, groups, 
                     (velocityX, velocityY), duration=duration, z=LAYERS['abovePlayer'])
 
 class Stump(Generic):
+    __slots__ = ('duration', 'start')
+    components = frozenset({'renderable', 'expiring'})
+
     def __init__(self, pos, surf, groups, z=LAYERS['main'], duration=None): #duration=None means permanent
         super().__init__(pos, surf, groups, z) #call parent constructor
         self.duration = duration #duration in milliseconds
@@ -256,20 +321,28 @@ class Stump(Generic):
         if pygame.time.get_ticks() - self.start >= self.duration: #time to remove
             self.kill()
 
-class Crop(pygame.sprite.Sprite):
+class Crop(Entity):
+    __slots__ = ('cropName', 'growthStages', 'stage', 'growthTime', 'elapsedTime', 'fullyGrown', 'harvested')
+    components = frozenset({'renderable', 'growable'})
+    stageCache = {} #cropName -> growth stage surfaces, shared by every crop of that kind
+
     def __init__(self, pos, cropName, groups):
-        super().__init__(groups)
+        super().__init__()
         self.cropName = cropName
-        self.growthStages = self.loadGrowthStages(cropName)
+        if cropName not in Crop.stageCache:
+            Crop.stageCache[cropName] = self.loadGrowthStages(cropName)
+        self.growthStages = Crop.stageCache[cropName]
         self.stage = 0
         self.image = self.growthStages[self.stage] if self.growthStages else self.createFallbackSurface() #fallback
         self.rect = self.image.get_rect(topleft=pos) #position
         self.growthTime = GROW_SPEED.get(cropName, 7 * DAY_LENGTH) #default 7 days
-        self.elapsedTime = 0 #time since planted
+        self.elapsedTime = 0 #in-game minutes since planted
         self.fullyGrown = False #flag
+        self.harvested = False #flag
         self.z = LAYERS['crops']  # Use the 'crops' layer which is above soil
+        self.add(groups) #after the rect, for the spatial groups
         
-        print(f"Planted {cropName} - Total growth time: {self.growthTime}ms, Stages: {len(self.growthStages)}")
+        growthLog.debug("Planted %s - total growth time %s in-game minutes, %d stages", cropName, self.growthTime, len(self.growthStages))
 
     def createFallbackSurface(self):
         surf = pygame.Surface((int(32 * ZOOM_X), int(32 * ZOOM_Y)), pygame.SRCALPHA)
@@ -283,48 +356,41 @@ class Crop(pygame.sprite.Sprite):
     def loadGrowthStages(self, cropName):
         stages = []
         folderPath = os.path.join("graphics", "overlay", cropName) #path to crop folder
-        print(f"Looking for crop folder: {folderPath}")
         
         if not os.path.exists(folderPath): 
-            print(f"Crop folder not found: {folderPath}")
+            assetLog.warning("Crop folder not found: %s", folderPath)
             return stages
             
         # Look for both .png and .PNG files
         files = [f for f in os.listdir(folderPath) if f.lower().endswith('.png')] #both .png and .PNG
-        print(f"Found {len(files)} PNG files: {files}")
         
         if not files:
-            print(f"No PNG files found in: {folderPath}")
+            assetLog.warning("No PNG files found in: %s", folderPath)
             return stages
             
         # Sort files numerically (0.png, 1.png, 2.png, etc.)
         try:
             files.sort(key=lambda x: int(os.path.splitext(x)[0]))
         except ValueError:
-            print(f"Warning: Could not sort files numerically. Using default sort.")
-            files.sort()
+            files.sort() #not all numbered, fall back to name order
             
-        print(f"Sorted files: {files}")
-        
         # Load all growth stages (0 through 4 for growth, 5 for harvest)
         for fileName in files: #load each image
             try:
                 filePath = os.path.join(folderPath, fileName)
-                img = pygame.image.load(filePath).convert_alpha() #load
-                img = pygame.transform.scale(img, (int(img.get_width() * ZOOM_X), int(img.get_height() * ZOOM_Y))) #scale
+                img = loadImage(filePath) #load, from the atlas when packed
+                img = scaleByZoom(img) #scale
                 stages.append(img)
-                print(f"Loaded crop stage {fileName}: {img.get_size()}")
             except Exception as e:
-                print(f"Error loading crop image {fileName}: {e}")
+                assetLog.error("Error loading crop image %s: %s", fileName, e)
         
-        print(f"Successfully loaded {len(stages)} growth stages for {cropName}")
         return stages
 
-    def update(self, deltaTime):
+    def update(self, deltaTime): #deltaTime in seconds
         if self.fullyGrown or not self.growthStages: 
             return
             
-        self.elapsedTime = self.elapsedTime + deltaTime #increment elapsed time in milliseconds
+        self.elapsedTime = self.elapsedTime + deltaTime * GAME_MINUTES_PER_SECOND #growth runs on the in-game clock
         
         # Calculate which stage we should be at based on total elapsed time
         totalStages = len(self.growthStages) - 1  # We have stages 0-4 for growth (5 stages total)
@@ -337,12 +403,12 @@ class Crop(pygame.sprite.Sprite):
         if targetStage > self.stage:
             self.stage = targetStage
             self.image = self.growthStages[self.stage] #update image
-            print(f"{self.cropName} grew to stage {self.stage}/{totalStages - 1} (elapsed: {self.elapsedTime}ms, per stage: {timePerStage}ms)")
+            growthLog.debug("%s grew to stage %d/%d (elapsed: %.0f, per stage: %.0f in-game minutes)", self.cropName, self.stage, totalStages - 1, self.elapsedTime, timePerStage)
 
             # Check if fully grown (at the last growth stage before harvest)
             if self.stage == totalStages - 1: 
                 self.fullyGrown = True
-                print(f"🎉 {self.cropName} is fully grown and ready to harvest!")
+                growthLog.info("%s is fully grown and ready to harvest", self.cropName)
 
     def harvest(self, player = None):
         if self.fullyGrown and not self.harvested:
@@ -352,7 +418,7 @@ class Crop(pygame.sprite.Sprite):
             harvestedStage = len(self.growthStages) - 1
             if harvestedStage < len(self.growthStages):
                 self.image = self.growthStages[harvestedStage]
-                print(f"{self.cropName} harvested! Showing stage {harvestedStage}")
+                growthLog.debug("%s harvested, showing stage %d", self.cropName, harvestedStage)
             
             # Return the crop item to add to inventory
             cropItem = self.getHarvestItem()
@@ -399,15 +465,19 @@ class Crop(pygame.sprite.Sprite):
         progress = min(1.0, self.elapsedTime / self.growthTime)
         return progress
 
-class SoilTile(pygame.sprite.Sprite):
+class SoilTile(Entity):
+    __slots__ = ('untiledImage', 'tilledImage', 'tilled')
+    components = frozenset({'renderable', 'tillable'})
+
     def __init__(self, pos, groups, untiledImage, tilledImage):
-        super().__init__(groups)
+        super().__init__()
         self.untiledImage = untiledImage #surface for untilled
         self.tilledImage = tilledImage  #surface for tilled
         self.image = self.untiledImage #start as untilled
         self.rect = self.image.get_rect(topleft=pos) #position of tile
         self.tilled = False
         self.z = LAYERS['soil']
+        self.add(groups) #after the rect, for the spatial groups
 
     def till(self):
         self.image = self.tilledImage
@@ -416,61 +486,87 @@ class SoilTile(pygame.sprite.Sprite):
     def water(self):
         pass
 
-class Wood(Generic):
-    def __init__(self, pos, surf, groups):
+class GroundItem(Generic): #a stack of pickup items lying on the ground
+    __slots__ = ('count', 'pool')
+    components = frozenset({'renderable', 'pickup'}) #pickupKey is set by each item type, icon is built by the first drop of a type
+
+    def __init__(self, pos, surf, groups, count=1):
         super().__init__(pos, surf, groups, LAYERS['main']) #call parent constructor
-        self.pickup = True
-        self.pickupKey = 'wood' #key for inventory
-        self.itemName = 'wood' #name for inventory
-        self.icon = pygame.transform.scale(surf, (32, 32)) #icon for inventory
+        self.count = count #how many items this stack holds
+        self.pool = None #pool this item goes back to when killed
+        itemType = type(self)
+        if itemType.icon is None:
+            itemType.icon = self.buildIcon(surf) #icon for inventory, shared by every drop of this type
+        self.hitbox = self.rect.copy().inflate(-self.rect.width * 0.5, -self.rect.height * 0.5) #smaller hitbox
 
-        if self.icon.get_size() == (0, 0) or self.icon.get_width() == 0:
+    def reset(self, pos, surf, groups, count=1): #reuse a pooled item in place, rects included
+        self.image = surf
+        self.rect.size = surf.get_size()
+        self.rect.topleft = pos
+        self.hitbox.update(self.rect)
+        self.hitbox.inflate_ip(-self.rect.width * 0.5, -self.rect.height * 0.5)
+        self.count = count
+        self.alive = True
+        self.add(*groups) #joined last so spatial groups bucket the new rect
+
+    def kill(self):
+        super().kill()
+        if self.pool:
+            pool, self.pool = self.pool, None #cleared first so a second kill can't release twice
+            pool.release(self)
+
+class Wood(GroundItem):
+    __slots__ = ()
+    pickupKey = 'wood'
+
+    @staticmethod
+    def buildIcon(surf):
+        icon = pygame.transform.scale(surf, (32, 32))
+
+        if icon.get_size() == (0, 0) or icon.get_width() == 0:
             try:
                 # Try to load the wood image directly
                 wood_path = os.path.join("graphics", "items", "wood.png")
                 if os.path.exists(wood_path):
-                    wood_img = pygame.image.load(wood_path).convert_alpha()
-                    self.icon = pygame.transform.scale(wood_img, (32, 32))
+                    wood_img = loadImage(wood_path)
+                    icon = pygame.transform.scale(wood_img, (32, 32))
                 else:
                     # Fallback: create a simple wood-colored surface
-                    self.icon = pygame.Surface((32, 32), pygame.SRCALPHA)
-                    pygame.draw.rect(self.icon, (139, 69, 19), (0, 0, 32, 32))
-                    pygame.draw.rect(self.icon, (101, 67, 33), (4, 4, 24, 24))
+                    icon = pygame.Surface((32, 32), pygame.SRCALPHA)
+                    pygame.draw.rect(icon, (139, 69, 19), (0, 0, 32, 32))
+                    pygame.draw.rect(icon, (101, 67, 33), (4, 4, 24, 24))
             except Exception as e:
-                print(f"Error loading wood icon: {e}")
+                assetLog.error("Error loading wood icon: %s", e)
                 # Final fallback
-                self.icon = pygame.Surface((32, 32))
-                self.icon.fill((139, 69, 19))  # Brown
+                icon = pygame.Surface((32, 32))
+                icon.fill((139, 69, 19))  # Brown
+        return icon
 
-        self.hitbox = self.rect.copy().inflate(-self.rect.width * 0.5, -self.rect.height * 0.5) #smaller hitbox
+class Stone(GroundItem):
+    __slots__ = ()
+    pickupKey = 'stone'
 
-class Stone(Generic):
-    def __init__(self, pos, surf, groups):
-        super().__init__(pos, surf, groups, LAYERS['main']) #call parent constructor
-        self.pickup = True
-        self.pickupKey = 'stone' #key for inventory
-        self.itemName = 'stone' #name for inventory
-        
+    @staticmethod
+    def buildIcon(surf):
         # Create icon from the stone image - properly scaled for inventory
-        self.icon = pygame.transform.smoothscale(surf, (32, 32))
+        icon = pygame.transform.smoothscale(surf, (32, 32))
         
         # If scaling didn't work properly, create a fresh load
-        if self.icon.get_size() == (0, 0) or surf.get_size()[0] > 50:  #arbitrary large width check
+        if icon.get_size() == (0, 0) or surf.get_size()[0] > 50:  #arbitrary large width check
             try:
                 # Try to load the stone image directly
                 stonePath = os.path.join("graphics", "items", "stone.png")
                 if os.path.exists(stonePath):
-                    stoneImg = pygame.image.load(stonePath).convert_alpha()
-                    self.icon = pygame.transform.scale(stoneImg, (32, 32))
+                    stoneImg = loadImage(stonePath)
+                    icon = pygame.transform.scale(stoneImg, (32, 32))
                 else:
                     # Fallback: create a simple stone-colored surface
-                    self.icon = pygame.Surface((32, 32), pygame.SRCALPHA)
-                    pygame.draw.ellipse(self.icon, (128, 128, 128), (0, 0, 32, 32))
-                    pygame.draw.ellipse(self.icon, (100, 100, 100), (4, 4, 24, 24))
+                    icon = pygame.Surface((32, 32), pygame.SRCALPHA)
+                    pygame.draw.ellipse(icon, (128, 128, 128), (0, 0, 32, 32))
+                    pygame.draw.ellipse(icon, (100, 100, 100), (4, 4, 24, 24))
             except Exception as e:
-                print(f"Error loading stone icon: {e}")
+                assetLog.error("Error loading stone icon: %s", e)
                 # Final fallback
-                self.icon = pygame.Surface((32, 32))
-                self.icon.fill((128, 128, 128))  # Gray
-        
-        self.hitbox = self.rect.copy().inflate(-self.rect.width * 0.5, -self.rect.height * 0.5) #smaller hitbox
\ No newline at end of file
+                icon = pygame.Surface((32, 32))
+                icon.fill((128, 128, 128))  # Gray
+        return icon
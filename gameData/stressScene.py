@@ -0,0 +1,96 @@
+#stress scenes: bigger maps and crowded levels for the scaling benchmarks (python benchmarks.py scaling)
+#maps are myfarm.tmx repeated, so the tiles, fences, trees and rocks are the real ones, just more of them
+import random
+import pygame
+from pytmx import TiledMap, TiledObjectGroup
+from settings import TILE_SIZE, LAYERS, GROW_SPEED
+from sprites import Crop, Rock, SoilTile, Tree
+from loader import tmxImageLoader
+
+SCENE_MIX = { #share of a total entity count each kind gets, crops stand on their own soil tiles
+    'soil': 0.25,
+    'crops': 0.25,
+    'trees': 0.15,
+    'rocks': 0.1,
+    'items': 0.15,
+    'particles': 0.1
+}
+PARTICLE_LIFE = 3600000 #milliseconds, stress particles outlive any benchmark run
+
+def tiledMap(repeatX=1, repeatY=1, path='graphics/world/myfarm.tmx'): #the map repeated repeatX by repeatY times, as one TiledMap
+    tmxData = TiledMap(path, image_loader=tmxImageLoader)
+    if repeatX == 1 and repeatY == 1:
+        return tmxData
+    width = tmxData.width * tmxData.tilewidth #one copy in pixels, objects are offset by this
+    height = tmxData.height * tmxData.tileheight
+    for layer in tmxData.layers:
+        if isinstance(layer, TiledObjectGroup):
+            originals = list(layer)
+            for copyY in range(repeatY):
+                for copyX in range(repeatX):
+                    if copyX == 0 and copyY == 0:
+                        continue
+                    for obj in originals:
+                        moved = object.__new__(type(obj)) #copy.copy trips over pytmx's __getattr__ before properties exist
+                        moved.__dict__.update(obj.__dict__)
+                        moved.x += copyX * width
+                        moved.y += copyY * height
+                        layer.append(moved)
+        elif hasattr(layer, 'data'):
+            layer.data = [list(row) * repeatX for _ in range(repeatY) for row in layer.data] #fresh rows, layers can be edited
+            layer.width *= repeatX
+            layer.height *= repeatY
+    tmxData.width *= repeatX
+    tmxData.height *= repeatY
+    return tmxData
+
+def mixedCounts(total, mix=SCENE_MIX): #{'soil': n, 'crops': n, ...} adding up to total
+    counts = {kind: int(total * share) for kind, share in mix.items()}
+    counts[max(mix, key=mix.get)] += total - sum(counts.values()) #rounding leftovers
+    return counts
+
+def populate(level, soil=0, crops=0, trees=0, rocks=0, items=0, particles=0, area=None, seed=0):
+    #adds entities to a built level on random tiles of area (the whole map by default), returns how many of each were added
+    rng = random.Random(seed) #same scene for the same arguments
+    area = area or level.mapRect
+    columns = max(1, area.width // TILE_SIZE)
+    rows = max(1, area.height // TILE_SIZE)
+
+    def tiles(count): #top-lefts of random tiles, distinct while the area has enough of them
+        if count <= columns * rows:
+            cells = rng.sample(range(columns * rows), count)
+        else:
+            cells = [rng.randrange(columns * rows) for _ in range(count)]
+        return [(area.x + (cell % columns) * TILE_SIZE, area.y + (cell // columns) * TILE_SIZE) for cell in cells]
+
+    # tilled soil, crops take the first tiles at random growth stages
+    soilTiles = tiles(max(soil, crops))
+    for pos in soilTiles:
+        SoilTile(pos, [level.allSprites, level.soilTiles, level.world], level.untiledSoil, level.tilledSoilImage).till()
+    cropNames = sorted(GROW_SPEED)
+    for pos in soilTiles[:crops]:
+        crop = Crop(pos, rng.choice(cropNames), [level.allSprites, level.crops, level.world])
+        crop.elapsedTime = rng.uniform(0, crop.growthTime) #update(0) moves it to the matching stage
+        crop.update(0)
+
+    # trees and rocks reuse the map's own images
+    treeImages = [tree.image for tree in level.trees] or [pygame.Surface((TILE_SIZE * 2, TILE_SIZE * 3), pygame.SRCALPHA)]
+    for pos in tiles(trees):
+        level.addTree(pos, rng.choice(treeImages))
+    rockImages = [rock.image for rock in level.rocks] or [pygame.Surface((TILE_SIZE, TILE_SIZE), pygame.SRCALPHA)]
+    for pos in tiles(rocks):
+        Rock(pos, rng.choice(rockImages), [level.allSprites, level.collisionSprites, level.rocks, level.world])
+
+    # ground items straight from the pools, dropItem would merge them into GROUND_ITEM_LIMIT stacks
+    for pos in tiles(items):
+        itemKey = rng.choice(('wood', 'stone'))
+        surf = level.woodSurf if itemKey == 'wood' else level.stoneSurf
+        level.itemPools[itemKey].acquire(pos, surf, [level.allSprites, level.itemsGroup, level.world], rng.randint(1, 5))
+
+    # leaf particles, slow and long lived so the count holds for the whole run
+    leafImages = Tree.leafImages or [pygame.Surface((8, 8), pygame.SRCALPHA)]
+    for x, y in tiles(particles):
+        level.particlePool.acquire((x + TILE_SIZE // 2, y + TILE_SIZE // 2), rng.choice(leafImages), [level.particles, level.allSprites, level.world],
+                                   (rng.uniform(-5, 5), rng.uniform(-5, 0)), duration=PARTICLE_LIFE, z=LAYERS['abovePlayer'])
+
+    return {'soil': len(soilTiles), 'crops': min(crops, len(soilTiles)), 'trees': trees, 'rocks': rocks, 'items': items, 'particles': particles}
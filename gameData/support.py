@@ -1,18 +1,32 @@
 import pygame
 from os import walk #walk through different folders
-import os
+from settings import ZOOM_X, ZOOM_Y
+from atlas import defaultAtlas
+from loader import defaultLoader
 
-print("Current working directory:", os.getcwd()) #debug
+def loadImage(path): #packed images come from the atlas, anything else from the asset loader's cache
+    image = defaultAtlas.getImage(path)
+    if image is None:
+        image = defaultLoader.get(path)
+    return image
 
 def importFolder(path): #import all the images from a folder
+    packed = defaultAtlas.getFolder(path)
+    if packed:
+        return packed #subsurfaces of one shared sheet, no file opens
+
     surface_list = [] #list of surfaces
 
     for _, _, image_files in walk(path): #walk through the folder
         for image in sorted(image_files): #for each image in the folder
             if image.lower().endswith(('.png', '.jpg', '.jpeg')): #check if the image is a png or jpg
                 fullPath = path + "/"  +image
-                print('Loading:', fullPath) #testing purposes
-                imageSurf = pygame.image.load(fullPath).convert_alpha() #load the image and convert it to a surface
+                imageSurf = defaultLoader.get(fullPath) #decoded and converted once, shared by every caller
                 surface_list.append(imageSurf) #append the image to the list
 
-    return surface_list #return the list of surfaces
\ No newline at end of file
+    return surface_list #return the list of surfaces
+
+def scaleByZoom(surf): #scale a native-size asset by the zoom factor
+    if ZOOM_X == 1 and ZOOM_Y == 1:
+        return surf #native size, no copy needed - the renderer upscales the whole frame instead
+    return pygame.transform.scale(surf, (int(surf.get_width() * ZOOM_X), int(surf.get_height() * ZOOM_Y)))
@@ -0,0 +1,76 @@
+#frame-time telemetry: one row per rendered frame, the level scheduler's phase timings broken out as columns
+import csv
+import math
+import os
+import time
+from collections import deque
+from settings import TELEMETRY_WINDOW, TELEMETRY_PERCENTILES, PROFILE_DIR
+
+FRAME_COLUMNS = ('frame', 'interval', 'display', 'ticks') #work time, time since the last frame, display.update, sim ticks run
+
+def percentile(ordered, p): #nearest rank on an already sorted list
+    if not ordered:
+        return 0.0
+    rank = max(1, math.ceil(p / 100 * len(ordered)))
+    return ordered[min(rank, len(ordered)) - 1]
+
+class FrameTelemetry:
+    def __init__(self, scheduler, window=TELEMETRY_WINDOW, percentiles=TELEMETRY_PERCENTILES):
+        self.scheduler = scheduler
+        self.phaseKeys = scheduler.keys() #'simulation', 'render.world', ... in run order
+        self.columns = FRAME_COLUMNS + tuple(self.phaseKeys)
+        self.rows = deque(maxlen=window) #(frame number, seconds since start, value per column), milliseconds except ticks
+        self.percentiles = percentiles
+        self.frames = 0
+        self.startTime = time.perf_counter()
+
+    def endFrame(self, frameStart, interval, displayTime, ticks): #call once the frame is on screen, times in seconds
+        now = time.perf_counter()
+        frameTimes = self.scheduler.takeFrameTimes()
+        values = [(now - frameStart) * 1000, interval * 1000, displayTime * 1000, ticks]
+        values.extend(frameTimes.get(key, 0.0) * 1000 for key in self.phaseKeys)
+        self.rows.append((self.frames, now - self.startTime, values))
+        self.frames += 1
+
+    def column(self, name): #every value of one column still in the window
+        index = self.columns.index(name)
+        return [values[index] for _, _, values in self.rows]
+
+    def summary(self, names=None): #column -> {'mean': ms, 'p50': ms, ...} over the window, sorted once per column
+        summary = {}
+        for name in names or self.columns:
+            ordered = sorted(self.column(name))
+            stats = {'mean': sum(ordered) / len(ordered) if ordered else 0.0, 'max': ordered[-1] if ordered else 0.0}
+            for p in self.percentiles:
+                stats[f"p{p}"] = percentile(ordered, p)
+            summary[name] = stats
+        return summary
+
+    def report(self, names=('frame', 'simulation', 'render', 'render.world', 'render.overlay', 'render.clock', 'render.inventory', 'render.shop')):
+        summary = self.summary([name for name in names if name in self.columns])
+        statNames = ['mean'] + [f"p{p}" for p in self.percentiles] + ['max']
+        lines = [f"{len(self.rows)} frames  " + ''.join(f"{stat:>9}" for stat in statNames)]
+        for name, stats in summary.items():
+            lines.append(f"{name:<18}" + ''.join(f"{stats[stat]:9.3f}" for stat in statNames))
+        return "\n".join(lines)
+
+    def exportCsv(self, directory=PROFILE_DIR, tag=''): #raw frames and a percentile summary, returns both paths
+        os.makedirs(directory, exist_ok=True)
+        stem = os.path.join(directory, f"telemetry{'-' + tag if tag else ''}-{time.strftime('%Y%m%d-%H%M%S')}")
+
+        framesPath = f"{stem}.csv"
+        with open(framesPath, 'w', newline='') as f:
+            writer = csv.writer(f)
+            writer.writerow(('frameNumber', 'seconds') + self.columns)
+            for frameNumber, seconds, values in self.rows:
+                writer.writerow([frameNumber, f"{seconds:.4f}"] + [f"{value:.4f}" for value in values])
+
+        summaryPath = f"{stem}-summary.csv"
+        summary = self.summary()
+        statNames = ['mean'] + [f"p{p}" for p in self.percentiles] + ['max']
+        with open(summaryPath, 'w', newline='') as f:
+            writer = csv.writer(f)
+            writer.writerow(['column', 'frames'] + statNames)
+            for name, stats in summary.items():
+                writer.writerow([name, len(self.rows)] + [f"{stats[stat]:.4f}" for stat in statNames])
+        return framesPath, summaryPath
@@ -21,6 +21,9 @@ class Time:
         
         # Auto-save tracking
         self.autoSaveCooldown = False
+
+        # Called with the new day number whenever a day starts, e.g. memory snapshots
+        self.dayListeners = []
         
     @property
     def hour(self):
@@ -31,8 +34,8 @@ class Time:
         return int(self.currentTime % TIME_RATE)  # Convert to integer
     
     def update(self, dt):
-        # Update game time
-        self.currentTime += dt / 1000 * TIME_RATE
+        # Update game time (dt is in real seconds)
+        self.currentTime += dt * GAME_MINUTES_PER_SECOND
         
         # Check for auto-save at 7:00 AM (7 * TIME_RATE)
         if self.hour == 7 and self.minute == 0 and not self.autoSaveCooldown:
@@ -61,6 +64,12 @@ class Time:
             if self.dayCount % 28 == 0:
                 self.seasonIndex = (self.seasonIndex + 1) % len(self.seasons)
                 self.season = self.seasons[self.seasonIndex]
+
+            self.startDay()
+
+    def startDay(self):
+        for listener in self.dayListeners:
+            listener(self.dayCount)
     
     def getTimeColor(self):
         hour = self.hour
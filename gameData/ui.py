@@ -0,0 +1,133 @@
+import pygame
+from settings import SCREEN_WIDTH, SCREEN_HEIGHT, MENU_IDLE_WAIT
+
+class Button:
+    def __init__(self, text, font, centre, defaultColor, highlightColor, value=None, textColor=(255, 255, 255)):
+        self.value = text if value is None else value #what the menu returns when clicked
+        textSurf = font.render(text, True, textColor) #rendered once, not every frame
+        textRect = textSurf.get_rect(center=centre)
+        self.rect = textRect.inflate(20, 10) #hit rect is the drawn background
+        self.hovered = False
+
+        # both states are baked up front so hovering is a single blit
+        self.surfaces = {
+            False: self.bakeSurface(textSurf, defaultColor),
+            True: self.bakeSurface(textSurf, highlightColor)
+        }
+
+    def bakeSurface(self, textSurf, color):
+        surf = pygame.Surface(self.rect.size)
+        surf.fill(color)
+        surf.blit(textSurf, textSurf.get_rect(center=(self.rect.width // 2, self.rect.height // 2)))
+        return surf
+
+    def setHovered(self, mousePos): #returns True if the hover state changed
+        hovered = self.rect.collidepoint(mousePos)
+        if hovered == self.hovered:
+            return False
+        self.hovered = hovered
+        return True
+
+    def draw(self, surface):
+        surface.blit(self.surfaces[self.hovered], self.rect)
+        return self.rect
+
+class MenuScreen:
+    def __init__(self, background, escapeValue=None):
+        self.background = background
+        self.escapeValue = escapeValue #returned when escape is pressed
+        self.labels = [] #static (surface, rect) pairs
+        self.buttons = []
+
+    def addTitle(self, text, font, y, color=(255, 255, 255)):
+        surf = font.render(text, True, color)
+        self.labels.append((surf, surf.get_rect(midtop=(SCREEN_WIDTH // 2, y))))
+
+    def addLabel(self, text, font, centre, color=(255, 255, 255)):
+        surf = font.render(text, True, color)
+        self.labels.append((surf, surf.get_rect(center=centre)))
+
+    def addButton(self, button):
+        self.buttons.append(button)
+        return button
+
+    def buttonAt(self, pos):
+        for button in self.buttons:
+            if button.rect.collidepoint(pos):
+                return button
+        return None
+
+    def drawAll(self, surface):
+        surface.blit(self.background, (0, 0))
+        for surf, rect in self.labels:
+            surface.blit(surf, rect)
+        for button in self.buttons:
+            button.draw(surface)
+        pygame.display.update()
+
+    def updateHover(self, surface, mousePos):
+        dirty = [button.draw(surface) for button in self.buttons if button.setHovered(mousePos)]
+        if dirty:
+            pygame.display.update(dirty) #only push the buttons that changed
+
+    def run(self, surface, idle=None): #idle(surface) is called between events until it returns False, e.g. to stream assets in
+        for button in self.buttons:
+            button.setHovered(pygame.mouse.get_pos())
+        self.drawAll(surface)
+
+        while True:
+            if idle is not None and not idle(surface):
+                idle = None
+            event = pygame.event.wait(MENU_IDLE_WAIT if idle else 0) #sleep until something happens instead of spinning, 0 waits forever
+            if event.type == pygame.QUIT:
+                return 'quit'
+            elif event.type == pygame.KEYDOWN:
+                if event.key == pygame.K_ESCAPE:
+                    return self.escapeValue
+            elif event.type == pygame.MOUSEMOTION:
+                self.updateHover(surface, event.pos)
+            elif event.type == pygame.MOUSEBUTTONDOWN and event.button == 1:
+                button = self.buttonAt(event.pos)
+                if button:
+                    return button.value
+            elif event.type in (pygame.VIDEOEXPOSE, pygame.WINDOWEXPOSED):
+                self.drawAll(surface)
+
+class LoadingScreen: #progress bar over the menu background, as a full screen or a strip under a menu
+    def __init__(self, background, font, barSize=(SCREEN_WIDTH // 2, 16), color=(100, 149, 245)):
+        self.background = background
+        self.font = font
+        self.color = color
+        self.barRect = pygame.Rect((0, 0), barSize)
+        self.barRect.midbottom = (SCREEN_WIDTH // 2, SCREEN_HEIGHT - 40)
+        self.areaRect = self.barRect.inflate(8, 8) #what drawBar repaints, border included
+
+    def drawBar(self, surface, progress): #repaints only the bar, returns the rect to update
+        surface.blit(self.background, self.areaRect, self.areaRect)
+        pygame.draw.rect(surface, (40, 40, 40), self.barRect)
+        filled = self.barRect.copy()
+        filled.width = int(self.barRect.width * max(0.0, min(progress, 1.0)))
+        pygame.draw.rect(surface, self.color, filled)
+        pygame.draw.rect(surface, (255, 255, 255), self.barRect, 2)
+        return self.areaRect
+
+    def clearBar(self, surface): #put the background back once loading has finished
+        surface.blit(self.background, self.areaRect, self.areaRect)
+        return self.areaRect
+
+    def draw(self, surface, progress, text):
+        surface.blit(self.background, (0, 0))
+        textSurf = self.font.render(text, True, (255, 255, 255))
+        surface.blit(textSurf, textSurf.get_rect(midbottom=(SCREEN_WIDTH // 2, self.areaRect.top - 10)))
+        self.drawBar(surface, progress)
+        pygame.display.update()
+
+    def run(self, surface, loader, budget, text="Loading"): #blocks until the loader has finished, False if the window was closed
+        while not loader.done():
+            for event in pygame.event.get():
+                if event.type == pygame.QUIT:
+                    return False
+            loader.poll(budget)
+            self.draw(surface, loader.progress(), text)
+            pygame.time.wait(MENU_IDLE_WAIT)
+        return True